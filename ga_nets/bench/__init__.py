@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 09/06/2020 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Benchmark della costruzione dei layers.
+
+Confronta 'ga_nets.topology' con 'ga_nets.layer' su topologie casuali
+crescenti, fino a 10k neuroni e 100k sinapsi. La vecchia implementazione
+viene eseguita solo sulle topologie piccole, altrimenti non terminerebbe in
+tempi ragionevoli.
+
+Utilizzo:
+  python -m ga_nets.bench.layers
+"""
+import argparse
+import random
+from timeit import default_timer
+
+import ga_nets.layer as Layer
+import ga_nets.topology as Topology
+
+# Topologie (neuroni, sinapsi) utilizzate se non specificate
+SIZES = ((50, 250), (200, 1000), (1000, 10000), (10000, 100000))
+
+
+def random_conns(num_inputs, num_hiddens, num_outputs, num_conns, seed=0):
+    """Genera una topologia aciclica casuale.
+
+    Args:
+      num_inputs: Numero di neuroni di input.
+      num_hiddens: Numero di neuroni hidden.
+      num_outputs: Numero di neuroni di output.
+      num_conns: Numero di sinapsi (le coppie ripetute vengono scartate).
+      seed: Seme del generatore casuale.
+
+    Returns:
+      Una tupla con le liste delle chiavi di inputs, hiddens, outputs e la
+      lista delle connessioni nel formato di 'Network.get_synapses()'.
+    """
+    rnd = random.Random(seed)
+
+    inputs = list(range(num_inputs))
+    outputs = list(range(num_inputs, num_inputs + num_outputs))
+    hiddens = list(range(num_inputs + num_outputs,
+                         num_inputs + num_outputs + num_hiddens))
+
+    # L'ordine topologico casuale: input, hidden mescolati, output
+    order = inputs + rnd.sample(hiddens, len(hiddens)) + outputs
+
+    pairs = set()
+    for _ in range(num_conns):
+        src = rnd.randrange(len(order) - num_outputs)
+        dst = rnd.randrange(max(src + 1, num_inputs), len(order))
+        pairs.add((order[src], order[dst]))
+
+    conns = [(src, dst, rnd.uniform(-1, 1)) for src, dst in pairs]
+    rnd.shuffle(conns)
+
+    return inputs, hiddens, outputs, conns
+
+
+def legacy_layers(inputs, hiddens, outputs, conns):
+    """Layers calcolati con 'ga_nets.layer'"""
+    links = Layer.get_links(inputs, hiddens, outputs, conns)
+    return Layer.get_layers(inputs, hiddens, outputs, conns, links)
+
+
+def timed(function, *args):
+    """Esegue una funzione misurandone il tempo.
+
+    Returns:
+      Una tupla con il risultato e i secondi impiegati.
+    """
+    start = default_timer()
+    result = function(*args)
+    return result, default_timer() - start
+
+
+def main():
+    """Esegue il benchmark e stampa i risultati"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--legacy-limit", type=int, default=1000,
+                        help="neuroni massimi per eseguire 'ga_nets.layer'")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("{:>8} {:>8} {:>8} {:>12} {:>12}".format(
+        "neurons", "synapses", "layers", "topology", "layer"))
+
+    for neurons, synapses in SIZES:
+        num_io = max(2, neurons // 100)
+        topology = random_conns(num_io, neurons - 2 * num_io, num_io,
+                                synapses, args.seed)
+
+        layers, elapsed = timed(Topology.get_layers, *topology)
+
+        legacy = "-"
+        if neurons <= args.legacy_limit:
+            expected, legacy_elapsed = timed(legacy_layers, *topology)
+            assert expected == layers, "Layers differ from 'ga_nets.layer'."
+            legacy = "{:.4f}s".format(legacy_elapsed)
+
+        print("{:>8} {:>8} {:>8} {:>11.4f}s {:>12}".format(
+            neurons, len(topology[3]), len(layers), elapsed, legacy))
+
+
+if __name__ == "__main__":
+    main()
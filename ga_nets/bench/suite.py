@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Benchmark delle operazioni principali sulle reti neurali.
+
+Misura, su reti casuali riproducibili, 'get_layers()', 'activate()' (una
+riga alla volta e in batch), 'add_synapse()', 'sub_neuron()' e 'clone()'.
+I risultati possono essere salvati in un file JSON e confrontati con una
+baseline precedente per segnalare le regressioni.
+
+Utilizzo:
+  python -m ga_nets.bench.suite --save baseline.json
+  python -m ga_nets.bench.suite --compare baseline.json --tolerance .2
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+from timeit import default_timer
+
+from ga_nets.bench.topologies import random_network, random_synapses
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.nets.rnn import Recurrent
+
+# Configurazioni delle reti: nome -> parametri di 'random_network()'
+CASES = {
+    "ffw-small": dict(network_class=FeedForward, num_inputs=8,
+                      num_hiddens=50, num_outputs=2, density=.1, depth=3),
+    "ffw-large": dict(network_class=FeedForward, num_inputs=32,
+                      num_hiddens=1000, num_outputs=8, density=.01, depth=6),
+    "rnn-small": dict(network_class=Recurrent, num_inputs=8,
+                      num_hiddens=50, num_outputs=2, density=.1,
+                      gate_density=.02, depth=3),
+    "rnn-large": dict(network_class=Recurrent, num_inputs=32,
+                      num_hiddens=500, num_outputs=8, density=.02,
+                      gate_density=.001, depth=6),
+}
+
+
+def measure(function, repeat=5, setup=None):
+    """Misura il tempo minimo di una funzione su più ripetizioni.
+
+    Args:
+      function: La funzione da misurare, riceve il risultato di 'setup'.
+      repeat: Numero di ripetizioni.
+      setup: Funzione opzionale eseguita (fuori dalla misura) prima di ogni
+             ripetizione.
+
+    Returns:
+      I secondi della ripetizione più veloce.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start = default_timer()
+        function(arg)
+        best = min(best, default_timer() - start)
+
+    return best
+
+
+def run_case(params, rows=100, edits=20, repeat=5, seed=0):
+    """Esegue i benchmark su una rete.
+
+    Args:
+      params: Parametri di 'random_network()'.
+      rows: Righe (o passi) delle features per 'activate()'.
+      edits: Numero di sinapsi aggiunte e di neuroni rimossi.
+      repeat: Numero di ripetizioni di ogni misura.
+      seed: Seme del generatore casuale.
+
+    Returns:
+      Un dizionario nome della misura -> secondi.
+    """
+    network = random_network(seed=seed, **params)
+    rnd = random.Random(seed)
+    features = [[rnd.uniform(-1, 1) for _ in range(params["num_inputs"])]
+                for _ in range(rows)]
+
+    synapses = random_synapses(network, edits, seed)
+    hiddens = network.layers[1:-1]
+    victims = rnd.sample([key for layer in hiddens for key in layer],
+                         min(edits, sum(map(len, hiddens))))
+
+    def add_synapses(clone):
+        for src, dst in synapses:
+            clone.add_synapse(clone.neurons[src], clone.neurons[dst], .5)
+
+    def sub_neurons(clone):
+        for key in victims:
+            clone.sub_neuron(clone.neurons[key])
+
+    def activate_rows(_):
+        for feature in features:
+            network.activate([feature])
+
+    return {
+        "get_layers": measure(lambda _: network.get_layers(), repeat),
+        "activate_row": measure(activate_rows, repeat) / rows,
+        "activate_batch": measure(lambda _: network.activate(features),
+                                  repeat),
+        "add_synapse": measure(add_synapses, repeat, network.clone) / edits,
+        "sub_neuron": measure(sub_neurons, repeat, network.clone) / edits,
+        "clone": measure(lambda _: network.clone(), repeat),
+        "clone_shared": measure(lambda _: network.clone(True), repeat),
+    }
+
+
+def run(cases=None, **kwargs):
+    """Esegue i benchmark.
+
+    Args:
+      cases: Lista con i nomi delle configurazioni, di default tutte.
+      kwargs: Please see: @ga_nets.bench.suite.run_case()
+
+    Returns:
+      Il dizionario dei risultati, salvabile in JSON.
+    """
+    results = {}
+    for name in cases or CASES:
+        for metric, elapsed in run_case(CASES[name], **kwargs).items():
+            results["{}/{}".format(name, metric)] = elapsed
+
+    return {"python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results}
+
+
+def compare(current, baseline, tolerance=.2):
+    """Confronta i risultati con una baseline.
+
+    Args:
+      current: Risultati di 'run()'.
+      baseline: Risultati salvati in precedenza.
+      tolerance: Rallentamento relativo tollerato (es. 0.2 = 20%).
+
+    Returns:
+      Una lista di tuple (misura, secondi della baseline, secondi attuali,
+      rapporto, regressione) per le misure presenti in entrambi.
+    """
+    rows = []
+    for metric, elapsed in sorted(current["results"].items()):
+        if metric not in baseline["results"]:
+            continue
+
+        before = baseline["results"][metric]
+        ratio = elapsed / before if before else float("inf")
+        rows.append((metric, before, elapsed, ratio, ratio > 1 + tolerance))
+
+    return rows
+
+
+def main():
+    """Esegue i benchmark e stampa i risultati"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--cases", nargs="*", choices=sorted(CASES))
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="file JSON nel quale salvare i "
+                                       "risultati")
+    parser.add_argument("--compare", help="file JSON della baseline")
+    parser.add_argument("--tolerance", type=float, default=.2,
+                        help="rallentamento tollerato (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    current = run(args.cases, rows=args.rows, edits=args.edits,
+                  repeat=args.repeat, seed=args.seed)
+
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump(current, handle, indent=2, sort_keys=True)
+
+    if not args.compare:
+        for metric, elapsed in sorted(current["results"].items()):
+            print("{:<28} {:>12.6f}s".format(metric, elapsed))
+        return 0
+
+    with open(args.compare) as handle:
+        baseline = json.load(handle)
+
+    regressions = 0
+    for metric, before, elapsed, ratio, slower in compare(current, baseline,
+                                                          args.tolerance):
+        regressions += slower
+        print("{:<28} {:>12.6f}s {:>12.6f}s {:>7.2f}x{}".format(
+            metric, before, elapsed, ratio, "  REGRESSION" if slower else ""))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
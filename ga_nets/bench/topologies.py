@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Generatori di reti neurali casuali e riproducibili per i benchmark"""
+import random
+
+from ga_nets.nets.rnn import Recurrent
+from ga_nets.neuron import NeuronType
+
+
+def get_bands(num_inputs, num_hiddens, num_outputs, depth, rnd):
+    """Divide i neuroni in fasce: gli input, 'depth' fasce di hidden e gli
+    output. Le sinapsi vanno sempre da una fascia a una successiva.
+
+    Returns:
+      Una lista di liste con le chiavi dei neuroni di ogni fascia.
+    """
+    hiddens = list(range(num_inputs + num_outputs,
+                         num_inputs + num_outputs + num_hiddens))
+    rnd.shuffle(hiddens)
+
+    depth = max(1, min(depth, num_hiddens)) if num_hiddens else 0
+    bands = [list(range(num_inputs))]
+    bands += [hiddens[i::depth] for i in range(depth)]
+    bands.append(list(range(num_inputs, num_inputs + num_outputs)))
+
+    return bands
+
+
+def sample_pairs(sources, targets, count, rnd, valid=None):
+    """Estrae coppie distinte (sorgente, destinazione) senza enumerarle.
+
+    Args:
+      sources: Lista dei neuroni di partenza.
+      targets: Lista dei neuroni d'arrivo.
+      count: Numero di coppie desiderate.
+      rnd: Istanza di 'random.Random'.
+      valid: Funzione opzionale che indica se una coppia è accettabile.
+
+    Returns:
+      Un set di coppie (al più 'count', meno se i tentativi si esauriscono).
+    """
+    pairs = set()
+    attempts = 0
+    while len(pairs) < count and attempts < 20 * count:
+        attempts += 1
+        pair = (rnd.choice(sources), rnd.choice(targets))
+        if valid is None or valid(*pair):
+            pairs.add(pair)
+
+    return pairs
+
+
+def random_network(network_class, num_inputs, num_hiddens, num_outputs,
+                   density=.1, gate_density=0., depth=3, seed=0,
+                   functions=(("tanh", "sum"),)):
+    """Genera una rete neurale casuale.
+
+    Args:
+      network_class: Classe della rete neurale (FeedForward o Recurrent).
+      num_inputs: Numero di neuroni di input.
+      num_hiddens: Numero di neuroni hidden.
+      num_outputs: Numero di neuroni di output.
+      density: Frazione delle sinapsi possibili fra le fasce (ogni fascia
+               verso tutte le successive) effettivamente create.
+      gate_density: Frazione dei gates possibili fra neuroni non di input,
+                    utilizzata solo dai recurrent network.
+      depth: Numero di fasce di neuroni hidden.
+      seed: Seme del generatore casuale.
+      functions: Coppie (attivazione, aggregazione) del registro
+                 'ga_nets.functions' fra le quali scegliere per ogni neurone.
+
+    Returns:
+      L'istanza della rete neurale.
+    """
+    rnd = random.Random(seed)
+    bands = get_bands(num_inputs, num_hiddens, num_outputs, depth, rnd)
+    band_of = {key: i for i, band in enumerate(bands) for key in band}
+
+    network = network_class({})
+    neurons = {}
+    for i, band in enumerate(bands):
+        neuron_type = (NeuronType.INPUT if i == 0
+                       else NeuronType.OUTPUT if i == len(bands) - 1
+                       else NeuronType.HIDDEN)
+        for key in sorted(band):
+            squash, aggregation = rnd.choice(functions)
+            neurons[key] = network.add_neuron(key=key,
+                                              neuron_type=neuron_type,
+                                              bias=rnd.uniform(-1, 1),
+                                              squash=squash,
+                                              aggregation=aggregation)
+
+    sources = [key for band in bands[:-1] for key in band]
+    targets = [key for band in bands[1:] for key in band]
+    possible = sum(len(band) * sum(map(len, bands[i + 1:]))
+                   for i, band in enumerate(bands))
+    pairs = sample_pairs(sources, targets, int(possible * density), rnd,
+                         lambda src, dst: band_of[src] < band_of[dst])
+    for src, dst in sorted(pairs):
+        network.add_synapse(neurons[src], neurons[dst], rnd.uniform(-1, 1))
+
+    if issubclass(network_class, Recurrent) and gate_density:
+        count = int(len(targets) ** 2 * gate_density)
+        for src, dst in sorted(sample_pairs(targets, targets, count, rnd)):
+            network.add_gate(neurons[src], neurons[dst], rnd.uniform(-1, 1))
+
+    return network
+
+
+def random_synapses(network, count, seed=0):
+    """Sceglie nuove sinapsi valide per la rete (da input o hidden verso
+    hidden o output, senza creare cicli né duplicati).
+
+    Args:
+      network: Istanza della rete neurale.
+      count: Numero di sinapsi desiderate.
+      seed: Seme del generatore casuale.
+
+    Returns:
+      Una lista di tuple (chiave di partenza, chiave d'arrivo).
+    """
+    rnd = random.Random(seed)
+    depths = network.depths
+    order = {key: depth for key, depth in depths.items() if depth is not None}
+    order.update({key: float("inf") for key in network.layers[-1]})
+
+    sources = [key for key, depth in order.items() if depth != float("inf")]
+    targets = [key for key, depth in order.items() if depth]
+    neurons = network.neurons
+
+    def valid(src, dst):
+        return (order[src] < order[dst]
+                and not neurons[src].is_projecting_to(neurons[dst]))
+
+    return sorted(sample_pairs(sources, targets, count, rnd, valid))
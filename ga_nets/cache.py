@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Cache dei valori di fitness.
+
+Elite, cloni e figli con mutazioni nulle vengono riconosciuti tramite un hash
+del contenuto del genoma (struttura, bias, funzioni e pesi delle connessioni
+attive) e, insieme all'impronta del dataset, identificano un valore di fitness
+già calcolato. La funzione di fitness deve quindi essere deterministica.
+
+Le connessioni disattivate non cambiano gli output e non entrano nell'hash.
+Le funzioni entrano tramite gli id e la tabella del genoma: due genomi uguali
+con le tabelle in ordine diverso producono hash diversi (una valutazione in
+più, mai un valore errato).
+"""
+import hashlib
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from ga_nets.functions import get_name
+from ga_nets.genome import Genome
+
+# Valore restituito da 'FitnessCache.get()' per le chiavi assenti
+MISSING = object()
+
+
+def get_hash(item):
+    """Hash del contenuto di un genoma o di una rete neurale.
+
+    Args:
+      item: Istanza di 'ga_nets.genome.Genome' o della rete neurale.
+
+    Returns:
+      Il digest esadecimale (128 bit).
+    """
+    genome = item if isinstance(item, Genome) else item.snapshot()
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(genome.network_class.__name__.encode())
+    # Le funzioni non registrate vengono distinte tramite 'repr()', che
+    # contiene l'indirizzo dell'oggetto
+    digest.update(",".join(get_name(fn) or repr(fn)
+                           for fn in genome.functions).encode())
+    for array in (genome.keys, genome.types, genome.biases, genome.squash,
+                  genome.aggregation):
+        digest.update(array.tobytes())
+
+    for table in (genome.synapses, genome.gates):
+        enabled = table.enabled
+        digest.update(np.int64(enabled.sum()).tobytes())
+        for array in (table.from_keys, table.to_keys, table.weights):
+            digest.update(array[enabled].tobytes())
+
+    return digest.hexdigest()
+
+
+def get_fingerprint(dataset):
+    """Impronta di un dataset.
+
+    Args:
+      dataset: Dati numerici (matrici, liste di righe) o qualsiasi oggetto
+               serializzabile con pickle.
+
+    Returns:
+      Il digest esadecimale (128 bit).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        array = np.asarray(dataset, dtype=float)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    except (TypeError, ValueError):
+        digest.update(pickle.dumps(dataset))
+
+    return digest.hexdigest()
+
+
+class FitnessCache():
+    """Cache LRU dei valori di fitness con statistiche di utilizzo"""
+    def __init__(self, max_size=10000):
+        """Inizializza la cache.
+
+        Args:
+          max_size: Numero massimo di valori salvati, oltre il quale vengono
+                    eliminati quelli utilizzati meno di recente.
+
+        Raises:
+          ValueError: Se la dimensione non è positiva.
+        """
+        if max_size < 1:
+            raise ValueError("The cache's size must be positive.")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__values = OrderedDict()
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __contains__(self, key):
+        return key in self.__values
+
+    @staticmethod
+    def get_key(item, fingerprint):
+        """Chiave di un individuo.
+
+        Args:
+          item: Istanza di 'ga_nets.genome.Genome' o della rete neurale.
+          fingerprint: Impronta del dataset (vedi 'get_fingerprint()').
+
+        Returns:
+          La chiave da utilizzare con 'get()' e 'put()'.
+        """
+        return (get_hash(item), fingerprint)
+
+    def get(self, key):
+        """Restituisce il valore di fitness, aggiornando le statistiche.
+
+        Args:
+          key: Chiave generata da 'get_key()'.
+
+        Returns:
+          Il valore salvato o 'MISSING' se assente.
+        """
+        value = self.__values.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.__values.move_to_end(key)
+
+        return value
+
+    def put(self, key, value):
+        """Salva un valore di fitness, eliminando il meno recente se la
+        cache è piena.
+
+        Args:
+          key: Chiave generata da 'get_key()'.
+          value: Il valore di fitness.
+        """
+        self.__values[key] = value
+        self.__values.move_to_end(key)
+
+        while len(self.__values) > self.max_size:
+            self.__values.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Svuota la cache e azzera le statistiche"""
+        self.__values.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        """Frazione delle richieste trovate nella cache"""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.
+
+    @property
+    def stats(self):
+        """Statistiche della cache.
+
+        Returns:
+          Un dizionario con hits, misses, evictions, size e hit_rate.
+        """
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self),
+                "hit_rate": self.hit_rate}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Piano d'esecuzione compilato per i feedforward network"""
+import numpy as np
+
+from ga_nets.compiled.plan import freeze, get_order, get_stages, \
+    ThreadContexts
+from ga_nets.compiled.prune import prune as prune_layers
+
+
+class FFWPlan():
+    """Trasforma la struttura a oggetti di un feedforward network in matrici
+    dei pesi e vettori dei bias per ogni layer, così da attivare l'intera
+    matrice delle features in un solo passaggio vettorizzato"""
+    def __init__(self, network, prune=True):
+        """Compila la rete neurale.
+
+        Il piano è una fotografia della rete: le modifiche successive alla
+        compilazione non vengono viste e richiedono un nuovo 'compile()'.
+
+        Args:
+          network: Istanza del feedforward network.
+          prune: Se True esclude i neuroni dai quali nessun output dipende,
+                 il resoconto è in 'report' (vedi 'ga_nets.compiled.prune').
+        """
+        layers = network.layers
+        self.report = None
+        if prune:
+            layers, self.report = prune_layers(network, layers, False)
+
+        self.keys, positions = get_order(layers)
+        self.num_inputs = len(layers[0])
+        self.outputs = np.array([positions[key] for key in layers[-1]],
+                                dtype=np.intp)
+        self.stages = get_stages(network, layers, positions, False)
+
+        freeze(self)
+        self.contexts = ThreadContexts(len(self.keys))
+
+    def activate(self, features, context=None):
+        """Attiva la rete neurale su tutte le righe delle features.
+
+        Il piano non viene modificato: può essere attivato
+        contemporaneamente da più thread.
+
+        Args:
+          features: Una matrice bidimensionale con gli input, una riga per
+                    ogni esempio (es. '[[0, 0], [1, 1]]').
+          context: Istanza di 'ga_nets.compiled.plan.Context' con i buffer
+                   da utilizzare, di default quella del thread corrente.
+
+        Returns:
+          Una matrice numpy con i valori di output, una riga per ogni esempio.
+
+        Raises:
+          ValueError: Se la dimensione dell'array degli input è errata.
+        """
+        features = np.asarray(features, dtype=float)
+        if features.ndim != 2 or features.shape[1] != self.num_inputs:
+            raise ValueError("Features' number is wrong.")
+
+        context = context if context is not None else self.contexts.get()
+        values, = context.get_buffers(features.shape[0])
+        values[:, :self.num_inputs] = features
+
+        for kernels in self.stages:
+            for kernel in kernels:
+                kernel(values)
+
+        # Copia, il buffer verrà riutilizzato dalla prossima chiamata
+        return values[:, self.outputs]
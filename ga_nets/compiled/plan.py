@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Strutture comuni ai piani d'esecuzione compilati (feedforward e
+recurrent).
+
+I piani sono immutabili (i loro array sono in sola lettura) e quindi
+condivisibili fra più thread: gli stati di ogni attivazione vivono in un
+'Context', uno per thread se non viene passato esplicitamente.
+"""
+import threading
+
+import numpy as np
+
+from ga_nets.connection import SynapseDirection
+from ga_nets.functions import get_name, get_vector
+
+
+def apply_squash(squash, values):
+    """Applica la funzione d'attivazione a ogni elemento della matrice.
+
+    Se la funzione è registrata in 'ga_nets.functions' viene utilizzata la
+    sua implementazione vettoriale, altrimenti quella scalare elemento per
+    elemento.
+
+    Args:
+      squash: Funzione d'attivazione scalare.
+      values: Matrice numpy con i valori pre-attivazione.
+
+    Returns:
+      Una nuova matrice con i valori attivati.
+    """
+    vector = get_vector(squash)
+    if vector is not None:
+        return np.asarray(vector(values), dtype=float)
+
+    return np.fromiter(map(squash, values.ravel().tolist()),
+                       dtype=float,
+                       count=values.size).reshape(values.shape)
+
+
+def freeze(*items):
+    """Rende in sola lettura gli array degli oggetti passati.
+
+    Args:
+      items: Istanze dei kernel (o di altre strutture del piano) i cui
+             attributi numpy non devono più essere modificati.
+    """
+    for item in items:
+        for value in vars(item).values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+
+class Context():
+    """Stati di un'attivazione: i buffer vengono riutilizzati dalle chiamate
+    successive con lo stesso contesto, quindi un contesto non deve essere
+    condiviso fra thread"""
+    def __init__(self, width):
+        """Inizializza il contesto.
+
+        Args:
+          width: Numero di neuroni del piano (colonne dei buffer).
+        """
+        self.width = width
+        self.__buffers = []
+
+    def get_buffers(self, rows, count=1):
+        """Restituisce dei buffer con almeno 'rows' righe.
+
+        Args:
+          rows: Numero di righe necessarie.
+          count: Numero di buffer distinti.
+
+        Returns:
+          Una lista di 'count' matrici (rows, width) non inizializzate.
+        """
+        if (len(self.__buffers) < count
+                or self.__buffers[0].shape[0] < rows):
+            self.__buffers = [np.empty((rows, self.width))
+                              for _ in range(count)]
+
+        return [buffer[:rows] for buffer in self.__buffers[:count]]
+
+
+class ThreadContexts():
+    """Un contesto per ogni thread che utilizza il piano"""
+    def __init__(self, width):
+        self.width = width
+        self.__local = threading.local()
+
+    def get(self):
+        """Restituisce il contesto del thread corrente"""
+        context = getattr(self.__local, "context", None)
+        if context is None:
+            context = self.__local.context = Context(self.width)
+
+        return context
+
+
+def get_order(layers):
+    """Appiattisce i layers nell'ordine d'attivazione.
+
+    Args:
+      layers: La lista tridimensionale restituita da 'Network.layers'.
+
+    Returns:
+      Una tupla con la lista delle chiavi in ordine d'attivazione e il
+      dizionario che associa a ogni chiave la propria colonna.
+    """
+    keys = [key for layer in layers for key in layer]
+    return keys, {key: i for i, key in enumerate(keys)}
+
+
+def get_fanin(neuron, positions, recurrent):
+    """Connessioni in entrata di un neurone espresse tramite colonne.
+
+    Una sinapsi proveniente da un neurone attivato prima contribuisce con il
+    valore del passo corrente; una proveniente da un neurone attivato dopo
+    (o da se stesso) contribuisce, solo nei recurrent, con il valore del passo
+    precedente. I neuroni fuori dai layers non contribuiscono mai.
+
+    Args:
+      neuron: Istanza del neurone.
+      positions: Dizionario chiave -> colonna generato da 'get_order()'.
+      recurrent: True se la rete è ricorrente.
+
+    Returns:
+      Una lista di tuple '(colonna, peso, ricorrente)'.
+    """
+    col = positions[neuron.key]
+
+    fanin = []
+    for synapse in neuron.synapses[SynapseDirection.IN.value]:
+        src = positions.get(synapse.from_neuron.key)
+        if src is None:
+            continue
+        if src < col:
+            fanin.append((src, synapse.weight, False))
+        elif recurrent:
+            fanin.append((src, synapse.weight, True))
+
+    return fanin
+
+
+class MatmulKernel():
+    """Kernel per un gruppo di neuroni con aggregazione 'sum' (o 'mean') e la
+    stessa funzione d'attivazione: l'aggregazione diventa un prodotto
+    matriciale"""
+    def __init__(self, cols, fanins, biases, squash, mean=False):
+        """Inizializza il kernel.
+
+        Args:
+          cols: Lista con le colonne dei neuroni del gruppo.
+          fanins: Lista con le connessioni in entrata di ogni neurone
+                  (vedi 'get_fanin()').
+          biases: Lista con i bias dei neuroni.
+          squash: Funzione d'attivazione comune al gruppo.
+          mean: True per dividere la somma per il numero di connessioni che
+                contribuiscono al passo (aggregazione 'mean').
+        """
+        self.cols = np.array(cols, dtype=np.intp)
+        self.biases = np.array(biases, dtype=float)
+        self.squash = squash
+        self.mean = mean
+
+        self.src, self.weights = self.__matrix(fanins, False)
+        self.rec, self.rec_weights = self.__matrix(fanins, True)
+
+        # Connessioni che contribuiscono senza e con il passo precedente,
+        # almeno una per evitare la divisione per zero ('mean([0])' è 0)
+        self.counts = np.array([sum(not r for _, _, r in f) for f in fanins])
+        self.rec_counts = np.array([len(f) for f in fanins])
+        np.maximum(self.counts, 1, out=self.counts)
+        np.maximum(self.rec_counts, 1, out=self.rec_counts)
+
+    @staticmethod
+    def __matrix(fanins, recurrent):
+        """Costruisce la matrice densa dei pesi limitata alle sole colonne
+        sorgenti effettivamente utilizzate"""
+        sources = sorted({src
+                          for fanin in fanins
+                          for src, _, rec in fanin
+                          if rec is recurrent})
+        rows = {src: i for i, src in enumerate(sources)}
+
+        weights = np.zeros((len(sources), len(fanins)))
+        for j, fanin in enumerate(fanins):
+            for src, weight, rec in fanin:
+                if rec is recurrent:
+                    weights[rows[src], j] += weight
+
+        return np.array(sources, dtype=np.intp), weights
+
+    def __call__(self, values, prev=None, extra=None):
+        """Calcola gli stati dei neuroni del gruppo.
+
+        Args:
+          values: Matrice con gli stati del passo corrente, viene aggiornata.
+          prev: Matrice con gli stati del passo precedente o None.
+          extra: Matrice con i contributi da sommare prima dell'attivazione
+                 (es. i gates) o None.
+        """
+        if self.src.size:
+            inputs = values[:, self.src] @ self.weights
+        else:
+            inputs = np.zeros((values.shape[0], self.cols.size))
+
+        if prev is not None and self.rec.size:
+            inputs += prev[:, self.rec] @ self.rec_weights
+        if self.mean:
+            inputs /= self.rec_counts if prev is not None else self.counts
+        if extra is not None:
+            inputs += extra[:, self.cols]
+
+        inputs += self.biases
+        values[:, self.cols] = apply_squash(self.squash, inputs)
+
+
+class ReduceKernel():
+    """Kernel per un gruppo di neuroni con aggregazione 'max', 'min' o
+    'product' e la stessa funzione d'attivazione.
+
+    Le connessioni in entrata vengono disposte in una matrice (neuroni,
+    connessioni) riempita fino alla lunghezza massima: gli elementi di
+    riempimento (e, al primo passo, quelli ricorrenti) vengono sostituiti
+    dall'elemento neutro della riduzione.
+    """
+    # Riduzione ed elemento neutro di ogni aggregazione supportata
+    REDUCTIONS = {"max": (np.maximum, -np.inf),
+                  "min": (np.minimum, np.inf),
+                  "product": (np.multiply, 1.)}
+
+    def __init__(self, cols, fanins, biases, squash, aggregation):
+        """Inizializza il kernel.
+
+        Args:
+          cols: Please see: @ga_nets.compiled.plan.MatmulKernel.__init__()
+          fanins: Please see: @ga_nets.compiled.plan.MatmulKernel.__init__()
+          biases: Please see: @ga_nets.compiled.plan.MatmulKernel.__init__()
+          squash: Please see: @ga_nets.compiled.plan.MatmulKernel.__init__()
+          aggregation: Nome dell'aggregazione (una chiave di 'REDUCTIONS').
+        """
+        self.cols = np.array(cols, dtype=np.intp)
+        self.biases = np.array(biases, dtype=float)
+        self.squash = squash
+        self.reduce, self.fill = self.REDUCTIONS[aggregation]
+
+        width = max(1, max(map(len, fanins)))
+        self.src = np.zeros((len(fanins), width), dtype=np.intp)
+        self.weights = np.zeros((len(fanins), width))
+        self.is_rec = np.zeros((len(fanins), width), dtype=bool)
+        self.mask = np.zeros((len(fanins), width), dtype=bool)
+        for i, fanin in enumerate(fanins):
+            for j, (src, weight, rec) in enumerate(fanin):
+                self.src[i, j] = src
+                self.weights[i, j] = weight
+                self.is_rec[i, j] = rec
+                self.mask[i, j] = True
+
+        # Maschera per il primo passo, senza le connessioni ricorrenti
+        self.first_mask = self.mask & ~self.is_rec
+        self.empty = ~self.mask.any(axis=1)
+        self.first_empty = ~self.first_mask.any(axis=1)
+
+    def __call__(self, values, prev=None, extra=None):
+        """Please see: @ga_nets.compiled.plan.MatmulKernel.__call__()"""
+        states = values[:, self.src]
+        mask, empty = self.first_mask, self.first_empty
+        if prev is not None and self.is_rec.any():
+            states[:, self.is_rec] = prev[:, self.src[self.is_rec]]
+            mask, empty = self.mask, self.empty
+        states *= self.weights
+
+        if not mask.all():
+            states[:, ~mask] = self.fill
+        inputs = self.reduce.reduce(states, axis=-1)
+
+        # Senza connessioni l'aggregazione è calcolata su [0]
+        inputs[:, empty] = 0.
+
+        if extra is not None:
+            inputs += extra[:, self.cols]
+
+        inputs += self.biases
+        values[:, self.cols] = apply_squash(self.squash, inputs)
+
+
+class NeuronKernel():
+    """Kernel generico per un singolo neurone con una funzione d'aggregazione
+    qualsiasi"""
+    def __init__(self, col, fanin, bias, squash, aggregation):
+        """Inizializza il kernel.
+
+        Args:
+          col: Colonna del neurone.
+          fanin: Connessioni in entrata (vedi 'get_fanin()').
+          bias: Bias del neurone.
+          squash: Funzione d'attivazione.
+          aggregation: Funzione d'aggregazione.
+        """
+        self.col = col
+        self.bias = bias
+        self.squash = squash
+        self.aggregation = aggregation
+
+        self.src = np.array([s for s, _, r in fanin if not r], dtype=np.intp)
+        self.weights = np.array([w for _, w, r in fanin if not r])
+        self.rec = np.array([s for s, _, r in fanin if r], dtype=np.intp)
+        self.rec_weights = np.array([w for _, w, r in fanin if r])
+
+    def __call__(self, values, prev=None, extra=None):
+        """Please see: @ga_nets.compiled.plan.MatmulKernel.__call__()"""
+        states = values[:, self.src] * self.weights
+        if prev is not None and self.rec.size:
+            states = np.hstack((states, prev[:, self.rec] * self.rec_weights))
+
+        # Per evitare errori dati dal min() e max()
+        vector = get_vector(self.aggregation)
+        if vector is not None:
+            if not states.shape[1]:
+                states = np.zeros((states.shape[0], 1))
+            inputs = np.array(vector(states), dtype=float)
+        else:
+            inputs = np.array([self.aggregation(row) if row
+                               else self.aggregation([0])
+                               for row in states.tolist()], dtype=float)
+
+        if extra is not None:
+            inputs += extra[:, self.col]
+
+        inputs += self.bias
+        values[:, self.col] = apply_squash(self.squash, inputs)
+
+
+def get_kernels(network, stage, positions, recurrent):
+    """Raggruppa i neuroni di uno stadio nei kernel.
+
+    I neuroni con la stessa coppia (aggregazione, attivazione) vengono
+    calcolati insieme: 'sum' e 'mean' tramite un prodotto matriciale, 'max',
+    'min' e 'product' tramite una riduzione. Le altre aggregazioni utilizzano
+    un kernel per neurone.
+
+    Args:
+      network: Istanza della rete neurale.
+      stage: Lista con le chiavi dei neuroni, indipendenti fra loro.
+      positions: Dizionario chiave -> colonna generato da 'get_order()'.
+      recurrent: True se la rete è ricorrente.
+
+    Returns:
+      Una lista di kernel da eseguire in sequenza.
+    """
+    kernels = []
+    groups = {}
+    for key in stage:
+        neuron = network.neurons[key]
+        fanin = get_fanin(neuron, positions, recurrent)
+
+        aggregation = get_name(neuron.aggregation)
+        if (aggregation not in ("sum", "mean")
+                and aggregation not in ReduceKernel.REDUCTIONS):
+            kernels.append(NeuronKernel(positions[key], fanin, neuron.bias,
+                                        neuron.squash, neuron.aggregation))
+            continue
+
+        group = groups.setdefault((aggregation, neuron.squash), ([], [], []))
+        group[0].append(positions[key])
+        group[1].append(fanin)
+        group[2].append(neuron.bias)
+
+    for (aggregation, squash), (cols, fanins, biases) in groups.items():
+        if aggregation in ReduceKernel.REDUCTIONS:
+            kernels.append(ReduceKernel(cols, fanins, biases, squash,
+                                        aggregation))
+        else:
+            kernels.append(MatmulKernel(cols, fanins, biases, squash,
+                                        aggregation == "mean"))
+
+    freeze(*kernels)
+    return kernels
+
+
+def get_stages(network, layers, positions, recurrent):
+    """Divide i layers in stadi i cui neuroni possono essere calcolati
+    insieme.
+
+    I layers hidden non hanno mai dipendenze interne, mentre quello di output
+    può averne (sinapsi da output a output) e in tal caso viene spezzato.
+
+    Args:
+      network: Istanza della rete neurale.
+      layers: La lista tridimensionale dei layers.
+      positions: Dizionario chiave -> colonna generato da 'get_order()'.
+      recurrent: True se la rete è ricorrente.
+
+    Returns:
+      Una lista di stadi, ognuno con la lista dei suoi kernel.
+    """
+    stages = []
+    for layer in layers[1:]:
+        stage = []
+        cols = set()
+        for key in layer:
+            fanin = get_fanin(network.neurons[key], positions, recurrent)
+            if any(src in cols for src, _, rec in fanin if not rec):
+                stages.append(stage)
+                stage = []
+                cols = set()
+
+            stage.append(key)
+            cols.add(positions[key])
+
+        if stage:
+            stages.append(stage)
+
+    return [get_kernels(network, stage, positions, recurrent)
+            for stage in stages]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Rimozione della struttura morta prima della compilazione.
+
+Un neurone hidden è vivo solo se è nei layers (quindi raggiungibile da un
+input, vedi 'ga_nets.topology') e se almeno un output dipende da lui tramite
+sinapsi che contribuiscono all'attivazione o, nei recurrent, tramite gates.
+Gli altri vengono esclusi dal piano insieme alle loro connessioni, senza
+modificare gli output.
+"""
+from ga_nets.compiled.plan import get_fanin, get_order
+
+
+class PruneReport():
+    """Resoconto di ciò che è stato escluso dal piano"""
+    def __init__(self, dead, unreachable, synapses, gates):
+        """Inizializza il resoconto.
+
+        Args:
+          dead: Chiavi degli hidden nei layers dai quali nessun output
+                dipende.
+          unreachable: Chiavi degli hidden fuori dai layers (non raggiungibili
+                       dagli input o bloccati da un ciclo).
+          synapses: Sinapsi escluse nel formato di 'Network.get_synapses()'.
+          gates: Gates esclusi, nello stesso formato.
+        """
+        self.dead = dead
+        self.unreachable = unreachable
+        self.synapses = synapses
+        self.gates = gates
+
+    def __str__(self):
+        return ("Pruned {} dead and {} unreachable neurons, {} synapses, "
+                "{} gates").format(len(self.dead), len(self.unreachable),
+                                   len(self.synapses), len(self.gates))
+
+    @property
+    def neurons(self):
+        """Tutte le chiavi dei neuroni esclusi"""
+        return self.dead + self.unreachable
+
+
+def prune(network, layers, recurrent):
+    """Rimuove dai layers i neuroni dai quali nessun output dipende.
+
+    Args:
+      network: Istanza della rete neurale.
+      layers: La lista tridimensionale dei layers.
+      recurrent: True se la rete è ricorrente.
+
+    Returns:
+      Una tupla con i nuovi layers (input e output restano invariati, gli
+      hidden layers vuoti vengono rimossi) e l'istanza di 'PruneReport'.
+    """
+    keys, positions = get_order(layers)
+    neurons = network.neurons
+    gates = getattr(network, "gates", ()) if recurrent else ()
+
+    # Chi legge lo stato precedente tramite un gate dipende dal neurone letto
+    readers = {}
+    for gate in gates:
+        if gate.to_neuron.key in positions:
+            readers.setdefault(gate.from_neuron.key, []).append(
+                gate.to_neuron.key)
+
+    alive = set(layers[-1])
+    stack = list(layers[-1])
+    while stack:
+        key = stack.pop()
+        sources = [keys[src] for src, _, _ in get_fanin(neurons[key],
+                                                        positions,
+                                                        recurrent)]
+        for src in sources + readers.get(key, []):
+            if src not in alive:
+                alive.add(src)
+                stack.append(src)
+
+    alive.update(layers[0])
+
+    hiddens = [[key for key in layer if key in alive]
+               for layer in layers[1:-1]]
+    pruned = [layers[0]] + [layer for layer in hiddens if layer]
+    pruned.append(layers[-1])
+
+    dead = [key for layer in layers[1:-1] for key in layer
+            if key not in alive]
+    unreachable = [key for key in neurons if key not in positions]
+
+    def is_pruned(conn):
+        return (conn.from_neuron.key not in alive
+                or conn.to_neuron.key not in alive)
+
+    return pruned, PruneReport(
+        dead,
+        unreachable,
+        [(s.from_neuron.key, s.to_neuron.key, s.weight)
+         for s in network.synapses if is_pruned(s)],
+        [(g.from_neuron.key, g.to_neuron.key, g.weight)
+         for g in gates if is_pruned(g)])
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Piano d'esecuzione compilato per i recurrent network"""
+import numpy as np
+
+from ga_nets.compiled.plan import Context, freeze, get_order, get_stages, \
+    ThreadContexts
+from ga_nets.compiled.prune import prune as prune_layers
+
+
+class GateMatrix():
+    """Matrice sparsa (in formato coordinate ordinato per riga) con i gates:
+    ogni riga è il neurone che legge lo stato precedente dei neuroni
+    indicati nelle colonne"""
+    def __init__(self, gates, positions):
+        """Inizializza la matrice.
+
+        Args:
+          gates: Lista con le istanze dei gates della rete.
+          positions: Dizionario chiave -> colonna generato da 'get_order()'.
+        """
+        entries = sorted((positions[g.from_neuron.key],
+                          positions[g.to_neuron.key],
+                          g.weight)
+                         for g in gates
+                         if g.from_neuron.key in positions
+                         and g.to_neuron.key in positions)
+
+        rows = np.array([e[0] for e in entries], dtype=np.intp)
+        self.cols = np.array([e[1] for e in entries], dtype=np.intp)
+        self.weights = np.array([e[2] for e in entries], dtype=float)
+
+        # Inizio di ogni riga all'interno delle coordinate
+        self.targets, self.starts = np.unique(rows, return_index=True)
+
+    def __call__(self, prev):
+        """Calcola il contributo dei gates per ogni neurone.
+
+        Args:
+          prev: Matrice con gli stati del passo precedente.
+
+        Returns:
+          Una matrice della stessa forma con la somma dei gates di ogni
+          neurone.
+        """
+        extra = np.zeros_like(prev)
+        if self.cols.size:
+            states = prev[:, self.cols] * self.weights
+            extra[:, self.targets] = np.add.reduceat(states, self.starts,
+                                                     axis=1)
+
+        return extra
+
+
+class RNNPlan():
+    """Trasforma un recurrent network in matrici feedforward per ogni layer
+    e in una matrice sparsa per i gates, così da attivare B sequenze
+    indipendenti in una sola chiamata"""
+    def __init__(self, network, prune=True):
+        """Compila la rete neurale.
+
+        Il piano è una fotografia della rete: le modifiche successive alla
+        compilazione non vengono viste e richiedono un nuovo 'compile()'.
+
+        Args:
+          network: Istanza del recurrent network.
+          prune: Se True esclude i neuroni dai quali nessun output dipende,
+                 il resoconto è in 'report' (vedi 'ga_nets.compiled.prune').
+        """
+        layers = network.layers
+        self.report = None
+        if prune:
+            layers, self.report = prune_layers(network, layers, True)
+
+        self.keys, positions = get_order(layers)
+        self.num_inputs = len(layers[0])
+        self.outputs = np.array([positions[key] for key in layers[-1]],
+                                dtype=np.intp)
+        self.stages = get_stages(network, layers, positions, True)
+        self.gates = GateMatrix(network.gates, positions)
+
+        freeze(self, self.gates)
+        self.contexts = ThreadContexts(len(self.keys))
+
+    def activate(self, sequences, context=None):
+        """Attiva la rete neurale su un gruppo di sequenze.
+
+        Il piano non viene modificato: può essere attivato
+        contemporaneamente da più thread.
+
+        Args:
+          sequences: Un tensore (B, T, inputs) con B sequenze lunghe T passi
+                     oppure una matrice (T, inputs) con una sola sequenza,
+                     come in 'Recurrent.activate()'.
+          context: Please see: @ga_nets.compiled.ffw.FFWPlan.activate()
+
+        Returns:
+          Un tensore numpy (B, T, outputs) con gli output di ogni passo, o una
+          matrice (T, outputs) se è stata passata una sola sequenza.
+
+        Raises:
+          ValueError: Se la dimensione dell'array degli input è errata.
+        """
+        sequences = np.asarray(sequences, dtype=float)
+        single = sequences.ndim == 2
+        if single:
+            sequences = sequences[np.newaxis]
+
+        if sequences.ndim != 3 or sequences.shape[2] != self.num_inputs:
+            raise ValueError("Features' number is wrong.")
+
+        batch, steps = sequences.shape[:2]
+        outputs = np.empty((batch, steps, self.outputs.size))
+
+        # Vengono alternati due soli buffer: passo corrente e precedente
+        prev = None
+        context = context if context is not None else self.contexts.get()
+        buffers = context.get_buffers(batch, 2)
+        for step in range(steps):
+            values = buffers[step % 2]
+            self.step(sequences[:, step], values, prev)
+
+            outputs[:, step] = values[:, self.outputs]
+            prev = values
+
+        return outputs[0] if single else outputs
+
+    def step(self, features, values, prev):
+        """Calcola un singolo passo.
+
+        Args:
+          features: Matrice (B, inputs) con gli input del passo.
+          values: Matrice (B, neuroni) nella quale salvare gli stati.
+          prev: Matrice con gli stati del passo precedente, None al primo.
+        """
+        values[:, :self.num_inputs] = features
+
+        extra = self.gates(prev) if prev is not None else None
+        for kernels in self.stages:
+            for kernel in kernels:
+                kernel(values, prev, extra)
+
+    def session(self, batch=None):
+        """Crea una sessione d'inferenza che mantiene lo stato fra una
+        chiamata e l'altra.
+
+        Args:
+          batch: Numero di flussi indipendenti, None per uno solo.
+
+        Returns:
+          L'istanza di 'RNNSession'.
+        """
+        return RNNSession(self, batch)
+
+
+class RNNSession():
+    """Sessione d'inferenza per flussi di dati senza fine: ogni chiamata a
+    'step()' calcola un passo partendo dagli stati del precedente.
+
+    La memoria è costante, vengono mantenuti solo due buffer con uno stato
+    per ogni neurone: quello corrente e quello del passo precedente, letto
+    dai gates e dalle sinapsi ricorrenti. Ogni sessione ha i propri buffer,
+    quindi più sessioni dello stesso piano possono avanzare in thread
+    diversi.
+    """
+    def __init__(self, plan, batch=None):
+        """Inizializza la sessione.
+
+        Args:
+          plan: Istanza di 'RNNPlan'.
+          batch: Numero di flussi indipendenti, None per uno solo.
+        """
+        self.plan = plan
+        self.batch = batch
+
+        rows = batch if batch is not None else 1
+        self.__buffers = Context(len(plan.keys)).get_buffers(rows, 2)
+        self.__steps = 0
+
+    @property
+    def steps(self):
+        """Getter per il numero di passi calcolati dall'ultimo 'reset()'"""
+        return self.__steps
+
+    def step(self, features):
+        """Calcola il passo successivo.
+
+        Args:
+          features: Lista con gli input del passo o, con più flussi, una
+                    matrice (batch, inputs).
+
+        Returns:
+          Un array numpy con gli output del passo (una riga per flusso).
+
+        Raises:
+          ValueError: Se la dimensione dell'array degli input è errata.
+        """
+        features = np.asarray(features, dtype=float)
+        if self.batch is None:
+            features = features[np.newaxis]
+
+        if features.shape != (len(self.__buffers[0]), self.plan.num_inputs):
+            raise ValueError("Features' number is wrong.")
+
+        values = self.__buffers[self.__steps % 2]
+        prev = self.__buffers[1 - self.__steps % 2] if self.__steps else None
+        self.plan.step(features, values, prev)
+        self.__steps += 1
+
+        outputs = values[:, self.plan.outputs]
+        return outputs[0] if self.batch is None else outputs
+
+    def reset(self):
+        """Azzera lo stato: il passo successivo sarà il primo"""
+        self.__steps = 0
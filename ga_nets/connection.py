@@ -12,6 +12,10 @@
 from abc import ABCMeta, abstractmethod
 
 from enum import Enum
+from itertools import islice
+
+from ga_nets.fingerprint import GATE, get_conn_terms, SYNAPSE
+from ga_nets.index import Indexer
 
 
 class AlreadyConn(Exception):
@@ -31,17 +35,33 @@ GateDirection = ConnDirection
 
 class Connection(metaclass=ABCMeta):
     """Base astratta utilizzata per sinapsi e gates"""
-    def __init__(self, from_neuron, to_neuron, weight):
+    # Senza '__dict__' ogni istanza occupa molta meno memoria
+    __slots__ = ("__from_neuron", "__to_neuron", "__weight", "__attached",
+                 "__innovation")
+
+    # Tipo negli historical markings (vedi 'Indexer.get_innovation()')
+    KIND = None
+
+    def __init__(self, from_neuron, to_neuron, weight, innovation=None):
         """Inizializza la classe.
 
         Args:
           from_node: Istanza del neurone di provenienza.
           to_neuron: Istanza del neurone d'arrivo.
           weight: Peso della connessione, probabilmente un float.
+          innovation: Historical marking della connessione (es. copiato dal
+                      genoma), di default quello della coppia di neuroni.
         """
         self.__from_neuron = from_neuron
         self.__to_neuron = to_neuron
         self.__weight = weight
+        self.__innovation = (Indexer.get_innovation(from_neuron.key,
+                                                    to_neuron.key, self.KIND)
+                             if innovation is None else innovation)
+
+        # False dopo 'remove()': la connessione non conta più nell'impronta
+        # della rete
+        self.__attached = True
 
     def __str__(self):
         """Stampa le informazioni riguardo la connessione"""
@@ -71,7 +91,30 @@ class Connection(metaclass=ABCMeta):
 
     @weight.setter
     def weight(self, weight):
+        if not self.__attached:
+            self.__weight = weight
+            self.__from_neuron.touch()
+            return
+
+        old = get_conn_terms(self)
         self.__weight = weight
+        self.__from_neuron.touch(old, get_conn_terms(self, old[0]))
+
+    @property
+    def innovation(self):
+        """Getter per l'historical marking, utilizzato dal crossover per
+        allineare le connessioni"""
+        return self.__innovation
+
+    @property
+    def attached(self):
+        """Getter che indica se la connessione è ancora registrata nei
+        neuroni"""
+        return self.__attached
+
+    @attached.setter
+    def attached(self, attached):
+        self.__attached = attached
 
     @abstractmethod
     def remove(self):
@@ -79,32 +122,157 @@ class Connection(metaclass=ABCMeta):
         raise NotImplementedError("Needs to be implemented.")
 
 
+class ConnRegistry():
+    """Registro delle connessioni indicizzato per '(from_key, to_key)'.
+
+    Si comporta come la lista utilizzata in precedenza (iterazione in ordine
+    d'inserimento, 'append()', 'remove()', 'len()'), ma la verifica
+    dell'esistenza, la ricerca e la rimozione di una connessione costano
+    O(1). Le chiavi dei neuroni non devono variare finché sono connessi.
+    """
+    __slots__ = ("__conns",)
+
+    def __init__(self, conns=()):
+        """Inizializza il registro.
+
+        Args:
+          conns: Connessioni con le quali popolarlo.
+        """
+        self.__conns = {}
+        for conn in conns:
+            self.append(conn)
+
+    def __str__(self):
+        """Stampa le connessioni come una lista"""
+        return "[{}]".format(", ".join(map(str, self)))
+
+    def __iter__(self):
+        return iter(self.__conns.values())
+
+    def __len__(self):
+        return len(self.__conns)
+
+    def __contains__(self, conn):
+        """Verifica se la connessione è presente.
+
+        Args:
+          conn: L'istanza della connessione o la tupla
+                '(from_key, to_key)'.
+        """
+        if isinstance(conn, tuple):
+            return conn in self.__conns
+
+        return self.__conns.get(get_key(conn)) is conn
+
+    def __getitem__(self, index):
+        """Accesso per indice come in una lista: costa O(n), da non
+        utilizzare nei cicli."""
+        if index < 0:
+            index += len(self.__conns)
+        if not 0 <= index < len(self.__conns):
+            raise IndexError("Connection index out of range.")
+
+        return next(islice(self.__conns.values(), index, None))
+
+    def append(self, conn):
+        """Aggiunge una connessione.
+
+        Args:
+          conn: L'istanza della connessione.
+
+        Raises:
+          AlreadyConn: Se è già presente una connessione fra i due neuroni.
+        """
+        key = get_key(conn)
+        if key in self.__conns:
+            raise AlreadyConn("Connection already present.")
+
+        self.__conns[key] = conn
+
+    def remove(self, conn):
+        """Rimuove una connessione.
+
+        Args:
+          conn: L'istanza della connessione.
+
+        Raises:
+          ValueError: Se la connessione non è presente, come 'list.remove()'.
+        """
+        key = get_key(conn)
+        if self.__conns.get(key) is not conn:
+            raise ValueError("Connection not present.")
+
+        del self.__conns[key]
+
+    def get(self, from_key, to_key, default=None):
+        """Restituisce la connessione fra due neuroni.
+
+        Args:
+          from_key: Chiave del neurone di partenza.
+          to_key: Chiave del neurone d'arrivo.
+          default: Valore restituito se la connessione non è presente.
+
+        Returns:
+          L'istanza della connessione o 'default'.
+        """
+        return self.__conns.get((from_key, to_key), default)
+
+
+def get_key(conn):
+    """Chiave della connessione nel registro.
+
+    Args:
+      conn: L'istanza della connessione.
+
+    Returns:
+      La tupla '(from_key, to_key)'.
+    """
+    return (conn.from_neuron.key, conn.to_neuron.key)
+
+
 class Synapse(Connection):
     """Sinapsi fra i neuroni del network."""
+    __slots__ = ()
+
+    # Tipo nell'impronta della rete (vedi 'ga_nets.fingerprint')
+    TAG = SYNAPSE
+    KIND = "synapse"
+
     def remove(self):
         """Elimina le connessioni dalle liste dei numeroni"""
         self.from_neuron.synapses[SynapseDirection.OUT.value].remove(self)
         self.to_neuron.synapses[SynapseDirection.IN.value].remove(self)
+        self.attached = False
 
 
 class Gate(Synapse):
     """Gates fra i neuroni del network"""
+    __slots__ = ()
+
+    TAG = GATE
+    KIND = "gate"
+
     def remove(self):
         """Elimina i gates dalle liste dei neuroni"""
         self.from_neuron.gates[GateDirection.OUT.value].remove(self)
         self.to_neuron.gates[GateDirection.IN.value].remove(self)
+        self.attached = False
 
 
 def is_connected(conns, from_neuron, to_neuron):
     """Verifica se c'è già una connessione (Sinpasi o Gates).
 
     Args:
-      conns: Lista con sinapsi o gates.
+      conns: Registro o lista con sinapsi o gates. Con il registro la verifica
+             costa O(1).
       from_neuron: Istanza del neurone di partenza.
       to_neuron: Istanza del neurone d'arrivo.
 
     Returns:
       True se è già presente, False altrimenti."""
+    if isinstance(conns, ConnRegistry):
+        return (from_neuron.key, to_neuron.key) in conns
+
     for conn in conns:
         if conn.from_neuron == from_neuron and conn.to_neuron == to_neuron:
             return True
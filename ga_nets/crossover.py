@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Crossover fra due genomi allineati tramite gli historical markings.
+
+Sinapsi e gates vengono allineati tramite l'innovazione (vedi
+'ga_nets.index.Indexer.get_innovation()'), i neuroni tramite la chiave, che
+per quelli creati da 'ga_nets.mutation.add_node()' è il marking della
+sinapsi divisa: due genitori che dividono sinapsi diverse non producono
+neuroni con la stessa chiave. L'allineamento avviene con operazioni su array
+ordinati, quindi il costo è O(n log n) nella dimensione dei genomi invece
+che quadratico.
+
+I geni sono:
+  - matching: presenti in entrambi i genitori;
+  - disjoint: presenti in uno solo, ma all'interno delle innovazioni (o
+    delle chiavi, per i neuroni) dell'altro;
+  - excess: presenti in uno solo e più recenti di tutti quelli dell'altro
+    genitore.
+
+Se i markings vengono dimenticati fra una generazione e l'altra (vedi
+'Indexer.reset_innovations()') la stessa coppia di neuroni può avere
+innovazioni diverse nei due genitori: il figlio ne eredita una sola,
+preferendo il primo genitore.
+
+Ereditando i geni di entrambi i genitori ("both") un feedforward può
+ricevere sinapsi che formano un ciclo: i neuroni coinvolti restano fuori
+dai layers (vedi 'ga_nets.topology').
+"""
+import numpy as np
+
+from ga_nets.genome import ConnTable, Genome
+from ga_nets.neuron import NeuronType
+
+
+class Policy():
+    """Regole con le quali scegliere i geni del figlio"""
+    # Valori accettati per i geni disjoint ed excess
+    SOURCES = ("fitter", "both", "none")
+
+    def __init__(self, matching="random", disjoint="fitter",
+                 excess="fitter", disabled_rate=.75):
+        """Inizializza la politica.
+
+        Args:
+          matching: "random" per prendere ogni gene matching da un genitore a
+                    caso, "fitter" dal primo, "mean" per la media di pesi e
+                    bias (le funzioni vengono dal primo).
+          disjoint: "fitter" per ereditare solo quelli del primo genitore,
+                    "both" per quelli di entrambi, "none" per nessuno.
+          excess: Come 'disjoint'.
+          disabled_rate: Probabilità che una connessione matching disattivata
+                         in almeno un genitore resti disattivata.
+
+        Raises:
+          ValueError: Se uno dei valori non è valido.
+        """
+        if matching not in ("random", "fitter", "mean"):
+            raise ValueError("Invalid matching policy: {}".format(matching))
+        if disjoint not in self.SOURCES or excess not in self.SOURCES:
+            raise ValueError("Invalid disjoint/excess policy.")
+
+        self.matching = matching
+        self.disjoint = disjoint
+        self.excess = excess
+        self.disabled_rate = disabled_rate
+
+
+def match(keys1, keys2):
+    """Allinea due array di chiavi univoche.
+
+    Returns:
+      Una tupla con gli indici dei geni matching nel primo e nel secondo
+      array e gli indici dei geni presenti solo nel primo e solo nel secondo.
+    """
+    _, common1, common2 = np.intersect1d(keys1, keys2, assume_unique=True,
+                                         return_indices=True)
+
+    only1 = np.ones(keys1.size, dtype=bool)
+    only1[common1] = False
+    only2 = np.ones(keys2.size, dtype=bool)
+    only2[common2] = False
+
+    return common1, common2, np.flatnonzero(only1), np.flatnonzero(only2)
+
+
+def get_excess(values, other):
+    """Geni excess: più recenti di tutti quelli dell'altro genitore.
+
+    Args:
+      values: Array con le innovazioni (o le chiavi) di un genitore.
+      other: Array con le innovazioni (o le chiavi) dell'altro genitore.
+
+    Returns:
+      Un array booleano, True per i geni excess.
+    """
+    return values > (other.max() if other.size else -1)
+
+
+def get_conn_ids(table1, table2):
+    """Assegna un intero a ogni coppia (partenza, arrivo) delle due tabelle.
+
+    Returns:
+      Una tupla con gli id delle connessioni della prima e della seconda
+      tabella.
+    """
+    pairs = np.concatenate((
+        np.stack((table1.from_keys, table1.to_keys), axis=1),
+        np.stack((table2.from_keys, table2.to_keys), axis=1))).reshape(-1, 2)
+    _, ids = np.unique(pairs, axis=0, return_inverse=True)
+    ids = ids.ravel()
+
+    return ids[:len(table1)], ids[len(table1):]
+
+
+def select(only, is_excess, disjoint, excess):
+    """Sceglie, fra i geni presenti in un solo genitore, quelli da
+    ereditare.
+
+    Args:
+      only: Indici dei geni presenti solo in questo genitore.
+      is_excess: Array booleano, True per i geni excess.
+      disjoint: True se i disjoint di questo genitore vanno ereditati.
+      excess: True se gli excess di questo genitore vanno ereditati.
+
+    Returns:
+      Gli indici dei geni ereditati.
+    """
+    keep = np.where(is_excess[only], excess, disjoint)
+    return only[keep]
+
+
+def get_order(common1, keep1, keep2, size1):
+    """Ordine dei geni del figlio: prima quelli del primo genitore nel suo
+    ordine (così gli output restano nella stessa sequenza), poi quelli del
+    solo secondo genitore.
+
+    Returns:
+      Gli indici con cui riordinare la concatenazione di matching, geni del
+      primo e geni del secondo genitore.
+    """
+    return np.argsort(np.concatenate((common1, keep1, size1 + keep2)),
+                      kind="stable")
+
+
+class Crossover():
+    """Operatore di crossover con una politica configurabile"""
+    def __init__(self, policy=None, seed=None):
+        """Inizializza l'operatore.
+
+        Args:
+          policy: Istanza di 'Policy', di default quella di NEAT.
+          seed: Seme o generatore numpy.
+        """
+        self.policy = policy if policy is not None else Policy()
+        self.rng = (seed if isinstance(seed, np.random.Generator)
+                    else np.random.default_rng(seed))
+
+    def __call__(self, parent1, parent2):
+        """Genera il figlio di due genitori.
+
+        Args:
+          parent1: Il genitore migliore (istanza di 'ga_nets.genome.Genome'
+                   o della rete neurale). Con la politica "fitter" i geni
+                   disjoint ed excess vengono presi da lui.
+          parent2: L'altro genitore.
+
+        Returns:
+          L'istanza del genoma del figlio.
+        """
+        genomes = [parent if isinstance(parent, Genome)
+                   else parent.snapshot()
+                   for parent in (parent1, parent2)]
+        genome1, genome2 = genomes
+
+        # Funzioni del secondo genitore rimappate su quelle del figlio
+        functions = list(genome1.functions)
+        for function in genome2.functions:
+            if function not in functions:
+                functions.append(function)
+        remap = np.array([functions.index(f) for f in genome2.functions],
+                         dtype=np.int16)
+
+        synapses = self.__conns(genome1.synapses, genome2.synapses)
+        gates = self.__conns(genome1.gates, genome2.gates)
+
+        # I neuroni agli estremi delle connessioni ereditate sono necessari
+        required = np.concatenate((synapses.from_keys, synapses.to_keys,
+                                   gates.from_keys, gates.to_keys))
+        neurons = self.__neurons(genome1, genome2, remap, required)
+
+        return Genome(genome1.network_class, functions, neurons, synapses,
+                      gates)
+
+    def __neurons(self, genome1, genome2, remap, required):
+        """Sceglie le colonne dei neuroni del figlio"""
+        policy = self.policy
+        common1, common2, only1, only2 = match(genome1.keys, genome2.keys)
+
+        # Input e output sono comuni a tutte le reti e vengono sempre
+        # ereditati, come i neuroni richiesti dalle connessioni.
+        hidden = NeuronType.HIDDEN.value
+        needed1 = np.isin(genome1.keys, required) | (genome1.types != hidden)
+        needed2 = np.isin(genome2.keys, required) | (genome2.types != hidden)
+        keep1 = select(only1, get_excess(genome1.keys, genome2.keys),
+                       policy.disjoint != "none", policy.excess != "none")
+        keep2 = select(only2, get_excess(genome2.keys, genome1.keys),
+                       policy.disjoint == "both", policy.excess == "both")
+        keep1 = np.union1d(keep1, only1[needed1[only1]])
+        keep2 = np.union1d(keep2, only2[needed2[only2]])
+
+        biases = genome1.biases[common1].copy()
+        squash = genome1.squash[common1].copy()
+        aggregation = genome1.aggregation[common1].copy()
+        if policy.matching == "mean":
+            biases = (biases + genome2.biases[common2]) / 2
+        elif policy.matching == "random":
+            second = self.rng.random(common1.size) < .5
+            biases[second] = genome2.biases[common2][second]
+            squash[second] = remap[genome2.squash[common2][second]]
+            aggregation[second] = \
+                remap[genome2.aggregation[common2][second]]
+
+        order = get_order(common1, keep1, keep2, len(genome1))
+        return (np.concatenate((genome1.keys[common1], genome1.keys[keep1],
+                                genome2.keys[keep2]))[order],
+                np.concatenate((genome1.types[common1], genome1.types[keep1],
+                                genome2.types[keep2]))[order],
+                np.concatenate((biases, genome1.biases[keep1],
+                                genome2.biases[keep2]))[order],
+                np.concatenate((squash, genome1.squash[keep1],
+                                remap[genome2.squash[keep2]]))[order],
+                np.concatenate((aggregation, genome1.aggregation[keep1],
+                                remap[genome2.aggregation[keep2]]))[order])
+
+    def __conns(self, table1, table2):
+        """Sceglie le connessioni del figlio"""
+        policy = self.policy
+        innovations1, innovations2 = table1.innovations, table2.innovations
+        common1, common2, only1, only2 = match(innovations1, innovations2)
+
+        keep1 = select(only1, get_excess(innovations1, innovations2),
+                       policy.disjoint != "none", policy.excess != "none")
+        keep2 = select(only2, get_excess(innovations2, innovations1),
+                       policy.disjoint == "both", policy.excess == "both")
+
+        # Coppie con innovazioni diverse (markings dimenticati): resta
+        # quella del primo genitore
+        ids1, ids2 = get_conn_ids(table1, table2)
+        keep2 = keep2[~np.isin(ids2[keep2],
+                               ids1[np.concatenate((common1, keep1))])]
+
+        weights = table1.weights[common1].copy()
+        if policy.matching == "mean":
+            weights = (weights + table2.weights[common2]) / 2
+        elif policy.matching == "random":
+            second = self.rng.random(common1.size) < .5
+            weights[second] = table2.weights[common2][second]
+
+        disabled = ~(table1.enabled[common1] & table2.enabled[common2])
+        enabled = ~(disabled
+                    & (self.rng.random(common1.size) < policy.disabled_rate))
+
+        order = get_order(common1, keep1, keep2, len(table1))
+        return ConnTable(
+            np.concatenate((table1.from_keys[common1],
+                            table1.from_keys[keep1],
+                            table2.from_keys[keep2]))[order],
+            np.concatenate((table1.to_keys[common1], table1.to_keys[keep1],
+                            table2.to_keys[keep2]))[order],
+            np.concatenate((weights, table1.weights[keep1],
+                            table2.weights[keep2]))[order],
+            np.concatenate((enabled, table1.enabled[keep1],
+                            table2.enabled[keep2]))[order],
+            np.concatenate((innovations1[common1], innovations1[keep1],
+                            innovations2[keep2]))[order])
+
+    def population(self, pairs):
+        """Genera i figli di più coppie di genitori.
+
+        Args:
+          pairs: Lista di coppie (genitore migliore, altro genitore).
+
+        Returns:
+          Una lista con i genomi dei figli.
+        """
+        return [self(parent1, parent2) for parent1, parent2 in pairs]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Valutazione di una popolazione di reti neurali in parallelo"""
+import multiprocessing
+
+from ga_nets.cache import get_fingerprint, MISSING
+from ga_nets.genome import Genome
+from ga_nets.index import Indexer
+
+# Dataset e funzione di fitness del processo worker, assegnati una sola volta
+# da 'init_worker()' e riutilizzati per tutte le generazioni.
+WORKER = {}
+
+
+def pack(network):
+    """Riduce la rete neurale al suo genoma compatto, senza i riferimenti
+    circolari fra neuroni e connessioni.
+
+    Viene utilizzato 'Network.snapshot()': le copie condivise non ancora
+    modificate inviano il genoma del genitore senza costruire i propri
+    oggetti.
+
+    Le funzioni d'attivazione e d'aggregazione vengono serializzate per
+    riferimento, quindi devono essere definite a livello di modulo.
+
+    Args:
+      network: Istanza della rete neurale o del suo genoma.
+
+    Returns:
+      L'istanza di 'Genome' da inviare al worker.
+    """
+    return network if isinstance(network, Genome) else network.snapshot()
+
+
+def unpack(payload, traits=None):
+    """Ricostruisce la rete neurale generata da 'pack()'.
+
+    Args:
+      payload: Il genoma generato da 'pack()'.
+      traits: Tratti della nuova rete, di default un dizionario vuoto.
+
+    Returns:
+      L'istanza della rete neurale.
+    """
+    return payload.to_network(traits)
+
+
+def init_worker(dataset, fitness, counters=None):
+    """Inizializza il processo worker.
+
+    Args:
+      dataset: Dati passati alla funzione di fitness.
+      fitness: Funzione di fitness.
+      counters: Istanza di 'ga_nets.index.SharedCounters' per generare
+                indici univoci fra i worker, se necessario.
+    """
+    WORKER["dataset"] = dataset
+    WORKER["fitness"] = fitness
+
+    if counters is not None:
+        Indexer.share(counters)
+
+
+def evaluate_payload(payload):
+    """Valuta una rete neurale all'interno del processo worker.
+
+    Args:
+      payload: Il genoma generato da 'pack()'.
+
+    Returns:
+      Il valore restituito dalla funzione di fitness.
+    """
+    return WORKER["fitness"](unpack(payload), WORKER["dataset"])
+
+
+class PopulationEvaluator():
+    """Distribuisce la valutazione di una popolazione su un pool di processi
+    che resta attivo fra una generazione e l'altra"""
+    def __init__(self, dataset, fitness, processes=None, chunksize=1,
+                 counters=None, cache=None, ctx=None):
+        """Inizializza il pool.
+
+        Args:
+          dataset: Dati passati a ogni chiamata della funzione di fitness,
+                   inviati una sola volta a ogni worker.
+          fitness: Funzione 'fitness(network, dataset)' che restituisce il
+                   valore di fitness; deve essere definita a livello di
+                   modulo.
+          processes: Numero di processi, di default uno per ogni core. Con 0
+                     la valutazione avviene nel processo corrente.
+          chunksize: Numero di reti inviate a un worker per volta.
+          counters: Please see: @ga_nets.evaluator.init_worker()
+          cache: Istanza di 'ga_nets.cache.FitnessCache' per non valutare di
+                 nuovo gli individui già valutati sullo stesso dataset.
+          ctx: Contesto di multiprocessing del pool (es.
+               'get_context("spawn")'), di default quello predefinito. I
+               contatori vanno creati con lo stesso contesto.
+        """
+        self.dataset = dataset
+        self.fitness = fitness
+        self.chunksize = chunksize
+        self.cache = cache
+        self.fingerprint = (get_fingerprint(dataset) if cache is not None
+                            else None)
+
+        self.__pool = None
+        if processes != 0:
+            ctx = ctx or multiprocessing.get_context()
+            self.__pool = ctx.Pool(processes, init_worker,
+                                   (dataset, fitness, counters))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def evaluate(self, population):
+        """Valuta la popolazione.
+
+        Con la cache vengono valutati solo gli individui assenti, una sola
+        volta anche se duplicati all'interno della popolazione.
+
+        Args:
+          population: Lista con le istanze delle reti neurali.
+
+        Returns:
+          Una lista con i valori di fitness nell'ordine della popolazione.
+        """
+        if self.cache is None:
+            return self.__evaluate(population)
+
+        cache = self.cache
+        keys = [cache.get_key(network, self.fingerprint)
+                for network in population]
+        values = [cache.get(key) for key in keys]
+
+        # Chiave mancante -> indice del primo individuo da valutare
+        missing = {}
+        for i, (key, value) in enumerate(zip(keys, values)):
+            if value is MISSING:
+                missing.setdefault(key, i)
+
+        evaluated = self.__evaluate([population[i]
+                                     for i in missing.values()])
+        for key, value in zip(missing, evaluated):
+            cache.put(key, value)
+
+        results = dict(zip(missing, evaluated))
+        return [results[key] if value is MISSING else value
+                for key, value in zip(keys, values)]
+
+    def __evaluate(self, population):
+        """Valuta la popolazione senza cache"""
+        if self.__pool is None:
+            return [self.fitness(network, self.dataset)
+                    for network in population]
+
+        return self.__pool.map(evaluate_payload,
+                               [pack(network) for network in population],
+                               self.chunksize)
+
+    def close(self):
+        """Termina i processi del pool"""
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
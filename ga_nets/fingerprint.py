@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Impronta strutturale delle reti neurali.
+
+L'impronta è la somma (modulo 2^64) dei termini di neuroni, sinapsi e gates:
+aggiungere, rimuovere o modificare un elemento costa O(1), perché basta
+sottrarre il suo termine precedente e sommare quello nuovo. Ogni elemento ha
+due termini:
+  - topology: solo la struttura (chiavi e tipi dei neuroni, estremi delle
+    connessioni);
+  - full: anche bias, funzioni e pesi.
+
+I termini sono i primi 64 bit del blake2b dei valori impacchettati in
+formato fisso (interi a 64 bit e float IEEE 754), quindi non dipendono dal
+processo né dalla versione dell'interprete: l'impronta può essere salvata
+e confrontata altrove. Le funzioni entrano tramite il CRC del loro nome,
+quindi devono essere registrate o definite a livello di modulo.
+Una rete e il suo genoma ('ga_nets.genome.Genome') hanno la stessa
+impronta; le connessioni disattivate del genoma non vengono contate.
+"""
+from hashlib import blake2b
+import struct
+import zlib
+
+from ga_nets.functions import get_name
+
+MASK = (1 << 64) - 1
+
+# Tipi degli elementi, inclusi nei termini (vedi anche 'Synapse.TAG')
+NEURON = 1
+SYNAPSE = 2
+GATE = 3
+
+# Formati dei valori dai quali vengono calcolati i termini
+TOPOLOGY = struct.Struct("<qqq")
+NEURON_FULL = struct.Struct("<Qdqq")
+CONN_FULL = struct.Struct("<Qd")
+
+# Codici già calcolati, indicizzati per nome (non per funzione, così la
+# cache non mantiene in vita le funzioni)
+FN_CODES = {}
+
+
+def get_term(data):
+    """Termine dell'impronta dei valori impacchettati.
+
+    Args:
+      data: I byte dei valori.
+
+    Returns:
+      Un intero a 64 bit.
+    """
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def get_fn_code(function):
+    """Codice stabile fra processi di una funzione: il CRC del nome nel
+    registro o di 'modulo:nome'.
+
+    Args:
+      function: La funzione d'attivazione o d'aggregazione.
+
+    Returns:
+      Un intero a 32 bit.
+
+    Raises:
+      ValueError: Se la funzione non è registrata né definita a livello di
+                  modulo (es. una lambda): il suo nome non la identifica in
+                  altri processi. Va prima registrata in
+                  'ga_nets.functions.REGISTRY'.
+    """
+    name = get_name(function)
+    if name is None:
+        qualname = getattr(function, "__qualname__", repr(function))
+        if "<" in qualname:
+            raise ValueError("Function {} must be registered to be "
+                             "fingerprinted.".format(qualname))
+        name = "{}:{}".format(getattr(function, "__module__", ""), qualname)
+
+    code = FN_CODES.get(name)
+    if code is None:
+        code = FN_CODES[name] = zlib.crc32(name.encode())
+
+    return code
+
+
+def get_neuron_terms(neuron, topology=None):
+    """Termini dell'impronta di un neurone: quello completo estende quello
+    della struttura con bias e funzioni.
+
+    Args:
+      neuron: Istanza del neurone.
+      topology: Termine della struttura già calcolato (es. prima di
+                modificare il bias), di default viene calcolato.
+
+    Returns:
+      Una tupla (topology, full).
+    """
+    if topology is None:
+        topology = get_term(TOPOLOGY.pack(NEURON, neuron.key,
+                                          neuron.type.value))
+
+    return (topology,
+            get_term(NEURON_FULL.pack(topology, neuron.bias,
+                                      get_fn_code(neuron.squash),
+                                      get_fn_code(neuron.aggregation))))
+
+
+def get_conn_terms(conn, topology=None):
+    """Termini dell'impronta di una sinapsi o di un gate: quello completo
+    estende quello della struttura con il peso.
+
+    Args:
+      conn: Istanza della connessione.
+      topology: Please see: @ga_nets.fingerprint.get_neuron_terms()
+
+    Returns:
+      Una tupla (topology, full).
+    """
+    if topology is None:
+        topology = get_term(TOPOLOGY.pack(conn.TAG, conn.from_neuron.key,
+                                          conn.to_neuron.key))
+
+    return (topology, get_term(CONN_FULL.pack(topology, conn.weight)))
+
+
+class Fingerprint():
+    """Impronta aggiornabile in O(1)"""
+    __slots__ = ("topology", "full")
+
+    def __init__(self, topology=0, full=0):
+        self.topology = topology
+        self.full = full
+
+    def copy(self):
+        """Restituisce una copia dell'impronta"""
+        return Fingerprint(self.topology, self.full)
+
+    def update(self, old=None, new=None):
+        """Sostituisce i termini di un elemento.
+
+        Args:
+          old: Termini da rimuovere (elemento rimosso o valori precedenti
+               alla modifica), None se l'elemento è nuovo.
+          new: Termini da aggiungere, None se l'elemento è stato rimosso.
+        """
+        if old is not None:
+            self.topology = (self.topology - old[0]) & MASK
+            self.full = (self.full - old[1]) & MASK
+        if new is not None:
+            self.topology = (self.topology + new[0]) & MASK
+            self.full = (self.full + new[1]) & MASK
+
+    @property
+    def value(self):
+        """La tupla (topology, full)"""
+        return (self.topology, self.full)
+
+
+def from_network(network):
+    """Calcola da zero l'impronta di una rete neurale.
+
+    Args:
+      network: Istanza della rete neurale.
+
+    Returns:
+      L'istanza di 'Fingerprint'.
+    """
+    fingerprint = Fingerprint()
+    for neuron in network.neurons.values():
+        fingerprint.update(new=get_neuron_terms(neuron))
+    for conn in network.synapses:
+        fingerprint.update(new=get_conn_terms(conn))
+    for conn in getattr(network, "gates", ()):
+        fingerprint.update(new=get_conn_terms(conn))
+
+    return fingerprint
+
+
+def from_genome(genome):
+    """Calcola l'impronta di un genoma senza ricostruire la rete.
+
+    Args:
+      genome: Istanza di 'ga_nets.genome.Genome'.
+
+    Returns:
+      La tupla (topology, full), uguale a quella della rete equivalente.
+    """
+    codes = [get_fn_code(fn) for fn in genome.functions]
+    topology = full = 0
+
+    for key, neuron_type, bias, squash, aggregation in zip(
+            genome.keys.tolist(), genome.types.tolist(),
+            genome.biases.tolist(), genome.squash.tolist(),
+            genome.aggregation.tolist()):
+        term = get_term(TOPOLOGY.pack(NEURON, key, neuron_type))
+        topology += term
+        full += get_term(NEURON_FULL.pack(term, bias, codes[squash],
+                                          codes[aggregation]))
+
+    for tag, table in ((SYNAPSE, genome.synapses), (GATE, genome.gates)):
+        enabled = table.enabled
+        for from_key, to_key, weight in zip(
+                table.from_keys[enabled].tolist(),
+                table.to_keys[enabled].tolist(),
+                table.weights[enabled].tolist()):
+            term = get_term(TOPOLOGY.pack(tag, from_key, to_key))
+            topology += term
+            full += get_term(CONN_FULL.pack(term, weight))
+
+    return (topology & MASK, full & MASK)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Registro delle funzioni d'attivazione e d'aggregazione.
+
+Ogni funzione è registrata con un nome, l'implementazione scalare usata dai
+neuroni e quella vettoriale (numpy) usata dai piani compilati:
+  - le funzioni d'attivazione vettoriali ricevono una matrice e la
+    restituiscono attivata elemento per elemento;
+  - quelle d'aggregazione ricevono una matrice (righe, connessioni) e
+    restituiscono un array con un valore per riga.
+"""
+from enum import Enum
+import math
+
+import numpy as np
+
+
+class FunctionType(Enum):
+    """Tipo di funzione"""
+    SQUASH = 0
+    AGGREGATION = 1
+
+
+class Function():
+    """Funzione registrata"""
+    __slots__ = ("name", "type", "scalar", "vector")
+
+    def __init__(self, name, fn_type, scalar, vector):
+        """Inizializza la funzione.
+
+        Args:
+          name: Nome con il quale è registrata.
+          fn_type: Istanza di 'FunctionType'.
+          scalar: Implementazione scalare.
+          vector: Implementazione vettoriale.
+        """
+        self.name = name
+        self.type = fn_type
+        self.scalar = scalar
+        self.vector = vector
+
+
+class FunctionRegistry():
+    """Associa i nomi alle funzioni e le funzioni scalari alle rispettive
+    implementazioni vettoriali"""
+    def __init__(self):
+        self.__names = {}
+        self.__scalars = {}
+
+    def __contains__(self, function):
+        """Vero se la funzione (o il nome) è registrata"""
+        return self.find(function) is not None
+
+    def __iter__(self):
+        return iter(self.__names.values())
+
+    def register(self, name, fn_type, scalar, vector):
+        """Registra una nuova funzione.
+
+        Args:
+          Please see: @ga_nets.functions.Function.__init__()
+
+        Returns:
+          L'istanza di 'Function'.
+
+        Raises:
+          ValueError: Se il nome è già registrato.
+        """
+        if name in self.__names:
+            raise ValueError("Function {} already registered.".format(name))
+
+        function = Function(name, fn_type, scalar, vector)
+        self.__names[name] = function
+        self.__scalars.setdefault(scalar, function)
+
+        return function
+
+    def find(self, function):
+        """Cerca una funzione registrata.
+
+        Args:
+          function: Il nome o l'implementazione scalare.
+
+        Returns:
+          L'istanza di 'Function' o None se non registrata.
+        """
+        if isinstance(function, str):
+            return self.__names.get(function)
+
+        try:
+            return self.__scalars.get(function)
+        except TypeError:
+            return None
+
+    def get(self, function):
+        """Restituisce l'implementazione scalare.
+
+        Args:
+          function: Il nome della funzione oppure direttamente la funzione,
+                    che viene restituita invariata.
+
+        Returns:
+          La funzione scalare.
+
+        Raises:
+          KeyError: Se il nome non è registrato.
+        """
+        if not isinstance(function, str):
+            return function
+        if function not in self.__names:
+            raise KeyError("Unknown function: {}".format(function))
+
+        return self.__names[function].scalar
+
+    def get_name(self, function):
+        """Nome della funzione registrata o None"""
+        registered = self.find(function)
+        return registered.name if registered is not None else None
+
+    def get_vector(self, function):
+        """Implementazione vettoriale della funzione registrata o None"""
+        registered = self.find(function)
+        return registered.vector if registered is not None else None
+
+
+def identity(value):
+    """Funzione d'attivazione identità"""
+    return value
+
+
+def sigmoid(value):
+    """Funzione d'attivazione sigmoide"""
+    return 1 / (1 + math.exp(-max(-60., min(60., value))))
+
+
+def relu(value):
+    """Funzione d'attivazione ReLU"""
+    return value if value > 0 else 0.
+
+
+def gauss(value):
+    """Funzione d'attivazione gaussiana"""
+    value = max(-3.4, min(3.4, value))
+    return math.exp(-value ** 2)
+
+
+def clamped(value):
+    """Limita il valore all'intervallo [-1, 1]"""
+    return max(-1., min(1., value))
+
+
+def softplus(value):
+    """Funzione d'attivazione softplus"""
+    return math.log1p(math.exp(max(-60., min(60., value))))
+
+
+def mean(values):
+    """Media dei valori"""
+    values = list(values)
+    return sum(values) / len(values)
+
+
+def maxabs(values):
+    """Valore con il massimo valore assoluto"""
+    return max(values, key=abs)
+
+
+def vector_maxabs(values):
+    """Please see: @ga_nets.functions.maxabs()"""
+    index = np.argmax(np.abs(values), axis=-1)
+    return np.take_along_axis(values, index[..., np.newaxis], -1)[..., 0]
+
+
+REGISTRY = FunctionRegistry()
+
+for name, scalar, vector in (
+        ("identity", identity, lambda values: values),
+        ("sigmoid", sigmoid,
+         lambda values: 1 / (1 + np.exp(-np.clip(values, -60, 60)))),
+        ("tanh", math.tanh, np.tanh),
+        ("relu", relu, lambda values: np.maximum(values, 0.)),
+        ("abs", abs, np.abs),
+        ("sin", math.sin, np.sin),
+        ("gauss", gauss,
+         lambda values: np.exp(-np.clip(values, -3.4, 3.4) ** 2)),
+        ("clamped", clamped, lambda values: np.clip(values, -1., 1.)),
+        ("softplus", softplus,
+         lambda values: np.log1p(np.exp(np.clip(values, -60, 60))))):
+    REGISTRY.register(name, FunctionType.SQUASH, scalar, vector)
+
+for name, scalar, vector in (
+        ("sum", sum, lambda values: np.sum(values, axis=-1)),
+        ("mean", mean, lambda values: np.mean(values, axis=-1)),
+        ("max", max, lambda values: np.max(values, axis=-1)),
+        ("min", min, lambda values: np.min(values, axis=-1)),
+        ("product", math.prod, lambda values: np.prod(values, axis=-1)),
+        ("maxabs", maxabs, vector_maxabs)):
+    REGISTRY.register(name, FunctionType.AGGREGATION, scalar, vector)
+
+
+def get_fn(function):
+    """Please see: @ga_nets.functions.FunctionRegistry.get()"""
+    return REGISTRY.get(function)
+
+
+def get_name(function):
+    """Please see: @ga_nets.functions.FunctionRegistry.get_name()"""
+    return REGISTRY.get_name(function)
+
+
+def get_vector(function):
+    """Please see: @ga_nets.functions.FunctionRegistry.get_vector()"""
+    return REGISTRY.get_vector(function)
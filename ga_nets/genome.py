@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Rappresentazione compatta della rete neurale tramite array tipizzati.
+
+Al posto di un oggetto per ogni neurone e connessione, il genoma salva una
+colonna per ogni attributo (struct-of-arrays): chiavi, tipi, bias e indici
+delle funzioni dei neuroni; estremi, pesi e historical markings di sinapsi
+e gates. Copiarlo o serializzarlo costa quanto copiare qualche blocco di
+memoria.
+"""
+import numpy as np
+
+from ga_nets.fingerprint import from_genome
+from ga_nets.index import Indexer
+from ga_nets.neuron import NeuronType
+
+
+class ConnTable():
+    """Tabella di connessioni (sinapsi o gates)"""
+    __slots__ = ("from_keys", "to_keys", "weights", "enabled",
+                 "innovations", "genome")
+
+    def __init__(self, from_keys=(), to_keys=(), weights=(), enabled=None,
+                 innovations=None):
+        """Inizializza la tabella.
+
+        Args:
+          from_keys: Chiavi dei neuroni di partenza.
+          to_keys: Chiavi dei neuroni d'arrivo.
+          weights: Pesi delle connessioni.
+          enabled: Connessioni attive, di default tutte. Quelle disattivate
+                   restano nel genoma (es. per il crossover) ma non vengono
+                   create nella rete a oggetti.
+          innovations: Historical markings delle connessioni, -1 per quelle
+                       ancora da assegnare (vedi 'mark()'), di default tutte.
+        """
+        self.from_keys = np.array(from_keys, dtype=np.int64)
+        self.to_keys = np.array(to_keys, dtype=np.int64)
+        self.weights = np.array(weights, dtype=np.float64)
+        self.enabled = (np.ones(self.weights.size, dtype=bool)
+                        if enabled is None
+                        else np.array(enabled, dtype=bool))
+        self.innovations = (np.full(self.weights.size, -1, dtype=np.int64)
+                            if innovations is None
+                            else np.array(innovations, dtype=np.int64))
+
+        # Genoma al quale appartiene, segnalato dalle modifiche tramite le
+        # viste (vedi 'Genome.touch()')
+        self.genome = None
+
+    def __len__(self):
+        return self.weights.size
+
+    def __iter__(self):
+        """Restituisce le connessioni come viste"""
+        return (ConnView(self, i) for i in range(len(self)))
+
+    @classmethod
+    def from_conns(cls, conns):
+        """Crea la tabella dalle istanze delle connessioni.
+
+        Args:
+          conns: Registro o lista con le istanze delle connessioni.
+
+        Returns:
+          L'istanza della tabella.
+        """
+        conns = list(conns)
+        return cls([c.from_neuron.key for c in conns],
+                   [c.to_neuron.key for c in conns],
+                   [c.weight for c in conns],
+                   innovations=[c.innovation for c in conns])
+
+    def copy(self):
+        """Restituisce una copia della tabella"""
+        return ConnTable(self.from_keys, self.to_keys, self.weights,
+                         self.enabled, self.innovations)
+
+    def append(self, from_key, to_key, weight, enabled=True, innovation=-1):
+        """Aggiunge una connessione in fondo alla tabella.
+
+        Returns:
+          L'indice della nuova connessione.
+        """
+        self.from_keys = np.append(self.from_keys, from_key)
+        self.to_keys = np.append(self.to_keys, to_key)
+        self.weights = np.append(self.weights, weight)
+        self.enabled = np.append(self.enabled, enabled)
+        self.innovations = np.append(self.innovations, innovation)
+
+        return self.weights.size - 1
+
+    def mark(self, kind):
+        """Assegna gli historical markings alle connessioni che non li hanno
+        (es. tabelle create senza o lette da un file di una versione
+        precedente).
+
+        Args:
+          kind: Il tipo di connessione, 'synapse' o 'gate'.
+        """
+        missing = np.flatnonzero(self.innovations < 0)
+        if missing.size:
+            self.innovations[missing] = Indexer.get_innovations(
+                zip(self.from_keys[missing].tolist(),
+                    self.to_keys[missing].tolist()), kind)
+
+    def tolist(self):
+        """Connessioni attive nel formato di 'Network.get_synapses()'"""
+        enabled = self.enabled
+        return [conn
+                for conn, active in zip(zip(self.from_keys.tolist(),
+                                            self.to_keys.tolist(),
+                                            self.weights.tolist()),
+                                        enabled.tolist())
+                if active]
+
+    def torows(self):
+        """Connessioni attive come tuple (partenza, arrivo, peso,
+        innovazione), utilizzate per ricostruire la rete a oggetti"""
+        enabled = self.enabled
+        return zip(self.from_keys[enabled].tolist(),
+                   self.to_keys[enabled].tolist(),
+                   self.weights[enabled].tolist(),
+                   self.innovations[enabled].tolist())
+
+
+class ConnView():
+    """Vista su una connessione della tabella: espone gli stessi attributi di
+    'ga_nets.connection.Connection' ma tramite chiavi"""
+    __slots__ = ("__table", "__index")
+
+    def __init__(self, table, index):
+        self.__table = table
+        self.__index = index
+
+    def __str__(self):
+        return "From {} to {} (w: {})".format(self.from_key,
+                                              self.to_key,
+                                              self.weight)
+
+    @property
+    def from_key(self):
+        """Chiave del neurone di partenza"""
+        return int(self.__table.from_keys[self.__index])
+
+    @property
+    def to_key(self):
+        """Chiave del neurone d'arrivo"""
+        return int(self.__table.to_keys[self.__index])
+
+    @property
+    def innovation(self):
+        """Historical marking della connessione"""
+        return int(self.__table.innovations[self.__index])
+
+    @property
+    def weight(self):
+        """Getter del peso della connessione"""
+        return float(self.__table.weights[self.__index])
+
+    @weight.setter
+    def weight(self, weight):
+        self.__table.weights[self.__index] = weight
+        self.__touch()
+
+    @property
+    def enabled(self):
+        """Getter che indica se la connessione è attiva"""
+        return bool(self.__table.enabled[self.__index])
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self.__table.enabled[self.__index] = enabled
+        self.__touch()
+
+    def __touch(self):
+        """Segnala la modifica al genoma della tabella, se presente"""
+        if self.__table.genome is not None:
+            self.__table.genome.touch()
+
+
+class NeuronView():
+    """Vista su un neurone del genoma: espone gli stessi attributi di
+    'ga_nets.neuron.Neuron' leggendoli e scrivendoli negli array"""
+    __slots__ = ("__genome", "__index")
+
+    def __init__(self, genome, index):
+        self.__genome = genome
+        self.__index = index
+
+    def __str__(self):
+        return "#{} (t: {}, b: {})".format(self.key,
+                                           self.type.name,
+                                           self.bias)
+
+    @property
+    def key(self):
+        """Getter per l'indice del neurone"""
+        return int(self.__genome.keys[self.__index])
+
+    @property
+    def type(self):
+        """Getter per il tipo del neurone"""
+        return NeuronType(int(self.__genome.types[self.__index]))
+
+    @property
+    def bias(self):
+        """Getter per il bias del neurone"""
+        return float(self.__genome.biases[self.__index])
+
+    @bias.setter
+    def bias(self, bias):
+        self.__genome.biases[self.__index] = bias
+        self.__genome.touch()
+
+    @property
+    def squash(self):
+        """Getter per la funzione d'attivazione"""
+        return self.__genome.functions[self.__genome.squash[self.__index]]
+
+    @squash.setter
+    def squash(self, squash):
+        self.__genome.squash[self.__index] = self.__genome.get_fn_id(squash)
+        self.__genome.touch()
+
+    @property
+    def aggregation(self):
+        """Getter per la funzione d'aggregazione"""
+        fn_id = self.__genome.aggregation[self.__index]
+        return self.__genome.functions[fn_id]
+
+    @aggregation.setter
+    def aggregation(self, aggregation):
+        self.__genome.aggregation[self.__index] = \
+            self.__genome.get_fn_id(aggregation)
+        self.__genome.touch()
+
+
+class Genome():
+    """Genoma della rete neurale salvato in array tipizzati"""
+    __slots__ = ("network_class", "functions", "keys", "types", "biases",
+                 "squash", "aggregation", "synapses", "gates", "revision")
+
+    def __init__(self, network_class, functions, neurons, synapses,
+                 gates=None):
+        """Inizializza il genoma.
+
+        Args:
+          network_class: Classe della rete neurale (FeedForward, Recurrent).
+          functions: Lista con le funzioni utilizzate dai neuroni, indicizzate
+                     dagli id di 'squash' e 'aggregation'.
+          neurons: Tupla con le colonne dei neuroni: chiavi, tipi (il valore
+                   di 'NeuronType'), bias, id delle funzioni d'attivazione e
+                   id di quelle d'aggregazione.
+          synapses: Istanza di 'ConnTable' con le sinapsi.
+          gates: Istanza di 'ConnTable' con i gates, se presenti.
+        """
+        self.network_class = network_class
+        self.functions = list(functions)
+
+        keys, types, biases, squash, aggregation = neurons
+        self.keys = np.array(keys, dtype=np.int64)
+        self.types = np.array(types, dtype=np.int8)
+        self.biases = np.array(biases, dtype=np.float64)
+        self.squash = np.array(squash, dtype=np.int16)
+        self.aggregation = np.array(aggregation, dtype=np.int16)
+
+        self.synapses = synapses
+        self.gates = gates if gates is not None else ConnTable()
+        self.synapses.mark("synapse")
+        self.gates.mark("gate")
+        self.synapses.genome = self.gates.genome = self
+
+        # Contatore delle modifiche, come 'Network.revision'
+        self.revision = 0
+
+    def __len__(self):
+        return self.keys.size
+
+    @property
+    def neurons(self):
+        """Viste sui neuroni del genoma.
+
+        Returns:
+          Una lista con un'istanza di 'NeuronView' per ogni neurone.
+        """
+        return [NeuronView(self, i) for i in range(len(self))]
+
+    @property
+    def nbytes(self):
+        """Memoria occupata dagli array del genoma"""
+        return sum(array.nbytes
+                   for array in (self.keys, self.types, self.biases,
+                                 self.squash, self.aggregation,
+                                 self.synapses.from_keys,
+                                 self.synapses.to_keys,
+                                 self.synapses.weights,
+                                 self.synapses.enabled,
+                                 self.synapses.innovations,
+                                 self.gates.from_keys,
+                                 self.gates.to_keys,
+                                 self.gates.weights,
+                                 self.gates.enabled,
+                                 self.gates.innovations))
+
+    @property
+    def fingerprint(self):
+        """Impronta del genoma, calcolata con operazioni vettoriali.
+
+        Please see: @ga_nets.network.Network.fingerprint
+        """
+        return from_genome(self)
+
+    def touch(self):
+        """Segnala una modifica degli array: va chiamato da chi li modifica
+        sul posto (es. le mutazioni) per invalidare le cache che dipendono
+        dal genoma"""
+        self.revision += 1
+
+    def get_fn_id(self, function):
+        """Restituisce l'id della funzione, aggiungendola alla tabella se
+        assente.
+
+        Args:
+          function: La funzione d'attivazione o d'aggregazione.
+
+        Returns:
+          L'indice della funzione in 'functions'.
+        """
+        if function not in self.functions:
+            self.functions.append(function)
+
+        return self.functions.index(function)
+
+    def get_synapses(self):
+        """Please see: @ga_nets.network.Network.get_synapses()"""
+        return self.synapses.tolist()
+
+    def copy(self):
+        """Restituisce una copia del genoma duplicando solo gli array.
+
+        Returns:
+          L'istanza del nuovo genoma.
+        """
+        return Genome(self.network_class,
+                      self.functions,
+                      (self.keys, self.types, self.biases, self.squash,
+                       self.aggregation),
+                      self.synapses.copy(),
+                      self.gates.copy())
+
+    @classmethod
+    def from_network(cls, network):
+        """Crea il genoma di una rete neurale.
+
+        Args:
+          network: Istanza della rete neurale.
+
+        Returns:
+          L'istanza del genoma.
+        """
+        functions = {}
+        columns = ([], [], [], [], [])
+        for neuron in network.neurons.values():
+            columns[0].append(neuron.key)
+            columns[1].append(neuron.type.value)
+            columns[2].append(neuron.bias)
+            columns[3].append(functions.setdefault(neuron.squash,
+                                                   len(functions)))
+            columns[4].append(functions.setdefault(neuron.aggregation,
+                                                   len(functions)))
+
+        return cls(network.__class__,
+                   functions,
+                   columns,
+                   ConnTable.from_conns(network.synapses),
+                   ConnTable.from_conns(getattr(network, "gates", ())))
+
+    def to_network(self, traits=None):
+        """Ricostruisce la rete neurale a oggetti.
+
+        Args:
+          traits: Tratti della nuova rete, di default un dizionario vuoto.
+
+        Returns:
+          L'istanza della rete neurale.
+        """
+        network = self.network_class(traits if traits is not None else {})
+        network.load(self)
+
+        return network
@@ -10,27 +10,354 @@
 #    This isn't a free software, if you steal it... then, good for you.
 """Indexing di networks e neuroni"""
 from itertools import count
+import multiprocessing
+from multiprocessing.managers import BaseManager
+import os
+
+
+class Markings():
+    """Historical markings condivisi, conservati nel processo del manager:
+    una chiamata risolve più markings con un solo round trip"""
+    def __init__(self):
+        self.__values = {}
+
+    def assign(self, markings, first):
+        """Restituisce gli indici dei markings, assegnando a quelli nuovi
+        gli indici consecutivi a partire da 'first'.
+
+        Args:
+          markings: Lista di tuple che identificano le modifiche.
+          first: Il primo indice libero.
+
+        Returns:
+          Una tupla con la lista degli indici e il numero di quelli nuovi.
+        """
+        values = []
+        size = 0
+        for marking in markings:
+            value = self.__values.get(marking)
+            if value is None:
+                value = self.__values[marking] = first + size
+                size += 1
+            values.append(value)
+
+        return values, size
+
+    def clear(self):
+        """Dimentica tutti i markings"""
+        self.__values.clear()
+
+
+class MarkingsManager(BaseManager):
+    """Manager che ospita i 'Markings' condivisi"""
+
+
+MarkingsManager.register("Markings", Markings)
+
+
+class SharedCounters():
+    """Contatori condivisi fra processi: ogni processo ne riserva un blocco
+    di indici per volta, così il lock viene acquisito solo quando il blocco
+    è esaurito.
+
+    Contengono anche gli historical markings (vedi 'Indexer.get_marking()')
+    nel processo di un manager, consultato solo per i markings che non sono
+    già nella cache del processo. Dopo 'reset_markings()' le cache di tutti
+    i processi vengono svuotate al primo utilizzo.
+
+    L'istanza va creata nel processo principale e passata ai worker (es.
+    tramite l'initializer del pool, vedi 'Indexer.share()'): vengono
+    inviati solo i contatori e il proxy dei markings, quindi funziona con
+    tutti i metodi d'avvio dei processi, purché il pool usi lo stesso
+    contesto.
+    """
+    def __init__(self, names=("network", "synapse", "neuron"), start=0,
+                 markings=True, ctx=None):
+        """Inizializza i contatori.
+
+        Args:
+          names: I nomi delle chiavi condivise.
+          start: Il primo indice di ogni contatore.
+          markings: Se True condivide anche gli historical markings (avvia
+                    il processo del manager), altrimenti restano locali a
+                    ogni processo.
+          ctx: Contesto di multiprocessing (es. 'get_context("spawn")'),
+               di default quello predefinito.
+        """
+        ctx = ctx or multiprocessing.get_context()
+        self.names = tuple(names)
+        self.__values = ctx.Array("q", [start] * len(names))
+        self.__epoch = ctx.Value("q", 0, lock=False)
+
+        self.__manager = None
+        self.markings = None
+        if markings:
+            self.__manager = MarkingsManager(ctx=ctx)
+            self.__manager.start()
+            self.markings = self.__manager.Markings()
+
+    def __getstate__(self):
+        # Il manager resta al processo che l'ha avviato
+        state = self.__dict__.copy()
+        state["_SharedCounters__manager"] = None
+        return state
+
+    @property
+    def epoch(self):
+        """Numero di chiamate a 'reset_markings()'"""
+        return self.__epoch.value
+
+    def reserve(self, key, size, floor=0):
+        """Riserva un blocco di indici.
+
+        Args:
+          key: Il nome della chiave.
+          size: La dimensione del blocco.
+          floor: Valore minimo del primo indice.
+
+        Returns:
+          Il primo indice del blocco: sono riservati quelli fino a
+          'first + size' escluso.
+        """
+        i = self.names.index(key)
+        with self.__values.get_lock():
+            first = max(self.__values[i], floor)
+            self.__values[i] = first + size
+
+        return first
+
+    def mark(self, marking, key, floor=0):
+        """Restituisce l'indice condiviso di un historical marking,
+        assegnandone uno nuovo se il marking è sconosciuto a tutti i
+        processi.
+
+        Args:
+          marking: Tupla che identifica la modifica strutturale.
+          key: Il nome della chiave dalla quale prendere i nuovi indici.
+          floor: Valore minimo di un nuovo indice.
+
+        Returns:
+          L'indice del marking.
+        """
+        return self.mark_many([marking], key, floor)[0]
+
+    def mark_many(self, markings, key, floor=0):
+        """Come 'mark()' per più markings, con un solo round trip verso il
+        manager.
+
+        Args:
+          markings: Lista di tuple che identificano le modifiche.
+          key: Il nome della chiave dalla quale prendere i nuovi indici.
+          floor: Valore minimo di un nuovo indice.
+
+        Returns:
+          La lista degli indici nell'ordine dei markings.
+        """
+        i = self.names.index(key)
+        with self.__values.get_lock():
+            first = max(self.__values[i], floor)
+            values, size = self.markings.assign(list(markings), first)
+            if size:
+                self.__values[i] = first + size
+
+        return values
+
+    def reset_markings(self):
+        """Dimentica gli historical markings condivisi"""
+        with self.__values.get_lock():
+            self.markings.clear()
+            self.__epoch.value += 1
 
 
 class Indexer():
     """Gestisce le chiavi """
     indexes = {}
 
+    # Contatori condivisi e blocchi riservati dal processo corrente
+    counters = None
+    block_size = 1024
+    blocks = {}
+    pid = None
+
+    # Cache degli historical markings: marking -> indice, valida finché
+    # l'epoca dei contatori condivisi non cambia
+    innovations = {}
+    epoch = 0
+
     @classmethod
     def get_id(cls, key):
         """Restituisce un indice.
 
+        Se la chiave è condivisa (vedi 'share()') l'indice è univoco fra
+        tutti i processi, altrimenti solo all'interno del processo corrente.
+
         Args:
           key: Il nome della chiave del dizionario.
 
         Returns:
           Il contatore incrementato di una unità.
         """
+        if cls.counters is not None and key in cls.counters.names:
+            return cls.__get_shared_id(key)
+
         if key not in cls.indexes:
             cls.reset(key)
 
         return next(cls.indexes[key])
 
+    @classmethod
+    def __get_shared_id(cls, key):
+        """Restituisce il prossimo indice del blocco, riservandone uno nuovo
+        se esaurito"""
+        # Dopo un fork i blocchi ereditati appartengono al processo padre
+        if cls.pid != os.getpid():
+            cls.pid = os.getpid()
+            cls.blocks = {}
+            cls.innovations = {}
+
+        block = cls.blocks.get(key)
+        if block is None or block[0] == block[1]:
+            first = cls.counters.reserve(key, cls.block_size)
+            block = cls.blocks[key] = [first, first + cls.block_size]
+
+        block[0] += 1
+        return block[0] - 1
+
+    @classmethod
+    def get_marking(cls, marking, key, floor=0):
+        """Restituisce l'historical marking di una modifica strutturale: la
+        stessa modifica riceve lo stesso indice, mentre quelle nuove
+        ricevono indici univoci dalla chiave indicata.
+
+        Se i contatori condivisi contengono i markings (vedi 'share()') gli
+        indici sono gli stessi in tutti i processi, altrimenti solo
+        all'interno del processo corrente.
+
+        Args:
+          marking: Tupla che identifica la modifica (es. il tipo e gli
+                   estremi di una connessione).
+          key: Il nome della chiave dalla quale prendere i nuovi indici.
+          floor: Valore minimo di un nuovo indice (es. per non riutilizzare
+                 le chiavi dei neuroni di un genoma).
+
+        Returns:
+          L'indice del marking.
+        """
+        cls.__check_innovations()
+
+        value = cls.innovations.get(marking)
+        if value is not None:
+            return value
+
+        counters = cls.counters
+        if (counters is not None and counters.markings is not None
+                and key in counters.names):
+            value = counters.mark(marking, key, floor)
+        else:
+            value = cls.get_id(key)
+            shared = counters is not None and key in counters.names
+            if value < floor and shared:
+                value = counters.reserve(key, 1, floor)
+            elif value < floor:
+                value = floor
+                cls.indexes[key] = count(floor + 1)
+
+        cls.innovations[marking] = value
+        return value
+
+    @classmethod
+    def get_innovation(cls, from_key, to_key, kind="synapse"):
+        """Restituisce l'historical marking di una connessione: la stessa
+        coppia di neuroni riceve lo stesso indice, separatamente per
+        sinapsi e gates.
+
+        Args:
+          from_key: Chiave del neurone di partenza.
+          to_key: Chiave del neurone d'arrivo.
+          kind: Il tipo di connessione, 'synapse' o 'gate'.
+
+        Returns:
+          L'indice della connessione.
+        """
+        return cls.get_marking((kind, from_key, to_key), "synapse")
+
+    @classmethod
+    def get_markings(cls, markings, key, floor=0):
+        """Come 'get_marking()' per più markings: quelli assenti dalla
+        cache vengono richiesti ai contatori condivisi con una sola chiamata
+        al manager.
+
+        Args:
+          markings: Iterabile di tuple che identificano le modifiche.
+          key: Il nome della chiave dalla quale prendere i nuovi indici.
+          floor: Valore minimo di un nuovo indice.
+
+        Returns:
+          La lista degli indici nell'ordine dei markings.
+        """
+        markings = list(markings)
+        cls.__check_innovations()
+
+        innovations = cls.innovations
+        missing = [marking for marking in dict.fromkeys(markings)
+                   if marking not in innovations]
+
+        counters = cls.counters
+        if (missing and counters is not None
+                and counters.markings is not None
+                and key in counters.names):
+            innovations.update(zip(missing,
+                                   counters.mark_many(missing, key, floor)))
+        else:
+            for marking in missing:
+                cls.get_marking(marking, key, floor)
+
+        return [innovations[marking] for marking in markings]
+
+    @classmethod
+    def get_innovations(cls, pairs, kind="synapse"):
+        """Come 'get_innovation()' per più connessioni.
+
+        Args:
+          pairs: Iterabile di tuple (partenza, arrivo).
+          kind: Il tipo di connessione, 'synapse' o 'gate'.
+
+        Returns:
+          La lista degli indici nell'ordine delle coppie.
+        """
+        return cls.get_markings([(kind, from_key, to_key)
+                                 for from_key, to_key in pairs], "synapse")
+
+    @classmethod
+    def __check_innovations(cls):
+        """Svuota la cache dei markings ereditata da un altro processo o
+        resa obsoleta da 'reset_innovations()' in un altro processo"""
+        if cls.pid != os.getpid():
+            cls.pid = os.getpid()
+            cls.blocks = {}
+            cls.innovations = {}
+
+        counters = cls.counters
+        if counters is not None and counters.epoch != cls.epoch:
+            cls.epoch = counters.epoch
+            cls.innovations = {}
+
+    @classmethod
+    def share(cls, counters, block_size=1024):
+        """Utilizza i contatori condivisi per le loro chiavi.
+
+        Args:
+          counters: Istanza di 'SharedCounters' o None per tornare ai
+                    contatori locali.
+          block_size: Numero di indici riservati per volta.
+        """
+        cls.counters = counters
+        cls.block_size = block_size
+        cls.blocks = {}
+        cls.innovations = {}
+        cls.epoch = counters.epoch if counters is not None else 0
+        cls.pid = os.getpid()
+
     @classmethod
     def reset(cls, key):
         """Resetta il contatore.
@@ -40,3 +367,17 @@ class Indexer():
                contatore.
         """
         cls.indexes[key] = count(0)
+
+    @classmethod
+    def reset_innovations(cls):
+        """Dimentica gli historical markings: le stesse modifiche
+        riceveranno nuovi indici. Va chiamato a ogni generazione (vedi
+        'ga_nets.mutation.Mutator'), altrimenti la cache cresce con tutte le
+        modifiche avvenute.
+
+        Con i contatori condivisi va chiamato quando i worker sono inattivi:
+        le loro cache vengono svuotate al successivo utilizzo."""
+        cls.innovations = {}
+        if cls.counters is not None and cls.counters.markings is not None:
+            cls.counters.reset_markings()
+            cls.epoch = cls.counters.epoch
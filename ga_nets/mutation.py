@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Mutazioni applicate ai genomi di un'intera popolazione.
+
+Le mutazioni dei valori (pesi e bias) concatenano gli array di tutti i
+genomi e li modificano con poche operazioni vettoriali; quelle strutturali
+(nuovo neurone e nuova sinapsi) lavorano su un genoma per volta e, nei
+feedforward, scartano le sinapsi che creerebbero un ciclo tramite un indice
+di raggiungibilità, senza ricalcolare i layers.
+
+I genomi vengono modificati sul posto (e segnalati con 'Genome.touch()'):
+quelli condivisi (es. restituiti da 'Network.snapshot()') vanno prima
+copiati con 'Genome.copy()'.
+"""
+import numpy as np
+
+from ga_nets.functions import get_fn
+from ga_nets.index import Indexer
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.neuron import NeuronType
+
+
+def get_rng(rng=None):
+    """Restituisce un generatore numpy (accetta anche un seme)"""
+    if isinstance(rng, np.random.Generator):
+        return rng
+
+    return np.random.default_rng(rng)
+
+
+def get_counts(mask, sizes):
+    """Conta i valori selezionati di ogni array concatenato.
+
+    Args:
+      mask: Array booleano con i valori di tutti gli array.
+      sizes: Lista con le dimensioni degli array.
+
+    Returns:
+      Un array con il numero di valori selezionati per ogni array.
+    """
+    totals = np.concatenate(([0], np.cumsum(mask)))
+    ends = np.cumsum(sizes)
+
+    return totals[ends] - totals[ends - sizes]
+
+
+def perturb(arrays, rate, power, replace_rate=0., limit=None, rng=None,
+            split=False):
+    """Perturba o sostituisce i valori di più array con una sola operazione.
+
+    Args:
+      arrays: Lista degli array da modificare sul posto.
+      rate: Probabilità che un valore venga perturbato.
+      power: Deviazione standard della perturbazione gaussiana.
+      replace_rate: Probabilità che un valore venga sostituito da uno nuovo
+                    (estratto dalla gaussiana con deviazione 'power' * 2),
+                    valutata prima della perturbazione.
+      limit: Valore assoluto massimo, None per non limitare.
+      rng: Generatore numpy o seme.
+      split: Se True restituisce il numero di valori modificati di ogni
+             array (es. per segnalare solo i genomi modificati).
+
+    Returns:
+      Il numero di valori modificati.
+    """
+    rng = get_rng(rng)
+    sizes = [array.size for array in arrays]
+    if not sum(sizes):
+        return np.zeros(len(arrays), dtype=np.int64) if split else 0
+
+    values = np.concatenate(arrays)
+    draw = rng.random(values.size)
+
+    replaced = draw < replace_rate
+    perturbed = ~replaced & (draw < replace_rate + rate)
+
+    values[perturbed] += rng.normal(0., power, perturbed.sum())
+    values[replaced] = rng.normal(0., power * 2, replaced.sum())
+    if limit is not None:
+        np.clip(values, -limit, limit, out=values)
+
+    for array, chunk in zip(arrays, np.split(values, np.cumsum(sizes)[:-1])):
+        array[:] = chunk
+
+    changed = perturbed | replaced
+    if split:
+        return get_counts(changed, sizes)
+
+    return int(changed.sum())
+
+
+def toggle(tables, rate, rng=None, split=False):
+    """Inverte lo stato (attiva o disattivata) delle connessioni.
+
+    Args:
+      tables: Lista con le istanze di 'ga_nets.genome.ConnTable'.
+      rate: Probabilità che una connessione venga invertita.
+      rng: Generatore numpy o seme.
+      split: Please see: @ga_nets.mutation.perturb()
+
+    Returns:
+      Il numero di connessioni invertite.
+    """
+    rng = get_rng(rng)
+    sizes = [len(table) for table in tables]
+    if not sum(sizes):
+        return np.zeros(len(tables), dtype=np.int64) if split else 0
+
+    flips = rng.random(sum(sizes)) < rate
+    for table, chunk in zip(tables, np.split(flips, np.cumsum(sizes)[:-1])):
+        table.enabled ^= chunk
+
+    if split:
+        return get_counts(flips, sizes)
+
+    return int(flips.sum())
+
+
+class Reachability():
+    """Indice delle sinapsi di un genoma per verificare, visitando solo la
+    regione a valle, se una nuova sinapsi creerebbe un ciclo.
+
+    Contiene anche le sinapsi disattivate: una sinapsi che chiude un ciclo
+    con una di esse viene scartata, così 'toggle()' può riattivarle senza
+    ulteriori controlli."""
+    def __init__(self, genome):
+        """Costruisce l'indice.
+
+        Args:
+          genome: Istanza di 'ga_nets.genome.Genome'.
+        """
+        self.targets = {}
+        table = genome.synapses
+        for from_key, to_key in zip(table.from_keys.tolist(),
+                                    table.to_keys.tolist()):
+            self.targets.setdefault(from_key, []).append(to_key)
+
+    def add(self, from_key, to_key):
+        """Aggiorna l'indice con una nuova sinapsi"""
+        self.targets.setdefault(from_key, []).append(to_key)
+
+    def reaches(self, from_key, to_key):
+        """Verifica se esiste un percorso da un neurone a un altro.
+
+        Returns:
+          True se 'to_key' è raggiungibile da 'from_key'.
+        """
+        visited = {from_key}
+        stack = [from_key]
+        while stack:
+            key = stack.pop()
+            if key == to_key:
+                return True
+            for target in self.targets.get(key, ()):
+                if target not in visited:
+                    visited.add(target)
+                    stack.append(target)
+
+        return False
+
+    def creates_cycle(self, from_key, to_key):
+        """Vero se la sinapsi da 'from_key' a 'to_key' chiuderebbe un
+        ciclo"""
+        return self.reaches(to_key, from_key)
+
+
+def add_connection(genome, rng=None, attempts=20, reachability=None,
+                   power=1.):
+    """Aggiunge una sinapsi fra due neuroni non ancora connessi.
+
+    Nei feedforward le sinapsi non partono dagli output, non arrivano agli
+    input e non possono creare cicli.
+
+    Args:
+      genome: Istanza di 'ga_nets.genome.Genome'.
+      rng: Generatore numpy o seme.
+      attempts: Coppie estratte prima di rinunciare.
+      reachability: Istanza di 'Reachability' da riutilizzare (viene
+                    aggiornata), di default ne viene costruita una.
+      power: Deviazione standard del peso della nuova sinapsi.
+
+    Returns:
+      Una tupla (partenza, arrivo) con la sinapsi creata o None.
+    """
+    rng = get_rng(rng)
+    feedforward = issubclass(genome.network_class, FeedForward)
+
+    types = genome.types
+    sources = genome.keys
+    if feedforward:
+        sources = genome.keys[types != NeuronType.OUTPUT.value]
+    targets = genome.keys[types != NeuronType.INPUT.value]
+    if not sources.size or not targets.size:
+        return None
+
+    table = genome.synapses
+    existing = set(zip(table.from_keys.tolist(), table.to_keys.tolist()))
+    if feedforward and reachability is None:
+        reachability = Reachability(genome)
+
+    for _ in range(attempts):
+        pair = (int(rng.choice(sources)), int(rng.choice(targets)))
+        if pair in existing:
+            continue
+        if feedforward and (pair[0] == pair[1]
+                            or reachability.creates_cycle(*pair)):
+            continue
+
+        table.append(pair[0], pair[1], rng.normal(0., power),
+                     innovation=Indexer.get_innovation(*pair))
+        genome.touch()
+        if reachability is not None:
+            reachability.add(*pair)
+        return pair
+
+    return None
+
+
+def add_node(genome, rng=None, squash="tanh", aggregation="sum",
+             reachability=None):
+    """Divide una sinapsi attiva inserendo un nuovo neurone hidden: la
+    sinapsi viene disattivata e sostituita da una con peso 1 verso il
+    neurone e da una con il peso originale in uscita.
+
+    Args:
+      genome: Istanza di 'ga_nets.genome.Genome'.
+      rng: Generatore numpy o seme.
+      squash: Funzione d'attivazione (o nome) del nuovo neurone.
+      aggregation: Funzione d'aggregazione (o nome) del nuovo neurone.
+      reachability: Istanza di 'Reachability' da aggiornare, se utilizzata
+                    anche per 'add_connection()'.
+
+    Returns:
+      La chiave del nuovo neurone o None se non ci sono sinapsi attive.
+    """
+    rng = get_rng(rng)
+    table = genome.synapses
+    candidates = np.flatnonzero(table.enabled)
+    if not candidates.size:
+        return None
+
+    index = int(rng.choice(candidates))
+    table.enabled[index] = False
+
+    # La chiave è l'historical marking della divisione: i genomi che
+    # dividono la stessa sinapsi ricevono lo stesso neurone, divisioni
+    # diverse neuroni diversi (vedi 'ga_nets.crossover').
+    innovation = int(table.innovations[index])
+    floor = int(genome.keys.max()) + 1
+    marking = ("split", innovation)
+    key = Indexer.get_marking(marking, "neuron", floor)
+    while key in genome.keys:
+        # Sinapsi già divisa (e poi riattivata) o chiave usata altrove
+        marking += (key,)
+        key = Indexer.get_marking(marking, "neuron", floor)
+
+    genome.keys = np.append(genome.keys, key)
+    genome.types = np.append(genome.types, NeuronType.HIDDEN.value)
+    genome.biases = np.append(genome.biases, 0.)
+    genome.squash = np.append(genome.squash,
+                              genome.get_fn_id(get_fn(squash)))
+    genome.aggregation = np.append(genome.aggregation,
+                                   genome.get_fn_id(get_fn(aggregation)))
+
+    from_key, to_key = int(table.from_keys[index]), int(table.to_keys[index])
+    table.append(from_key, key, 1.,
+                 innovation=Indexer.get_innovation(from_key, key))
+    table.append(key, to_key, float(table.weights[index]),
+                 innovation=Indexer.get_innovation(key, to_key))
+    genome.touch()
+    if reachability is not None:
+        reachability.add(from_key, key)
+        reachability.add(key, to_key)
+
+    return key
+
+
+class Mutator():
+    """Applica le mutazioni a un'intera popolazione di genomi"""
+    def __init__(self, weight_rate=.8, weight_power=.5, weight_replace=.1,
+                 bias_rate=.7, bias_power=.5, bias_replace=.1, limit=30.,
+                 toggle_rate=.01, conn_rate=.05, node_rate=.03,
+                 squash="tanh", aggregation="sum", seed=None,
+                 reset_innovations=True):
+        """Inizializza le probabilità delle mutazioni.
+
+        Args:
+          weight_rate: Probabilità di perturbare il peso di una connessione
+                       (sinapsi e gates).
+          weight_power: Deviazione standard della perturbazione dei pesi.
+          weight_replace: Probabilità di sostituire un peso.
+          bias_rate: Probabilità di perturbare un bias.
+          bias_power: Deviazione standard della perturbazione dei bias.
+          bias_replace: Probabilità di sostituire un bias.
+          limit: Valore assoluto massimo di pesi e bias.
+          toggle_rate: Probabilità di attivare o disattivare una sinapsi.
+          conn_rate: Probabilità per genoma di aggiungere una sinapsi.
+          node_rate: Probabilità per genoma di aggiungere un neurone.
+          squash: Funzione d'attivazione dei nuovi neuroni.
+          aggregation: Funzione d'aggregazione dei nuovi neuroni.
+          seed: Seme del generatore casuale.
+          reset_innovations: Se True ogni chiamata a 'mutate()' è una nuova
+                             generazione: gli historical markings della
+                             precedente vengono dimenticati (vedi
+                             'Indexer.reset_innovations()'), così la loro
+                             cache non cresce senza limite.
+        """
+        self.weight_rate = weight_rate
+        self.weight_power = weight_power
+        self.weight_replace = weight_replace
+        self.bias_rate = bias_rate
+        self.bias_power = bias_power
+        self.bias_replace = bias_replace
+        self.limit = limit
+        self.toggle_rate = toggle_rate
+        self.conn_rate = conn_rate
+        self.node_rate = node_rate
+        self.squash = squash
+        self.aggregation = aggregation
+        self.reset_innovations = reset_innovations
+
+        self.rng = get_rng(seed)
+
+    def mutate(self, genomes):
+        """Muta i genomi sul posto.
+
+        Args:
+          genomes: Lista con le istanze di 'ga_nets.genome.Genome'.
+
+        Returns:
+          Un dizionario con il numero di mutazioni di ogni tipo.
+        """
+        rng = self.rng
+        counts = {}
+
+        # Le stesse modifiche nella stessa generazione ricevono lo stesso
+        # marking
+        if self.reset_innovations:
+            Indexer.reset_innovations()
+
+        # Le mutazioni strutturali segnalano da sole i genomi modificati
+        for i in np.flatnonzero(rng.random(len(genomes)) < self.node_rate):
+            counts["node"] = counts.get("node", 0) + (
+                add_node(genomes[i], rng, self.squash, self.aggregation)
+                is not None)
+        for i in np.flatnonzero(rng.random(len(genomes)) < self.conn_rate):
+            counts["conn"] = counts.get("conn", 0) + (
+                add_connection(genomes[i], rng) is not None)
+
+        tables = [table
+                  for genome in genomes
+                  for table in (genome.synapses, genome.gates)]
+        weights = perturb([table.weights for table in tables],
+                          self.weight_rate, self.weight_power,
+                          self.weight_replace, self.limit, rng, split=True)
+        biases = perturb([genome.biases for genome in genomes],
+                         self.bias_rate, self.bias_power, self.bias_replace,
+                         self.limit, rng, split=True)
+        toggles = toggle([genome.synapses for genome in genomes],
+                         self.toggle_rate, rng, split=True)
+
+        counts["weight"] = int(weights.sum())
+        counts["bias"] = int(biases.sum())
+        counts["toggle"] = int(toggles.sum())
+
+        # Solo i genomi modificati invalidano le cache (es. la speciazione)
+        changed = (weights.reshape(-1, 2).sum(axis=1) + biases + toggles
+                   if genomes else ())
+        for genome, count in zip(genomes, changed):
+            if count:
+                genome.touch()
+
+        return counts
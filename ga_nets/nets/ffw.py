@@ -10,8 +10,9 @@
 #    This isn't a free software, if you steal it... then, good for you.
 """Feedforward Neural Network"""
 # pylint: disable=too-few-public-methods
+from ga_nets.compiled.ffw import FFWPlan
 from ga_nets.connection import SynapseDirection
-from ga_nets.neuron import Neuron
+from ga_nets.neuron import Neuron, NeuronType
 from ga_nets.network import Network
 
 
@@ -20,17 +21,284 @@ class FeedForward(Network):
     def __init__(self, traits):
         super().__init__(traits, FFWNeuron)
 
+        # Buffer con lo stato di ogni neurone, indicizzato dalla posizione
+        # nei layers e riutilizzato da tutte le chiamate ad 'activate()'.
+        self.__buffer = []
+        self.__order = []
+        self.__outputs = []
+        self.__revision = None
+        self.__fanins = 0  # Sinapsi valutate per ogni riga
+
+        # Modalità incrementale: True se il buffer contiene gli stati
+        # dell'ultima riga attivata, figli di ogni posizione e neuroni a
+        # valle di ogni input (calcolati al primo cambiamento dell'input).
+        self.__valid = False
+        self.__children = None
+        self.__downstream = {}
+
+    def activate(self, features, incremental=False):
+        """Attiva la rete neurale mantenendo gli stati in un unico buffer
+        preallocato, senza allocare liste per ogni neurone.
+
+        Il buffer appartiene alla rete, quindi non può essere attivata da più
+        thread contemporaneamente: in quel caso va condiviso il piano
+        restituito da 'compile()'.
+
+        Args:
+          features: Please see: @ga_nets.network.Network.activate()
+          incremental: Se True ogni riga riutilizza gli stati della riga
+                       precedente (anche della chiamata precedente) e
+                       ricalcola, nell'ordine dei layers, solo i neuroni a
+                       valle degli input cambiati. Gli output sono gli stessi
+                       dell'attivazione completa. Dopo una modifica della
+                       rete o 'clear()' la prima riga viene calcolata per
+                       intero.
+
+        Please see: @ga_nets.network.Network.activate()
+        """
+        if len(features[0]) != self.num_inputs:
+            raise ValueError("Features' number is wrong.")
+
+        stats = self.stats
+        if stats is not None:
+            stats.start()
+
+        if self.__revision != self.revision:
+            self.__prepare()
+        if stats is not None:
+            stats.lap("layers")
+
+        buffer = self.__buffer
+        num_inputs = len(features[0])
+
+        order = self.__order
+        neuron_evals = synapse_evals = 0
+
+        outputs = []
+        for feature in features:
+            neurons = order
+            if incremental and self.__valid:
+                neurons = self.__get_changed(feature)
+            buffer[:num_inputs] = feature
+            if stats is not None:
+                stats.lap("inputs")
+
+            for neuron in neurons:
+                neuron.activate()
+            self.__valid = True
+            if stats is not None:
+                stats.lap("neurons")
+                neuron_evals += len(neurons)
+                synapse_evals += (self.__fanins if neurons is order
+                                  else sum(len(n.fanin) for n in neurons))
+
+            outputs.append([buffer[o] for o in self.__outputs])
+            if stats is not None:
+                stats.lap("outputs")
+
+        if stats is not None:
+            stats.activations += 1
+            stats.rows += len(features)
+            stats.neuron_evals += neuron_evals
+            stats.synapse_evals += synapse_evals
+            stats.add_layers(self.layers)
+
+        return outputs
+
+    def __get_changed(self, feature):
+        """Neuroni da ricalcolare per una nuova riga in modalità
+        incrementale.
+
+        Args:
+          feature: La riga con i nuovi input.
+
+        Returns:
+          La lista dei neuroni a valle degli input cambiati, nell'ordine
+          d'attivazione.
+        """
+        buffer = self.__buffer
+        changed = [i for i, value in enumerate(feature) if buffer[i] != value]
+        if not changed:
+            return []
+
+        downstream = [self.__get_downstream(i) for i in changed]
+        if len(downstream) == 1:
+            return downstream[0]
+
+        # Unione ordinata per posizione nel buffer
+        neurons = {n.position: n for d in downstream for n in d}
+        return [neurons[position] for position in sorted(neurons)]
+
+    def __get_downstream(self, position):
+        """Neuroni raggiungibili da un input tramite le sinapsi utilizzate
+        nell'attivazione.
+
+        Args:
+          position: Posizione dell'input nel buffer.
+
+        Returns:
+          La lista dei neuroni, nell'ordine d'attivazione.
+        """
+        downstream = self.__downstream.get(position)
+        if downstream is not None:
+            return downstream
+
+        order = self.__order
+        offset = len(self.__buffer) - len(order)
+        if self.__children is None:
+            self.__children = [[] for _ in self.__buffer]
+            for neuron in order:
+                for src, _ in neuron.fanin:
+                    self.__children[src].append(neuron.position)
+
+        visited = set()
+        stack = [position]
+        while stack:
+            for child in self.__children[stack.pop()]:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
+
+        downstream = [order[child - offset] for child in sorted(visited)]
+        self.__downstream[position] = downstream
+
+        return downstream
+
+    def get_evals(self, positions, rows):
+        """Conta le sinapsi valutate: solo quelle provenienti da neuroni
+        attivati prima, contate durante la preparazione del buffer.
+
+        Please see: @ga_nets.network.Network.get_evals()
+        """
+        if self.__revision != self.revision:
+            self.__prepare()
+
+        return self.__fanins * rows, 0
+
+    def clear(self):
+        """Resetta gli stati dei neuroni senza riallocare il buffer"""
+        buffer = self.__buffer
+        for i in range(len(buffer)):
+            buffer[i] = None
+        self.__valid = False
+
+    def __prepare(self):
+        """Assegna a ogni neurone la sua posizione nel buffer e le posizioni
+        dei neuroni che lo alimentano. Viene rieseguito solo se la rete è
+        stata modificata."""
+        layers = self.layers
+        positions = {key: i
+                     for i, key in enumerate(k for l in layers for k in l)}
+
+        if len(self.__buffer) != len(positions):
+            self.__buffer = [None] * len(positions)
+
+        self.__order = []
+        self.__fanins = 0
+        for neuron in self.neurons.values():
+            self.__fanins += neuron.prepare(self.__buffer, positions)
+            if (neuron.type is not NeuronType.INPUT
+                    and neuron.key in positions):
+                self.__order.append(neuron)
+
+        self.__order.sort(key=lambda n: positions[n.key])
+        self.__outputs = [positions[key] for key in layers[-1]]
+        self.__revision = self.revision
+
+        self.__valid = False
+        self.__children = None
+        self.__downstream = {}
+
+    def compile(self, prune=True):
+        """Compila la rete neurale in un piano d'esecuzione vettorizzato.
+
+        Args:
+          prune: Please see: @ga_nets.compiled.ffw.FFWPlan.__init__()
+
+        Returns:
+          L'istanza di 'FFWPlan' che restituisce gli stessi output di
+          'activate()'.
+        """
+        return FFWPlan(self, prune)
+
 
 class FFWNeuron(Neuron):
     """Wrapper per i neuroni nei feedforward networks"""
+    __slots__ = ("__buffer", "__position", "__fanin")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # Assegnati da 'FeedForward' prima dell'attivazione
+        self.__buffer = None
+        self.__position = None
+        self.__fanin = ()
+
+    @property
+    def state(self):
+        """Vista in sola lettura sul buffer della rete, mantenuta per il
+        debug. Lo stato si modifica solo assegnando una nuova sequenza, non
+        con 'append()'.
+
+        Returns:
+          Una tupla vuota o con lo stato dell'ultima riga attivata."""
+        if self.__position is None:
+            return ()
+
+        value = self.__buffer[self.__position]
+        return () if value is None else (value,)
+
+    @state.setter
+    def state(self, state):
+        if self.__position is not None:
+            self.__buffer[self.__position] = state[-1] if state else None
+
+    @property
+    def position(self):
+        """Getter per la posizione nel buffer della rete, None se il neurone
+        non è nei layers"""
+        return self.__position
+
+    @property
+    def fanin(self):
+        """Getter per le tuple (posizione, peso) delle sinapsi utilizzate
+        nell'attivazione"""
+        return self.__fanin
+
+    def prepare(self, buffer, positions):
+        """Collega il neurone al buffer della rete.
+
+        Vengono considerati solo i neuroni attivati prima di questo, quindi
+        con una posizione inferiore nel buffer.
+
+        Args:
+          buffer: La lista con gli stati dei neuroni della rete.
+          positions: Dizionario con la posizione di ogni neurone nei layers.
+
+        Returns:
+          Il numero di sinapsi utilizzate dal neurone.
+        """
+        self.__buffer = buffer
+        self.__position = positions.get(self.key)
+
+        fanin = []
+        if self.__position is not None:
+            for synapse in self.synapses[SynapseDirection.IN.value]:
+                src = positions.get(synapse.from_neuron.key)
+                if src is not None and src < self.__position:
+                    fanin.append((src, synapse.weight))
+        self.__fanin = tuple(fanin)
+
+        return len(fanin)
+
     def activate(self):
         """Please see: @fsneat.architecture.network.Network.activate()"""
-        states = [s.from_neuron.state[0] * s.weight
-                  for s in self.synapses[SynapseDirection.IN.value]
-                  if s.from_neuron.state]
+        buffer = self.__buffer
+        states = [buffer[src] * weight for src, weight in self.__fanin]
 
         # Per evitare errori dati dal min() e max()
         if not states:
             states.append(0)
 
-        self.state.append(self.squash(self.aggregation(states) + self.bias))
+        buffer[self.__position] = self.squash(self.aggregation(states)
+                                              + self.bias)
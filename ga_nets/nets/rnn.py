@@ -9,8 +9,10 @@
 #
 #    This isn't a free software, if you steal it... then, good for you.
 """Recurrent Neural Network"""
-from ga_nets.connection import (AlreadyConn, GateDirection, is_connected,
-                                Synapse, SynapseDirection)
+from ga_nets.compiled.rnn import RNNPlan
+from ga_nets.connection import (AlreadyConn, ConnRegistry, Gate,
+                                GateDirection, is_connected, SynapseDirection)
+from ga_nets.fingerprint import get_conn_terms
 from ga_nets.neuron import Neuron
 from ga_nets.network import Network
 
@@ -23,7 +25,7 @@ class Recurrent(Network):
         # L'indice è il neurone di partenza e la chiave è una lista con i
         # neuroni d'uscita
         # self.__gates = {}
-        self.__gates = []
+        self.__gates = ConnRegistry()
 
     def __str__(self):
         """Aggiunge le informazioni sui gates"""
@@ -49,13 +51,83 @@ class Recurrent(Network):
         """Getter dei gates della connessione.
 
         Returns:
-          La lista con i gates.
+          Il registro con i gates, iterabile come una lista.
         """
+        self.materialize()
         return self.__gates
 
     @gates.setter
     def gates(self, gates):
-        self.__gates = gates
+        self.materialize()
+        self.__gates = ConnRegistry(gates)
+        self.reset_depths()
+
+    def load(self, genome):
+        """Aggiunge i gates del genoma.
+
+        Please see: @ga_nets.network.Network.load()
+        """
+        super().load(genome)
+
+        neurons = self.neurons
+        for from_key, to_key, weight, innovation in genome.gates.torows():
+            gate = neurons[from_key].add_gate(neurons[to_key], weight,
+                                              innovation)
+            self.__gates.append(gate)
+            self.touch(new=get_conn_terms(gate))
+
+    def clone(self, shared=False):
+        """Duplica anche i gates.
+
+        Please see: @ga_nets.network.Network.clone()
+        """
+        network = super().clone(shared)
+        if shared:
+            return network
+
+        neurons = network.neurons
+        for gate in self.gates:
+            network.gates.append(neurons[gate.from_neuron.key].add_gate(
+                neurons[gate.to_neuron.key], gate.weight, gate.innovation))
+
+        return network
+
+    def get_evals(self, positions, rows):
+        """Conta anche i gates, valutati dal secondo passo in poi.
+
+        Please see: @ga_nets.network.Network.get_evals()
+        """
+        synapses, _ = super().get_evals(positions, rows)
+        gates = sum(1 for g in self.gates
+                    if g.from_neuron.key in positions
+                    and g.to_neuron.key in positions)
+
+        return synapses, gates * max(rows - 1, 0)
+
+    def compile(self, prune=True):
+        """Compila la rete neurale in un piano d'esecuzione vettorizzato.
+
+        Args:
+          prune: Please see: @ga_nets.compiled.rnn.RNNPlan.__init__()
+
+        Returns:
+          L'istanza di 'RNNPlan' che restituisce, per ogni sequenza, gli
+          stessi output di 'activate()'.
+        """
+        return RNNPlan(self, prune)
+
+    def session(self, batch=None):
+        """Crea una sessione d'inferenza per flussi di dati: a differenza di
+        'activate()' lo stato viene mantenuto fra una chiamata e l'altra e la
+        memoria resta costante.
+
+        Args:
+          batch: Numero di flussi indipendenti, None per uno solo.
+
+        Returns:
+          L'istanza di 'ga_nets.compiled.rnn.RNNSession'.
+        """
+        return self.compile().session(batch)
 
     def add_gate(self, from_neuron, to_neuron, weight=None):
         """Crea il gate fra neuroni.
@@ -74,13 +146,14 @@ class Recurrent(Network):
           AlreadyConn: Se la connessione è già presente.
         """
         if is_connected(self.gates, from_neuron, to_neuron):
-            AlreadyConn("Gate already present.")
+            raise AlreadyConn("Gate already present.")
 
         if weight is None:
             weight = self.traits["weight_fn"](self)
 
         gate = from_neuron.add_gate(to_neuron, weight)
         self.gates.append(gate)
+        self.touch(new=get_conn_terms(gate))
 
         return gate
 
@@ -90,8 +163,9 @@ class Recurrent(Network):
         Args:
           gate: Istanza del gate da rimuovere.
         """
-        self.gate.remove(gate)
+        self.gates.remove(gate)
         gate.remove()
+        self.touch(get_conn_terms(gate))
 
     def sub_neuron(self, neuron):
         """Rimuove il neurone dal network e in aggiunta anche i gates.
@@ -99,21 +173,25 @@ class Recurrent(Network):
         Args:
           neuron: Istanza del neurone da rimuovere.
         """
-        super().remove_neuron(neuron)
+        super().sub_neuron(neuron)
 
         # Rimuove i gates
         for direction in GateDirection:
-            for gate in neuron.gates[direction.value]:
+            for gate in list(neuron.gates[direction.value]):
                 self.gates.remove(gate)
+                gate.remove()
+                self.touch(get_conn_terms(gate))
 
 
 class RNNNeuron(Neuron):
     """Wrapper per i neuroni nei recurrent networks"""
+    __slots__ = ("__gates",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         # self.__gates = {}
-        self.__gates = [[] for _ in GateDirection]
+        self.__gates = [ConnRegistry() for _ in GateDirection]
 
     @property
     def gates(self):
@@ -154,17 +232,18 @@ class RNNNeuron(Neuron):
         states = self.aggregation(states)
         self.state.append(self.squash(states + prev_states + self.bias))
 
-    def add_gate(self, neuron, weight):
+    def add_gate(self, neuron, weight, innovation=None):
         """Crea il gate da neurone a un altro.
 
         Args:
           to_neuron: L'istanza del neurone al quale assegnare il gate.
           weight: Il peso del gate, quasi certamente un float).
+          innovation: Please see: @ga_nets.connection.Connection.__init__()
 
         Returns:
           L'istanza del gate.
         """
-        gate = Synapse(self, neuron, weight)
+        gate = Gate(self, neuron, weight, innovation)
         neuron.gates[GateDirection.IN.value].append(gate)
         self.gates[GateDirection.OUT.value].append(gate)
 
@@ -176,7 +255,6 @@ class RNNNeuron(Neuron):
         Args:
           neuron: L'istanza del neurone al quale disconnetterlo.
         """
-        for gate in self.gates[GateDirection.OUT.value]:
-            if gate.to_neuron == neuron:
-                gate.remove()
-                break
+        gate = self.gates[GateDirection.OUT.value].get(self.key, neuron.key)
+        if gate is not None:
+            gate.remove()
@@ -9,10 +9,18 @@
 #
 #    This isn't a free software, if you steal it... then, good for you.
 """Architettura portante della rete neurale"""
-from ga_nets.connection import AlreadyConn, is_connected, SynapseDirection
+from contextlib import contextmanager
+
+import numpy as np
+
+from ga_nets.connection import (AlreadyConn, ConnRegistry, is_connected,
+                                SynapseDirection)
+import ga_nets.fingerprint as Fingerprint
+from ga_nets.genome import Genome
 from ga_nets.index import Indexer
-import ga_nets.layer as Layer
 from ga_nets.neuron import ErrNeuronType, NeuronType
+from ga_nets.profiler import Stats
+import ga_nets.topology as Topology
 
 
 class NeuronNotInConns(Exception):
@@ -20,6 +28,10 @@ class NeuronNotInConns(Exception):
     nelle lista dei neuroni della rete neurale"""
 
 
+class AlreadyNeuron(ValueError):
+    """Errore di quando la chiave di un neurone è già presente"""
+
+
 class Network():
     """La classe che si occupa di gestire la struttura generale della rete
     neurale"""
@@ -29,7 +41,8 @@ class Network():
         Args:
           traits: Dizionario con le impostazioni di default. Per esempio:
                     {"aggregation_fn": sum}
-                  Dove 'sum' è la funzione di default in python oppure:
+                  Dove 'sum' è la funzione di default in python (o il suo
+                  nome in 'ga_nets.functions', cioè "sum") oppure:
                     {"aggregation_fn": my_rnd_agg}
                   Dove 'my_rnd_agg' è una funzione che restituisce casualmente
                   una funzione di aggregazione che può essere:
@@ -42,9 +55,32 @@ class Network():
         self.__key = Indexer.get_id("network")
 
         self.__neurons = {}  # Istanze dei neuroni
-        self.__synapses = []  # Istanze delle connessioni
+        self.__synapses = ConnRegistry()  # Istanze delle connessioni
         self.__layers = []
 
+        # Chiave assegnata al prossimo neurone senza chiave esplicita
+        self.__next_key = 0
+
+        # Profondità di input e hidden (vedi 'ga_nets.topology'), aggiornata
+        # a ogni modifica della struttura.
+        self.__depths = {}
+
+        # Contatore delle modifiche, utilizzato per invalidare il genoma
+        # restituito da 'snapshot()'.
+        self.__revision = 0
+        self.__snapshot = None
+
+        # Impronta aggiornata in O(1) a ogni modifica (vedi
+        # 'ga_nets.fingerprint')
+        self.__fingerprint = Fingerprint.Fingerprint()
+
+        # Genoma condiviso con il genitore finché la rete non viene
+        # materializzata (vedi 'clone()').
+        self.__shared = None
+
+        # Statistiche delle attivazioni, None se il profiling è spento
+        self.__stats = None
+
     def __str__(self):
         """Stampa le informazioni riguardante il network"""
         output = "Network #{}\n".format(self.__key)
@@ -71,34 +107,56 @@ class Network():
         Returns:
           L'array con i neuroni.
         """
+        self.materialize()
         return self.__neurons
 
     @neurons.setter
     def neurons(self, neurons):
+        self.materialize()
         self.__neurons = neurons
+        self.__next_key = max(map(int, neurons), default=-1) + 1
+        self.reset_depths()
 
     @property
     def synapses(self):
         """Getter per la prorietà delle connessioni.
 
         Returns:
-          L'array con le connessioni.
+          Il registro con le connessioni, iterabile come una lista.
         """
+        self.materialize()
         return self.__synapses
 
     @synapses.setter
     def synapses(self, synapses):
-        self.__synapses = synapses
+        self.materialize()
+        self.__synapses = ConnRegistry(synapses)
+        self.reset_depths()
 
     @property
     def layers(self):
         """Getter per la prorietà dei layers.
 
+        A differenza di 'get_layers()' non ricalcola la struttura, ma
+        raggruppa i neuroni secondo le profondità mantenute a ogni modifica.
+        I layers contengono gli stessi neuroni, ma all'interno di un hidden
+        layer l'ordine è quello d'inserimento dei neuroni.
+
         Returns:
           La lista tridimensionale con i neuroni in ogni layer.
         """
+        self.materialize()
         if not self.__layers:
-            self.__layers = self.get_layers()
+            hiddens = {}
+            for neuron in self.neurons.values():
+                depth = self.__depths.get(neuron.key)
+                if depth and neuron.type is NeuronType.HIDDEN:
+                    hiddens.setdefault(depth, []).append(neuron.key)
+
+            self.__layers = (
+                [[n.key for n in self.get_neuron_list(NeuronType.INPUT)]]
+                + [hiddens[depth] for depth in sorted(hiddens)]
+                + [[n.key for n in self.get_neuron_list(NeuronType.OUTPUT)]])
 
         return self.__layers
 
@@ -106,6 +164,105 @@ class Network():
     def layers(self, layers):
         self.__layers = layers
 
+    @property
+    def depths(self):
+        """Getter per la profondità dei neuroni.
+
+        Returns:
+          Un dizionario con la profondità degli input (0) e degli hidden
+          raggiungibili; None per quelli bloccati da un ciclo di sinapsi.
+        """
+        self.materialize()
+        return self.__depths
+
+    @property
+    def revision(self):
+        """Getter per il contatore delle modifiche.
+
+        Returns:
+          Un intero incrementato a ogni modifica della struttura, dei pesi,
+          dei bias o delle funzioni dei neuroni.
+        """
+        return self.__revision
+
+    @property
+    def fingerprint(self):
+        """Getter per l'impronta della rete, che costa O(1).
+
+        Returns:
+          Una tupla (topology, full): la prima dipende solo dalla struttura
+          (neuroni e connessioni), la seconda anche da bias, funzioni e pesi.
+          Due reti con la stessa struttura e gli stessi valori hanno la
+          stessa impronta, anche in processi diversi.
+        """
+        return self.__fingerprint.value
+
+    def touch(self, old=None, new=None):
+        """Segnala una modifica della rete: viene chiamato dai metodi del
+        network e dai setter di neuroni e connessioni.
+
+        Args:
+          old: Please see: @ga_nets.fingerprint.Fingerprint.update()
+          new: Please see: @ga_nets.fingerprint.Fingerprint.update()
+        """
+        self.__revision += 1
+        if old is not None or new is not None:
+            self.__fingerprint.update(old, new)
+
+    def reset_depths(self):
+        """Ricalcola da zero la profondità di tutti i neuroni, da utilizzare
+        solo se la struttura è stata modificata senza passare dai metodi del
+        network. Ricalcola anche l'impronta."""
+        self.touch()
+        self.__fingerprint = Fingerprint.from_network(self)
+        self.__layers = []
+        self.__depths = Topology.get_depths(
+            [n.key for n in self.get_neuron_list(NeuronType.INPUT)],
+            [n.key for n in self.get_neuron_list(NeuronType.HIDDEN)],
+            self.get_synapses())
+
+    def __relevel(self, neurons):
+        """Aggiorna la profondità della sola regione a valle dei neuroni.
+
+        Args:
+          neurons: Lista con le istanze dei neuroni modificati.
+        """
+        self.touch()
+        self.__layers = []
+
+        region = []
+        visited = set()
+        queue = [n for n in neurons if n.type is NeuronType.HIDDEN]
+        while queue:
+            neuron = queue.pop()
+            if neuron.key in visited:
+                continue
+
+            visited.add(neuron.key)
+            region.append(neuron.key)
+            for synapse in neuron.synapses[SynapseDirection.OUT.value]:
+                if synapse.to_neuron.type is NeuronType.HIDDEN:
+                    queue.append(synapse.to_neuron)
+
+        for key in region:
+            self.__depths.pop(key, None)
+
+        self.__depths.update(Topology.level(region,
+                                            self.__get_sources,
+                                            self.__depths))
+
+    def __get_sources(self, key):
+        """Chiavi dei neuroni che alimentano il neurone.
+
+        Args:
+          key: Chiave del neurone.
+
+        Returns:
+          Una lista con le chiavi.
+        """
+        return [s.from_neuron.key
+                for s in self.neurons[key].synapses[SynapseDirection.IN.value]]
+
     @property
     def num_inputs(self):
         """Getter per la prorietà del numero di inputs.
@@ -133,6 +290,78 @@ class Network():
         """
         return len(self.get_neuron_list(NeuronType.HIDDEN))
 
+    @property
+    def stats(self):
+        """Getter per le statistiche delle attivazioni.
+
+        Returns:
+          L'istanza di 'ga_nets.profiler.Stats' o None se il profiling è
+          spento.
+        """
+        return self.__stats
+
+    @stats.setter
+    def stats(self, stats):
+        self.__stats = stats
+
+    @property
+    def profiling(self):
+        """Getter che indica se il profiling è attivo"""
+        return self.__stats is not None
+
+    @profiling.setter
+    def profiling(self, profiling):
+        if not profiling:
+            self.__stats = None
+        elif self.__stats is None:
+            self.__stats = Stats()
+
+    @contextmanager
+    def profile(self, stats=None):
+        """Attiva il profiling all'interno del blocco 'with'.
+
+        Quando è spento l'attivazione controlla solo che 'stats' sia None
+        una volta per riga.
+
+        Args:
+          stats: Istanza di 'ga_nets.profiler.Stats' nella quale accumulare
+                 i dati (es. condivisa da più reti), di default una nuova.
+
+        Returns:
+          Un context manager che restituisce l'istanza delle statistiche.
+        """
+        previous = self.__stats
+        self.__stats = stats if stats is not None else Stats()
+        try:
+            yield self.__stats
+        finally:
+            self.__stats = previous
+
+    def get_evals(self, positions, rows):
+        """Conta le connessioni valutate da un'attivazione.
+
+        Args:
+          positions: Dizionario con la posizione di ogni neurone nei layers.
+          rows: Numero di righe (o passi) attivate.
+
+        Returns:
+          Una tupla con il numero di sinapsi e di gates valutati.
+        """
+        forward = backward = 0
+        for key, position in positions.items():
+            for synapse in self.neurons[key].synapses[
+                    SynapseDirection.IN.value]:
+                src = positions.get(synapse.from_neuron.key)
+                if src is None:
+                    continue
+                if src < position:
+                    forward += 1
+                else:
+                    backward += 1
+
+        # Al primo passo i neuroni successivi non hanno ancora uno stato
+        return forward * rows + backward * max(rows - 1, 0), 0
+
     def activate(self, features):
         """Attiva la rete neurale.
 
@@ -150,23 +379,50 @@ class Network():
         if len(features[0]) != self.num_inputs:
             raise ValueError("Features' number is wrong.")
 
+        stats = self.__stats
+        if stats is not None:
+            stats.start()
+
         # Resetta gli stati
         self.clear()
+        if stats is not None:
+            stats.lap("clear")
 
         # Costruisce i layer di neuroni
-        neurons = [self.neurons[n] for l in self.layers for n in l]
+        layers = self.layers
+        neurons = [self.neurons[n] for l in layers for n in l]
+        inputs, others = neurons[:len(layers[0])], neurons[len(layers[0]):]
+        if stats is not None:
+            stats.lap("layers")
 
         # Attiva i neuroni e restituisce gli output in ordine
         outputs = []
         for feature in features:
-            for i, neuron in enumerate(neurons):
-                if neuron.type is NeuronType.INPUT:
-                    neuron.state.append(feature[i])
-                else:
-                    neuron.activate()
+            for neuron, value in zip(inputs, feature):
+                neuron.state.append(value)
+            if stats is not None:
+                stats.lap("inputs")
+
+            for neuron in others:
+                neuron.activate()
+            if stats is not None:
+                stats.lap("neurons")
 
             outputs.append([self.neurons[o].state[-1]
-                            for o in self.layers[-1]])
+                            for o in layers[-1]])
+            if stats is not None:
+                stats.lap("outputs")
+
+        if stats is not None:
+            positions = {n.key: i for i, n in enumerate(neurons)}
+            synapses, gates = self.get_evals(positions, len(features))
+
+            stats.activations += 1
+            stats.rows += len(features)
+            stats.neuron_evals += len(others) * len(features)
+            stats.synapse_evals += synapses
+            stats.gate_evals += gates
+            stats.add_layers(layers)
 
         return outputs
 
@@ -183,19 +439,26 @@ class Network():
                        tramite la classe NeuronType. Di default è 'hidden'.
           bias: Bias del neurone. Se non presente viene generato dalla
                 funzione di default dei tratti.
-          squash: Funzione d'attivazione. Se non presente viene assegnato
+          squash: Funzione d'attivazione (o il suo nome nel registro
+                  'ga_nets.functions'). Se non presente viene assegnato
                   da quella di default nei tratti.
-          aggregation: Funzione di aggregazione. Se non presente viene
-                       assegnato da quella di default nei tratti.
+          aggregation: Funzione di aggregazione (o il suo nome nel
+                       registro). Se non presente viene assegnato da
+                       quella di default nei tratti.
           key: La chiave del neurone, se assente cerca l'indice maggiore e
                aggiunge un'unità.
 
         Returns:
           L'istanza del neurone.
+
+        Raises:
+          AlreadyNeuron: Se la chiave è già presente.
         """
+        neurons = self.neurons
         if "key" not in kwargs:
-            keys = self.neurons.keys()
-            kwargs["key"] = max(map(int, keys)) + 1 if keys else 0
+            kwargs["key"] = self.__next_key
+        if kwargs["key"] in neurons:
+            raise AlreadyNeuron("Neuron key already present.")
         if "bias" not in kwargs:
             kwargs["bias"] = self.traits["bias_fn"](self)
         if "squash" not in kwargs:
@@ -205,15 +468,110 @@ class Network():
         if "neuron_type" not in kwargs:
             kwargs["neuron_type"] = NeuronType.HIDDEN
 
-        neuron = self.neuron_class(key=kwargs["key"],
-                                   neuron_type=kwargs["neuron_type"],
-                                   bias=kwargs["bias"],
-                                   squash=kwargs["squash"],
-                                   aggregation=kwargs["aggregation"])
-        self.neurons[kwargs["key"]] = neuron
+        neuron = self.__create_neuron(neurons, kwargs["key"],
+                                      kwargs["neuron_type"], kwargs["bias"],
+                                      kwargs["squash"], kwargs["aggregation"])
+
+        self.touch()
+        self.__layers = []
 
         return neuron
 
+    def __create_neuron(self, neurons, key, neuron_type, bias, squash,
+                        aggregation):
+        """Crea il neurone e lo aggiunge alla rete senza segnalare la
+        modifica.
+
+        Returns:
+          L'istanza del neurone.
+        """
+        neuron = self.neuron_class(key=key,
+                                   neuron_type=neuron_type,
+                                   bias=bias,
+                                   squash=squash,
+                                   aggregation=aggregation)
+        neurons[key] = neuron
+        neuron.network = self
+        self.__fingerprint.update(new=Fingerprint.get_neuron_terms(neuron))
+
+        self.__next_key = max(self.__next_key, int(key) + 1)
+        if neuron_type is NeuronType.INPUT:
+            self.__depths[key] = 0
+
+        return neuron
+
+    def add_neurons(self, count=None, neuron_type=NeuronType.HIDDEN,
+                    biases=None, squash=None, aggregation=None, keys=None):
+        """Aggiunge più neuroni con una sola modifica della rete.
+
+        Args:
+          count: Numero di neuroni, di default la lunghezza di 'keys' o di
+                 'biases'.
+          neuron_type: Tipo comune a tutti i neuroni oppure una lista con il
+                       tipo di ognuno.
+          biases: Lista (o array numpy) con i bias, oppure un singolo valore
+                  comune. Se assente ogni bias viene generato dalla funzione
+                  di default dei tratti.
+          squash: Funzione d'attivazione (o nome) comune oppure una lista con
+                  quella di ogni neurone, di default quella dei tratti.
+          aggregation: Funzione d'aggregazione (o nome) comune oppure una
+                       lista, di default quella dei tratti.
+          keys: Lista con le chiavi, di default consecutive a partire dalla
+                prossima chiave libera.
+
+        Returns:
+          Una lista con le istanze dei neuroni.
+
+        Raises:
+          ValueError: Se il numero di neuroni non è indicato né ricavabile
+                      da 'keys' o 'biases'.
+          AlreadyNeuron: Se una delle chiavi è già presente o ripetuta; in
+                         tal caso la rete non viene modificata.
+        """
+        neurons = self.neurons
+        if count is None:
+            if keys is not None:
+                count = len(keys)
+            elif hasattr(biases, "__len__"):
+                count = len(biases)
+            else:
+                raise ValueError("Neurons' number is missing.")
+        if keys is None:
+            keys = range(self.__next_key, self.__next_key + count)
+        else:
+            keys = list(keys)
+            if (len(set(keys)) != len(keys)
+                    or any(key in neurons for key in keys)):
+                raise AlreadyNeuron("Neuron key already present.")
+
+        def column(value, default):
+            if value is None:
+                value = default
+            if isinstance(value, (str, NeuronType)) or callable(value):
+                return [value] * count
+            if not hasattr(value, "__len__"):
+                return [value] * count
+            return list(value)
+
+        if biases is None:
+            biases = [self.traits["bias_fn"](self) for _ in range(count)]
+        elif hasattr(biases, "tolist"):
+            biases = biases.tolist()
+
+        created = [self.__create_neuron(neurons, key, *params)
+                   for key, *params in zip(
+                       keys,
+                       column(neuron_type, None),
+                       column(biases, None),
+                       column(squash, self.traits.get("squash_fn")),
+                       column(aggregation,
+                              self.traits.get("aggregation_fn")))]
+
+        self.touch()
+        self.__layers = []
+
+        return created
+
     def sub_neuron(self, neuron):
         """Rimuove il neurone dal network.
 
@@ -221,11 +579,113 @@ class Network():
           neuron: Istanza del neurone da rimuovere.
         """
         del self.neurons[neuron.key]
+        self.__depths.pop(neuron.key, None)
+        neuron.network = None
+        self.__fingerprint.update(Fingerprint.get_neuron_terms(neuron))
 
         # Rimuove le connessioni
+        targets = []
         for direction in SynapseDirection:
-            for synapse in neuron.synapses[direction.value]:
+            for synapse in list(neuron.synapses[direction.value]):
                 self.synapses.remove(synapse)
+                synapse.remove()
+                self.__fingerprint.update(Fingerprint.get_conn_terms(synapse))
+                if synapse.to_neuron is not neuron:
+                    targets.append(synapse.to_neuron)
+
+        self.__relevel(targets)
+
+    def materialize(self):
+        """Costruisce la struttura a oggetti della rete se è ancora condivisa
+        con il genitore (vedi 'clone()'). Viene chiamato in automatico al
+        primo accesso a neuroni, connessioni o layers."""
+        if self.__shared is None:
+            return
+
+        genome = self.__shared
+        self.__shared = None
+        self.load(genome)
+
+        # La rete è ancora identica al genoma condiviso
+        self.__snapshot = (self.__revision, genome)
+
+    def load(self, genome):
+        """Carica la struttura di un genoma nella rete, che deve essere vuota.
+
+        Args:
+          genome: Istanza di 'ga_nets.genome.Genome'.
+        """
+        functions = genome.functions
+        self.add_neurons(keys=genome.keys.tolist(),
+                         neuron_type=[NeuronType(t)
+                                      for t in genome.types.tolist()],
+                         biases=genome.biases.tolist(),
+                         squash=[functions[i]
+                                 for i in genome.squash.tolist()],
+                         aggregation=[functions[i]
+                                      for i in genome.aggregation.tolist()])
+
+        # Le sinapsi vengono aggiunte in blocco e le profondità calcolate una
+        # sola volta alla fine.
+        neurons = self.__neurons
+        for from_key, to_key, weight, innovation in genome.synapses.torows():
+            self.__synapses.append(neurons[from_key].add_synapse(
+                neurons[to_key], weight, innovation))
+
+        # Ricalcola anche l'impronta
+        self.reset_depths()
+
+    def snapshot(self):
+        """Restituisce il genoma della rete, riutilizzandolo finché la rete
+        non viene modificata. Non deve essere modificato.
+
+        Returns:
+          L'istanza di 'ga_nets.genome.Genome'.
+        """
+        if self.__shared is not None:
+            return self.__shared
+
+        if self.__snapshot is None or self.__snapshot[0] != self.__revision:
+            self.__snapshot = (self.__revision, Genome.from_network(self))
+
+        return self.__snapshot[1]
+
+    def clone(self, shared=False):
+        """Duplica la rete con neuroni e connessioni.
+
+        Args:
+          shared: Se True la copia condivide il genoma del genitore (vedi
+                  'snapshot()') e costruisce i propri oggetti solo al primo
+                  accesso alla struttura, per esempio alla prima mutazione.
+                  Le copie di uno stesso genitore non modificato condividono
+                  lo stesso genoma.
+
+        Returns:
+          La nuova istanza della rete, con una nuova chiave.
+        """
+        network = self.__class__(self.traits)
+        if shared:
+            network.__shared = self.snapshot()
+            network.__fingerprint = self.__fingerprint.copy()
+            return network
+
+        neurons = {}
+        for key, neuron in self.neurons.items():
+            neurons[key] = neuron.copy()
+            neurons[key].network = network
+
+        synapses = network.__synapses
+        for synapse in self.synapses:
+            synapses.append(neurons[synapse.from_neuron.key].add_synapse(
+                neurons[synapse.to_neuron.key], synapse.weight,
+                synapse.innovation))
+
+        network.__neurons = neurons
+        network.__depths = dict(self.__depths)
+        network.__next_key = self.__next_key
+        network.__fingerprint = self.__fingerprint.copy()
+
+        return network
 
     def get_neuron_list(self, neuron_type):
         """Ritorna la lista di neuroni del network.
@@ -262,16 +722,118 @@ class Network():
           AlreadyConn: Se la connessione è già presente.
         """
         if is_connected(self.synapses, from_neuron, to_neuron):
-            AlreadyConn("Synapse already present.")
+            raise AlreadyConn("Synapse already present.")
 
         if weight is None:
             weight = self.traits["weight_fn"](self)
 
         synapse = from_neuron.add_synapse(to_neuron, weight)
         self.synapses.append(synapse)
+        self.__fingerprint.update(new=Fingerprint.get_conn_terms(synapse))
+        self.__relevel([to_neuron])
 
         return synapse
 
+    def add_synapses(self, edges, weights=None):
+        """Aggiunge più sinapsi aggiornando le profondità una sola volta.
+
+        Args:
+          edges: Lista di coppie (partenza, arrivo) o di tuple (partenza,
+                 arrivo, peso), con le istanze dei neuroni o le loro chiavi.
+          weights: Lista (o array numpy) con i pesi delle coppie. Se assente
+                   e le tuple non contengono il peso viene utilizzata la
+                   funzione assegnata nei 'traits'.
+
+        Returns:
+          Una lista con le istanze delle sinapsi.
+
+        Raises:
+          AlreadyConn: Se una delle sinapsi è già presente o ripetuta; in tal
+                       caso la rete non viene modificata.
+        """
+        neurons = self.neurons
+        synapses = self.synapses
+
+        def get_neuron(neuron):
+            return neuron if hasattr(neuron, "key") else neurons[neuron]
+
+        if hasattr(weights, "tolist"):
+            weights = weights.tolist()
+
+        conns = []
+        pairs = set()
+        for i, edge in enumerate(edges):
+            from_neuron, to_neuron = get_neuron(edge[0]), get_neuron(edge[1])
+            pair = (from_neuron.key, to_neuron.key)
+            if pair in pairs or pair in synapses:
+                raise AlreadyConn("Synapse already present.")
+            pairs.add(pair)
+
+            if len(edge) > 2:
+                weight = edge[2]
+            elif weights is not None:
+                weight = weights[i]
+            else:
+                weight = self.traits["weight_fn"](self)
+
+            conns.append((from_neuron, to_neuron, weight))
+
+        created = []
+        for from_neuron, to_neuron, weight in conns:
+            synapse = from_neuron.add_synapse(to_neuron, weight)
+            synapses.append(synapse)
+            created.append(synapse)
+            self.__fingerprint.update(new=Fingerprint.get_conn_terms(synapse))
+
+        self.__relevel([conn[1] for conn in conns])
+
+        return created
+
+    def connect(self, from_neurons, to_neurons, weights, sparse=False):
+        """Connette due gruppi di neuroni tramite una matrice dei pesi.
+
+        Args:
+          from_neurons: Lista con i neuroni di partenza (righe).
+          to_neurons: Lista con i neuroni d'arrivo (colonne).
+          weights: Matrice (partenza, arrivo) con i pesi, lista di liste o
+                   array numpy.
+          sparse: Se True i pesi nulli non generano sinapsi (matrice
+                  d'adiacenza), altrimenti la connessione è completa.
+
+        Returns:
+          Una lista con le istanze delle sinapsi.
+        """
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(from_neurons), len(to_neurons)):
+            raise ValueError("Weights' shape is wrong.")
+
+        rows, cols = (np.nonzero(weights) if sparse
+                      else np.indices(weights.shape).reshape(2, -1))
+
+        return self.add_synapses(
+            [(from_neurons[i], to_neurons[j])
+             for i, j in zip(rows.tolist(), cols.tolist())],
+            weights[rows, cols])
+
+    def add_layer(self, from_neurons, weights, sparse=False, **kwargs):
+        """Crea un layer di neuroni connesso a quelli indicati.
+
+        Args:
+          from_neurons: Lista con i neuroni che alimentano il layer.
+          weights: Matrice (partenza, nuovo neurone) con i pesi; il numero di
+                   colonne è la dimensione del layer.
+          sparse: Please see: @ga_nets.network.Network.connect()
+          kwargs: Parametri di 'add_neurons()' (tipo, bias, funzioni).
+
+        Returns:
+          Una lista con le istanze dei nuovi neuroni.
+        """
+        weights = np.asarray(weights, dtype=float)
+        neurons = self.add_neurons(weights.shape[1], **kwargs)
+        self.connect(from_neurons, neurons, weights, sparse)
+
+        return neurons
+
     def sub_synapse(self, synapse):
         """Rimuove una sinapsi fra i due neuroni.
 
@@ -280,6 +842,8 @@ class Network():
         """
         self.synapses.remove(synapse)
         synapse.remove()
+        self.__fingerprint.update(Fingerprint.get_conn_terms(synapse))
+        self.__relevel([synapse.to_neuron])
 
     def get_synapses(self):
         """Connessioni della rete neurale.
@@ -313,7 +877,5 @@ class Network():
         hiddens = [n.key for n in self.get_neuron_list(NeuronType.HIDDEN)]
         outputs = [n.key for n in self.get_neuron_list(NeuronType.OUTPUT)]
 
-        conns = self.get_synapses()
-        links = Layer.get_links(inputs, hiddens, outputs, conns)
-
-        return Layer.get_layers(inputs, hiddens, outputs, conns, links)
+        return Topology.get_layers(inputs, hiddens, outputs,
+                                   self.get_synapses())
@@ -13,7 +13,9 @@ recurrent"""
 from abc import ABCMeta, abstractmethod
 from enum import Enum
 
-from ga_nets.connection import Synapse, SynapseDirection
+from ga_nets.connection import ConnRegistry, Synapse, SynapseDirection
+from ga_nets.fingerprint import get_neuron_terms
+from ga_nets.functions import get_fn, get_name
 
 
 def from_fn_to_str(fn_name):
@@ -21,6 +23,9 @@ def from_fn_to_str(fn_name):
 
     Args:
       L'handle della funzione."""
+    if get_name(fn_name) is not None:
+        return get_name(fn_name)
+
     return (str(fn_name).split("function ")[1]
             .split(" ")[0]
             .replace(">", "")
@@ -40,6 +45,10 @@ class NeuronType(Enum):
 
 class Neuron(metaclass=ABCMeta):
     """Neurone utilizzato nella rete neurale"""
+    # Senza '__dict__' ogni istanza occupa molta meno memoria
+    __slots__ = ("__type", "__key", "__bias", "__squash", "__aggregation",
+                 "__state", "__synapses", "__network")
+
     def __init__(self, **kwargs):
         self.__type = (kwargs["neuron_type"]
                        if "neuron_type" in kwargs
@@ -50,15 +59,18 @@ class Neuron(metaclass=ABCMeta):
 
         self.__key = kwargs["key"]
         self.__bias = kwargs["bias"]
-        self.__squash = kwargs["squash"]
-        self.__aggregation = kwargs["aggregation"]
+        self.__squash = get_fn(kwargs["squash"])
+        self.__aggregation = get_fn(kwargs["aggregation"])
 
         # E' un array in quanto utilizzato anche da RNN.
         # Nel caso venga utilizzato da un feedforward
         # network avrà un solo elemento.
         self.__state = []
 
-        self.__synapses = [[] for _ in SynapseDirection]
+        self.__synapses = [ConnRegistry() for _ in SynapseDirection]
+
+        # Rete alla quale appartiene, avvisata a ogni modifica
+        self.__network = None
 
     def __str__(self):
         """zzz"""
@@ -103,7 +115,9 @@ class Neuron(metaclass=ABCMeta):
 
     @bias.setter
     def bias(self, bias):
+        old = self.__get_terms()
         self.__bias = bias
+        self.__retouch(old)
 
     @property
     def squash(self):
@@ -115,7 +129,11 @@ class Neuron(metaclass=ABCMeta):
 
     @squash.setter
     def squash(self, squash):
-        self.__squash = squash
+        """Accetta anche il nome di una funzione registrata in
+        'ga_nets.functions'"""
+        old = self.__get_terms()
+        self.__squash = get_fn(squash)
+        self.__retouch(old)
 
     @property
     def aggregation(self):
@@ -127,7 +145,10 @@ class Neuron(metaclass=ABCMeta):
 
     @aggregation.setter
     def aggregation(self, aggregation):
-        self.__aggregation = aggregation
+        """Please see: @ga_nets.neuron.Neuron.squash"""
+        old = self.__get_terms()
+        self.__aggregation = get_fn(aggregation)
+        self.__retouch(old)
 
     @property
     def state(self):
@@ -154,22 +175,59 @@ class Neuron(metaclass=ABCMeta):
     def synapses(self, synapses):
         self.__synapses = synapses
 
+    @property
+    def network(self):
+        """Getter per la rete alla quale appartiene il neurone.
+
+        Returns:
+          L'istanza della rete o None."""
+        return self.__network
+
+    @network.setter
+    def network(self, network):
+        self.__network = network
+
+    def touch(self, old=None, new=None):
+        """Segnala la modifica del neurone o delle sue connessioni alla
+        rete.
+
+        Args:
+          old: Please see: @ga_nets.fingerprint.Fingerprint.update()
+          new: Please see: @ga_nets.fingerprint.Fingerprint.update()
+        """
+        if self.__network is not None:
+            self.__network.touch(old, new)
+
+    def __get_terms(self):
+        """Termini dell'impronta, solo se il neurone appartiene a una rete"""
+        if self.__network is None:
+            return None
+
+        return get_neuron_terms(self)
+
+    def __retouch(self, old):
+        """Segnala la modifica di un attributo sostituendo i termini
+        dell'impronta precedenti"""
+        if old is not None:
+            self.touch(old, get_neuron_terms(self, old[0]))
+
     @abstractmethod
     def activate(self):
         """Calcola lo stato del neurone"""
         raise NotImplementedError("Needs to be implemented.")
 
-    def add_synapse(self, neuron, weight):
+    def add_synapse(self, neuron, weight, innovation=None):
         """Connette questo neurone a un altro tramite sinapsi.
 
         Args:
           neuron: L'istanza del neurone al quale connetterlo.
           weight: Il peso della connessione, quasi certamente un float).
+          innovation: Please see: @ga_nets.connection.Connection.__init__()
 
         Returns:
           L'istanza della connessione.
         """
-        synapse = Synapse(self, neuron, weight)
+        synapse = Synapse(self, neuron, weight, innovation)
         neuron.synapses[SynapseDirection.IN.value].append(synapse)
         self.synapses[SynapseDirection.OUT.value].append(synapse)
 
@@ -182,10 +240,10 @@ class Neuron(metaclass=ABCMeta):
         Args:
           neuron: L'istanza del neurone al quale disconnetterlo.
         """
-        for synapse in self.synapses[SynapseDirection.OUT.value]:
-            if synapse.to_neuron == neuron:
-                synapse.remove()
-                break
+        synapse = self.synapses[SynapseDirection.OUT.value].get(self.key,
+                                                                neuron.key)
+        if synapse is not None:
+            synapse.remove()
 
     def is_projecting_to(self, neuron):
         """Verifica se il neurone ha una connessione in uscita verso un altro.
@@ -196,11 +254,8 @@ class Neuron(metaclass=ABCMeta):
         Returns:
           True se la connessione è presente, False altrimenti.
         """
-        for connection in self.synapses[SynapseDirection.OUT.value]:
-            if neuron == connection.to_neuron:
-                return True
-
-        return False
+        synapses = self.synapses[SynapseDirection.OUT.value]
+        return (self.key, neuron.key) in synapses
 
     def copy(self):
         """Restituisce un oggetto identico a questa imitando la funzione per
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Statistiche raccolte durante l'attivazione delle reti neurali.
+
+Please see: @ga_nets.network.Network.profile()
+"""
+from collections import Counter
+from time import perf_counter
+
+# Fasi di 'Network.activate()'
+PHASES = ("layers", "clear", "inputs", "neurons", "outputs")
+
+
+class Stats():
+    """Tempi e contatori di una o più reti neurali, sommabili fra loro per
+    ottenere quelli di un'intera popolazione"""
+    def __init__(self):
+        self.times = dict.fromkeys(PHASES, 0.)
+        self.calls = dict.fromkeys(PHASES, 0)
+
+        self.activations = 0  # Chiamate ad 'activate()'
+        self.rows = 0  # Righe (o passi) attivate
+        self.neuron_evals = 0
+        self.synapse_evals = 0
+        self.gate_evals = 0
+
+        # Larghezza dei layers -> numero di layers con quella larghezza
+        self.layer_widths = Counter()
+
+        self.__mark = None
+
+    def __add__(self, other):
+        stats = Stats()
+        stats += self
+        stats += other
+
+        return stats
+
+    def __iadd__(self, other):
+        for phase in PHASES:
+            self.times[phase] += other.times[phase]
+            self.calls[phase] += other.calls[phase]
+
+        self.activations += other.activations
+        self.rows += other.rows
+        self.neuron_evals += other.neuron_evals
+        self.synapse_evals += other.synapse_evals
+        self.gate_evals += other.gate_evals
+        self.layer_widths.update(other.layer_widths)
+
+        return self
+
+    def __str__(self):
+        output = "Activations: {} ({} rows)\n".format(self.activations,
+                                                     self.rows)
+
+        output += "   Phases:\n"
+        for phase in PHASES:
+            output += "      {}: {:.6f}s ({} calls)\n".format(
+                phase, self.times[phase], self.calls[phase])
+
+        output += "   Evaluations:\n"
+        output += "      neurons: {}, synapses: {}, gates: {}\n".format(
+            self.neuron_evals, self.synapse_evals, self.gate_evals)
+
+        output += "   Layer widths:\n"
+        output += "      {}\n".format(dict(sorted(self.layer_widths.items())))
+
+        return output
+
+    @property
+    def total_time(self):
+        """Tempo complessivo speso nelle fasi"""
+        return sum(self.times.values())
+
+    def add_time(self, phase, elapsed):
+        """Registra il tempo di una fase.
+
+        Args:
+          phase: Il nome della fase (vedi 'PHASES').
+          elapsed: I secondi trascorsi.
+        """
+        self.times[phase] += elapsed
+        self.calls[phase] += 1
+
+    def start(self):
+        """Avvia il cronometro delle fasi"""
+        self.__mark = perf_counter()
+
+    def lap(self, phase):
+        """Assegna alla fase il tempo trascorso dall'ultimo 'start()' o
+        'lap()' e riavvia il cronometro.
+
+        Args:
+          phase: Il nome della fase.
+        """
+        mark = perf_counter()
+        self.add_time(phase, mark - self.__mark)
+        self.__mark = mark
+
+    def add_layers(self, layers):
+        """Registra la larghezza dei layers attivati.
+
+        Args:
+          layers: La lista tridimensionale dei layers.
+        """
+        self.layer_widths.update(len(layer) for layer in layers)
+
+    def to_dict(self):
+        """Restituisce le statistiche in un dizionario (es. per salvarle in
+        JSON)"""
+        return {"times": dict(self.times),
+                "calls": dict(self.calls),
+                "activations": self.activations,
+                "rows": self.rows,
+                "neuron_evals": self.neuron_evals,
+                "synapse_evals": self.synapse_evals,
+                "gate_evals": self.gate_evals,
+                "layer_widths": {str(width): count
+                                 for width, count
+                                 in sorted(self.layer_widths.items())}}
+
+    @classmethod
+    def merge(cls, stats):
+        """Somma le statistiche di più reti (es. di una popolazione).
+
+        Args:
+          stats: Iterabile con le istanze di 'Stats', i None vengono
+                 ignorati.
+
+        Returns:
+          Una nuova istanza con i totali.
+        """
+        total = cls()
+        for item in stats:
+            if item is not None:
+                total += item
+
+        return total
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Distanza di compatibilità fra genomi e suddivisione in specie.
+
+Ogni genoma viene ridotto a un array ordinato degli historical markings
+delle connessioni (sinapsi e gates, allineate come nel crossover, vedi
+'ga_nets.index.Indexer.get_innovation()') con i relativi pesi. I markings
+sono univoci anche fra sinapsi e gates, quindi non serve codificare gli
+estremi delle connessioni. La distanza di un genoma da tutti i
+rappresentanti delle specie si calcola con una sola ricerca binaria sui
+markings concatenati dei rappresentanti, invece di confrontare le liste di
+'get_synapses()' una coppia alla volta.
+
+Gli array vengono salvati in una cache fra una generazione e l'altra e
+ricalcolati solo quando la revisione del genoma (o della rete) cambia (vedi
+'Genome.touch()' e 'Network.touch()').
+"""
+import numpy as np
+
+from ga_nets.genome import Genome
+
+
+class Genes():
+    """Geni di un genoma ordinati per historical marking"""
+    __slots__ = ("codes", "weights", "max_code")
+
+    def __init__(self, genome):
+        """Estrae i geni dal genoma.
+
+        Args:
+          genome: Istanza di 'ga_nets.genome.Genome'.
+        """
+        codes = np.concatenate((genome.synapses.innovations,
+                                genome.gates.innovations))
+        order = np.argsort(codes, kind="stable")
+
+        self.codes = codes[order]
+        self.weights = np.concatenate((genome.synapses.weights,
+                                       genome.gates.weights))[order]
+        # Marking più recente (per gli excess)
+        self.max_code = int(self.codes[-1]) if self.codes.size else -1
+
+    def __len__(self):
+        return self.codes.size
+
+
+class GenesBatch():
+    """Geni di più genomi (es. i rappresentanti delle specie) concatenati"""
+    __slots__ = ("codes", "weights", "owners", "sizes", "max_code")
+
+    def __init__(self, genes):
+        """Concatena i geni.
+
+        Args:
+          genes: Lista con le istanze di 'Genes'.
+        """
+        self.codes = np.concatenate([g.codes for g in genes] + [[]]).astype(
+            np.int64)
+        self.weights = np.concatenate([g.weights for g in genes] + [[]])
+        self.sizes = np.array([len(g) for g in genes], dtype=np.intp)
+        self.owners = np.repeat(np.arange(len(genes)), self.sizes)
+        self.max_code = np.array([g.max_code for g in genes], dtype=np.int64)
+
+    def __len__(self):
+        return self.sizes.size
+
+
+class Distance():
+    """Distanza di compatibilità di NEAT:
+    excess * E / N + disjoint * D / N + weight * W
+    dove N è il numero di geni del genoma più grande e W la differenza media
+    dei pesi dei geni matching"""
+    def __init__(self, excess=1., disjoint=1., weight=.4):
+        """Inizializza i coefficienti.
+
+        Args:
+          excess: Coefficiente dei geni excess.
+          disjoint: Coefficiente dei geni disjoint.
+          weight: Coefficiente della differenza media dei pesi.
+        """
+        self.excess = excess
+        self.disjoint = disjoint
+        self.weight = weight
+
+    def __call__(self, genes1, genes2):
+        """Distanza fra due genomi.
+
+        Args:
+          genes1: Istanza di 'Genes' del primo genoma.
+          genes2: Istanza di 'Genes' del secondo genoma.
+
+        Returns:
+          La distanza.
+        """
+        return float(self.batch(genes1, GenesBatch([genes2]))[0])
+
+    def batch(self, genes, batch):
+        """Distanza di un genoma da tutti i genomi di un batch.
+
+        Args:
+          genes: Istanza di 'Genes' del genoma.
+          batch: Istanza di 'GenesBatch'.
+
+        Returns:
+          Un array con la distanza da ogni genoma del batch.
+        """
+        count = len(batch)
+        size = len(genes)
+
+        # Geni del batch presenti anche nel genoma
+        positions = np.searchsorted(genes.codes, batch.codes)
+        positions[positions == size] = 0
+        matched = (genes.codes[positions] == batch.codes if size
+                   else np.zeros(batch.codes.size, dtype=bool))
+
+        owners = batch.owners[matched]
+        matches = np.bincount(owners, minlength=count)
+        differences = np.bincount(
+            owners,
+            np.abs(batch.weights[matched] - genes.weights[positions[matched]]),
+            minlength=count)
+
+        # Geni presenti solo nel batch, excess se più recenti di tutti
+        # quelli del genoma
+        unmatched = ~matched
+        excess = np.bincount(
+            batch.owners[unmatched & (batch.codes > genes.max_code)],
+            minlength=count)
+        disjoint = np.bincount(batch.owners[unmatched],
+                               minlength=count) - excess
+
+        # Geni presenti solo nel genoma: quelli più recenti del
+        # rappresentante non possono essere matching
+        genome_excess = size - np.searchsorted(genes.codes, batch.max_code,
+                                               side="right")
+        excess += genome_excess
+        disjoint += size - matches - genome_excess
+
+        largest = np.maximum(np.maximum(batch.sizes, size), 1)
+        return ((self.excess * excess + self.disjoint * disjoint) / largest
+                + self.weight * differences / np.maximum(matches, 1))
+
+
+class Species():
+    """Specie: un rappresentante e i membri della generazione corrente"""
+    def __init__(self, key, representative):
+        """Inizializza la specie.
+
+        Args:
+          key: Identificativo della specie.
+          representative: Genoma o rete neurale rappresentante.
+        """
+        self.key = key
+        self.representative = representative
+        self.members = []
+
+
+class Speciation():
+    """Suddivide una popolazione in specie in base alla distanza dai
+    rappresentanti"""
+    def __init__(self, threshold=3., distance=None):
+        """Inizializza la speciazione.
+
+        Args:
+          threshold: Distanza massima da un rappresentante per entrare nella
+                     sua specie.
+          distance: Istanza di 'Distance', di default con i coefficienti di
+                    NEAT.
+        """
+        self.threshold = threshold
+        self.distance = distance if distance is not None else Distance()
+        self.species = {}
+
+        self.__next_key = 0
+        # id dell'oggetto -> (oggetto, revisione, geni)
+        self.__cache = {}
+
+    def get_genes(self, item):
+        """Geni di un genoma o di una rete neurale, dalla cache se la
+        revisione non è cambiata.
+
+        Args:
+          item: Istanza di 'ga_nets.genome.Genome' o della rete neurale.
+
+        Returns:
+          L'istanza di 'Genes'.
+        """
+        cached = self.__cache.get(id(item))
+        if (cached is not None and cached[0] is item
+                and cached[1] == item.revision):
+            return cached[2]
+
+        genome = item if isinstance(item, Genome) else item.snapshot()
+        genes = Genes(genome)
+        # L'oggetto resta nella cache, così il suo id non può essere riusato
+        self.__cache[id(item)] = (item, item.revision, genes)
+
+        return genes
+
+    def speciate(self, population):
+        """Assegna ogni individuo alla prima specie più vicina entro la
+        soglia, creandone una nuova se non ce ne sono.
+
+        I rappresentanti della generazione precedente restano invariati
+        durante l'assegnazione, poi vengono sostituiti dal membro più vicino.
+        Le specie rimaste vuote vengono eliminate.
+
+        Args:
+          population: Lista di genomi o reti neurali.
+
+        Returns:
+          Il dizionario chiave -> istanza di 'Species'.
+        """
+        species = list(self.species.values())
+        for item in species:
+            item.members = []
+
+        representatives = [self.get_genes(s.representative) for s in species]
+        batch = GenesBatch(representatives)
+        closest = [(float("inf"), None)] * len(species)
+
+        for item in population:
+            genes = self.get_genes(item)
+            distances = (self.distance.batch(genes, batch) if species
+                         else np.empty(0))
+
+            index = int(np.argmin(distances)) if distances.size else -1
+            if index < 0 or distances[index] >= self.threshold:
+                # Nuova specie, il batch viene ricostruito (raramente)
+                species.append(Species(self.__next_key, item))
+                self.__next_key += 1
+                representatives.append(genes)
+                batch = GenesBatch(representatives)
+                closest.append((0., item))
+                species[-1].members.append(item)
+                continue
+
+            species[index].members.append(item)
+            if distances[index] < closest[index][0]:
+                closest[index] = (float(distances[index]), item)
+
+        self.species = {}
+        for item, (_, representative) in zip(species, closest):
+            if item.members:
+                item.representative = representative
+                self.species[item.key] = item
+
+        # Restano in cache solo gli individui ancora utilizzabili
+        alive = {id(item) for item in population}
+        alive.update(id(s.representative) for s in self.species.values())
+        self.__cache = {key: value for key, value in self.__cache.items()
+                        if key in alive}
+
+        return self.species
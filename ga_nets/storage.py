@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Formato binario compatto per salvare reti neurali e popolazioni.
+
+Ogni rete è salvata come un record (tutti i valori sono little-endian):
+  - header: magic 'GANN', versione, numero di nomi, di neuroni, di sinapsi
+    e di gates;
+  - tabella dei nomi: la classe della rete seguita dalle funzioni dei
+    neuroni, salvate con il nome del registro 'ga_nets.functions';
+  - tabella dei neuroni: chiavi, bias, id delle funzioni e tipi;
+  - tabella delle sinapsi e tabella dei gates: estremi, pesi, historical
+    markings e stato (attiva o disattivata).
+
+I record della versione 2, senza historical markings, vengono ancora letti:
+i markings vengono assegnati alla lettura (vedi 'ConnTable.mark()').
+
+Un file di popolazione contiene un header con magic 'GAPO' e numero di
+reti, la tabella con l'offset di ogni record e i record: viene aperto
+tramite mmap, così una singola rete può essere letta senza leggere il
+resto del file.
+"""
+from importlib import import_module
+import mmap
+import struct
+
+import numpy as np
+
+from ga_nets.functions import REGISTRY
+from ga_nets.genome import ConnTable, Genome
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.nets.rnn import Recurrent
+
+VERSION = 3
+# Versioni che possono essere lette
+VERSIONS = (2, 3)
+
+RECORD = struct.Struct("<4sHHIII")
+POPULATION = struct.Struct("<4sHxxQ")
+NAME = struct.Struct("<H")
+
+# Classi delle reti salvate per nome
+NETWORKS = {cls.__name__: cls for cls in (FeedForward, Recurrent)}
+
+
+class FormatError(ValueError):
+    """Rilanciata quando i dati non sono nel formato atteso"""
+
+
+def get_fn_name(function):
+    """Nome con il quale viene salvata una funzione.
+
+    Args:
+      function: La funzione d'attivazione o d'aggregazione.
+
+    Returns:
+      Il nome nel registro 'ga_nets.functions' o, per le funzioni non
+      registrate, una stringa 'modulo:nome'.
+
+    Raises:
+      ValueError: Se la funzione non è registrata né definita a livello di
+                  modulo (es. una lambda) e quindi non può essere ritrovata
+                  dal nome.
+    """
+    if function in REGISTRY:
+        return REGISTRY.get_name(function)
+
+    name = "{}:{}".format(function.__module__, function.__qualname__)
+    if "<" in name:
+        raise ValueError("Function {} can't be saved by name.".format(name))
+
+    return name
+
+
+def get_fn(name, functions=None):
+    """Ritrova una funzione dal nome generato da 'get_fn_name()'.
+
+    Args:
+      name: Il nome della funzione.
+      functions: Dizionario opzionale nome -> funzione, consultato per primo.
+
+    Returns:
+      La funzione.
+    """
+    if functions and name in functions:
+        return functions[name]
+    if name in REGISTRY:
+        return REGISTRY.get(name)
+
+    module, qualname = name.split(":")
+    function = import_module(module)
+    for attr in qualname.split("."):
+        function = getattr(function, attr)
+
+    return function
+
+
+def pad(size):
+    """Byte necessari per allineare una sezione a 8 byte"""
+    return -size % 8
+
+
+def dumps(network):
+    """Serializza una rete neurale.
+
+    Args:
+      network: Istanza della rete neurale o del suo genoma.
+
+    Returns:
+      I byte del record.
+    """
+    genome = network if isinstance(network, Genome) else network.snapshot()
+
+    names = [genome.network_class.__name__]
+    names += [get_fn_name(fn) for fn in genome.functions]
+
+    chunks = [RECORD.pack(b"GANN", VERSION, len(names), len(genome),
+                          len(genome.synapses), len(genome.gates))]
+    for name in names:
+        encoded = name.encode("utf-8")
+        chunks += [NAME.pack(len(encoded)), encoded]
+
+    size = sum(map(len, chunks))
+    chunks.append(b"\0" * pad(size))
+
+    # Prima le colonne da 8 byte, così restano allineate
+    for array in (genome.keys, genome.biases, genome.squash,
+                  genome.aggregation, genome.types):
+        chunks.append(array.astype(array.dtype.newbyteorder("<")).tobytes())
+    chunks.append(b"\0" * pad(len(genome) * 13))
+
+    for table in (genome.synapses, genome.gates):
+        for array in (table.from_keys, table.to_keys, table.weights,
+                      table.innovations):
+            chunks.append(
+                array.astype(array.dtype.newbyteorder("<")).tobytes())
+        chunks.append(table.enabled.astype(np.uint8).tobytes())
+        chunks.append(b"\0" * pad(len(table)))
+
+    return b"".join(chunks)
+
+
+def loads(data, functions=None, offset=0):
+    """Ricostruisce il genoma di una rete serializzata con 'dumps()'.
+
+    Args:
+      data: I byte (o un buffer come un mmap) con il record.
+      functions: Dizionario opzionale nome -> funzione per le funzioni che
+                 non possono essere importate dal loro modulo.
+      offset: Posizione del record all'interno di 'data'.
+
+    Returns:
+      L'istanza di 'ga_nets.genome.Genome' (con 'to_network()' si ottiene la
+      rete a oggetti).
+
+    Raises:
+      FormatError: Se i dati non sono un record valido.
+    """
+    magic, version, num_names, num_neurons, num_synapses, num_gates = \
+        RECORD.unpack_from(data, offset)
+    if magic != b"GANN" or version not in VERSIONS:
+        raise FormatError("Not a network record (version {}).".format(version))
+
+    pos = offset + RECORD.size
+    names = []
+    for _ in range(num_names):
+        length, = NAME.unpack_from(data, pos)
+        pos += NAME.size
+        names.append(bytes(data[pos:pos + length]).decode("utf-8"))
+        pos += length
+    pos += pad(pos - offset)
+
+    def read(dtype, count):
+        nonlocal pos
+        array = np.frombuffer(data, np.dtype(dtype), count, pos)
+        pos += array.nbytes
+        return array
+
+    keys = read("<i8", num_neurons)
+    biases = read("<f8", num_neurons)
+    squash = read("<i2", num_neurons)
+    aggregation = read("<i2", num_neurons)
+    types = read("<i1", num_neurons)
+    pos += pad(num_neurons * 13)
+
+    tables = []
+    for count in (num_synapses, num_gates):
+        from_keys, to_keys = read("<i8", count), read("<i8", count)
+        weights = read("<f8", count)
+        innovations = read("<i8", count) if version > 2 else None
+        tables.append(ConnTable(from_keys, to_keys, weights,
+                                read("<u1", count), innovations))
+        pos += pad(count)
+
+    if names[0] not in NETWORKS:
+        raise FormatError("Unknown network class: {}".format(names[0]))
+
+    return Genome(NETWORKS[names[0]],
+                  [get_fn(name, functions) for name in names[1:]],
+                  (keys, types, biases, squash, aggregation),
+                  tables[0],
+                  tables[1])
+
+
+def save(network, path):
+    """Salva una rete neurale su file.
+
+    Args:
+      network: Istanza della rete neurale o del suo genoma.
+      path: Percorso del file.
+    """
+    with open(path, "wb") as handle:
+        handle.write(dumps(network))
+
+
+def load(path, functions=None):
+    """Legge una rete neurale salvata con 'save()'.
+
+    Args:
+      path: Percorso del file.
+      functions: Please see: @ga_nets.storage.loads()
+
+    Returns:
+      L'istanza di 'ga_nets.genome.Genome'.
+    """
+    with open(path, "rb") as handle:
+        return loads(handle.read(), functions)
+
+
+def save_population(networks, path):
+    """Salva una popolazione su file.
+
+    Args:
+      networks: Lista con le istanze delle reti neurali o dei loro genomi.
+      path: Percorso del file.
+    """
+    records = [dumps(network) for network in networks]
+
+    offsets = [POPULATION.size + 8 * (len(records) + 1)]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    with open(path, "wb") as handle:
+        handle.write(POPULATION.pack(b"GAPO", VERSION, len(records)))
+        handle.write(np.array(offsets, dtype="<u8").tobytes())
+        for record in records:
+            handle.write(record)
+
+
+class PopulationFile():
+    """Popolazione salvata con 'save_population()' e aperta tramite mmap:
+    ogni genoma viene letto solo quando richiesto"""
+    def __init__(self, path, functions=None):
+        """Apre il file.
+
+        Args:
+          path: Percorso del file.
+          functions: Please see: @ga_nets.storage.loads()
+
+        Raises:
+          FormatError: Se il file non è una popolazione valida.
+        """
+        self.functions = functions
+
+        with open(path, "rb") as handle:
+            self.__mmap = mmap.mmap(handle.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+
+        magic, version, count = POPULATION.unpack_from(self.__mmap, 0)
+        if magic != b"GAPO" or version not in VERSIONS:
+            self.close()
+            raise FormatError("Not a population file.")
+
+        self.__offsets = np.frombuffer(self.__mmap, "<u8", count + 1,
+                                       POPULATION.size).tolist()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, index):
+        """Legge un singolo genoma.
+
+        Args:
+          index: Posizione del genoma nella popolazione.
+
+        Returns:
+          L'istanza di 'ga_nets.genome.Genome', indipendente dal file.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Genome index out of range.")
+
+        return loads(self.__mmap, self.functions, self.__offsets[index])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def close(self):
+        """Chiude il file"""
+        self.__mmap.close()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa i generatori e il confronto dei benchmark"""
+from ga_nets.bench.suite import compare
+from ga_nets.bench.topologies import random_network, random_synapses
+from ga_nets.nets.rnn import Recurrent
+
+
+def test_random_network():
+    """La stessa configurazione deve generare la stessa rete"""
+    params = dict(network_class=Recurrent, num_inputs=3, num_hiddens=20,
+                  num_outputs=2, density=.2, gate_density=.05, depth=4)
+    network = random_network(seed=7, **params)
+
+    assert network.get_synapses() == random_network(seed=7,
+                                                    **params).get_synapses()
+    assert network.gates
+    assert len(network.layers) == 6
+    assert None not in network.depths.values()
+
+    for src, dst in random_synapses(network, 10):
+        network.add_synapse(network.neurons[src], network.neurons[dst], 1)
+    assert None not in network.depths.values()
+
+
+def test_compare():
+    """Solo le misure oltre la tolleranza sono regressioni"""
+    baseline = {"results": {"a": 1., "b": 1., "c": 1.}}
+    current = {"results": {"a": 1.1, "b": 1.5, "d": 9.}}
+
+    assert [row[-1] for row in compare(current, baseline, .2)] == [False,
+                                                                   True]
+
+
+if __name__ == "__main__":
+    test_random_network()
+    test_compare()
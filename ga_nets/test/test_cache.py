@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa la cache dei valori di fitness"""
+from ga_nets.cache import FitnessCache, get_fingerprint, get_hash, MISSING
+from ga_nets.evaluator import PopulationEvaluator
+from ga_nets.genome import Genome
+from ga_nets.test.test_evaluator import create_population, DATASET, error
+
+
+def test_hash():
+    """L'hash deve dipendere solo dal contenuto che cambia gli output"""
+    network = create_population(2)[1]
+    clone = network.clone()
+    assert get_hash(network) == get_hash(clone)
+    assert get_hash(Genome.from_network(network)) == get_hash(network)
+
+    genome = Genome.from_network(network)
+    genome.synapses.enabled[0] = False
+    assert get_hash(genome) != get_hash(network)
+    genome.synapses.weights[0] += 1
+    assert get_hash(genome) == get_hash(genome.to_network())
+
+    clone.synapses[0].weight += .1
+    assert get_hash(clone) != get_hash(network)
+
+    assert get_fingerprint(DATASET) == get_fingerprint([list(row)
+                                                        for row in DATASET])
+    assert get_fingerprint(DATASET) != get_fingerprint(DATASET[:2])
+
+
+def test_lru():
+    """Devono essere eliminati i valori utilizzati meno di recente"""
+    cache = FitnessCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache and "a" in cache
+    assert cache.get("b") is MISSING
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 1,
+                           "size": 2, "hit_rate": .5}
+
+
+def test_evaluator_cache():
+    """I duplicati non devono essere valutati di nuovo"""
+    calls = []
+
+    def fitness(network, dataset):
+        calls.append(network)
+        return error(network, dataset)
+
+    population = create_population(4)
+    population.append(population[0].clone())
+    expected = [error(network, DATASET) for network in population]
+
+    cache = FitnessCache()
+    evaluator = PopulationEvaluator(DATASET, fitness, processes=0,
+                                    cache=cache)
+    assert evaluator.evaluate(population) == expected
+    assert len(calls) == 4
+
+    population[1].synapses[0].weight += 1
+    assert evaluator.evaluate(population)[1] == error(population[1], DATASET)
+    assert len(calls) == 5
+    assert cache.hits == 4
+
+
+if __name__ == "__main__":
+    test_hash()
+    test_lru()
+    test_evaluator_cache()
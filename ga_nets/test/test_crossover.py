@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa il crossover fra genomi"""
+from ga_nets.crossover import Crossover, Policy
+from ga_nets.genome import Genome
+from ga_nets.index import Indexer
+from ga_nets.mutation import add_node
+from ga_nets.test.test_feedforward import mixed_network
+from ga_nets.test.test_genome import create_network
+
+
+def test_identical_parents():
+    """Il figlio di due genitori identici deve essere identico a loro"""
+    network = create_network()
+    child = Crossover(seed=0)(network, network.clone()).to_network()
+
+    assert child.get_synapses() == network.get_synapses()
+    assert ([str(g) for g in child.gates]
+            == [str(g) for g in network.gates])
+    assert list(child.neurons) == list(network.neurons)
+
+
+def test_policy():
+    """I geni disjoint ed excess devono seguire la politica"""
+    def get_pairs(genome):
+        table = genome.synapses
+        return list(zip(table.from_keys.tolist(), table.to_keys.tolist()))
+
+    parent1 = Genome.from_network(mixed_network())
+    parent2 = parent1.copy()
+    add_node(parent1, 1)
+    add_node(parent2, 2)
+    excess = add_node(parent2, 3)
+
+    fitter = Crossover(seed=0)(parent1, parent2)
+    assert excess not in fitter.keys.tolist()
+    assert get_pairs(fitter) == get_pairs(parent1)
+
+    both = Crossover(Policy(excess="both", disjoint="both"), 0)(parent1,
+                                                               parent2)
+    assert excess in both.keys.tolist()
+    assert set(get_pairs(both)) == set(get_pairs(parent1) + get_pairs(parent2))
+
+    mean = Crossover(Policy(matching="mean"), 0)(parent1, parent2)
+    assert mean.to_network().activate([[1, 0, -1]])
+
+
+def test_independent_splits():
+    """Neuroni creati dividendo sinapsi diverse non devono essere allineati,
+    quelli creati dividendo la stessa sinapsi sì"""
+    parent1 = Genome.from_network(mixed_network())
+    parent2 = parent1.copy()
+    twin = parent1.copy()
+    # Semi che dividono sinapsi diverse
+    split1, split2 = add_node(parent1, 1), add_node(parent2, 4)
+    assert set(parent1.synapses.innovations[~parent1.synapses.enabled]) \
+        != set(parent2.synapses.innovations[~parent2.synapses.enabled])
+    assert split1 != split2
+    assert add_node(twin, 1) == split1
+
+    child = Crossover(Policy(excess="both", disjoint="both"), 0)(parent1,
+                                                                parent2)
+    assert {split1, split2} <= set(child.keys.tolist())
+    assert len(set(child.synapses.innovations.tolist())) == len(
+        child.synapses)
+    network = child.to_network()
+    assert len(network.synapses) == int(child.synapses.enabled.sum())
+
+    matched = Crossover(Policy(excess="both", disjoint="both"), 0)(parent1,
+                                                                  twin)
+    assert matched.keys.tolist().count(split1) == 1
+    assert len(matched.synapses) == len(parent1.synapses)
+
+
+def test_forgotten_markings():
+    """Le stesse coppie con innovazioni diverse non devono essere
+    duplicate"""
+    parent1 = Genome.from_network(mixed_network())
+    parent2 = parent1.copy()
+    Indexer.reset_innovations()
+    parent2.synapses.innovations[:] = -1
+    parent2.synapses.mark("synapse")
+    assert not set(parent1.synapses.innovations.tolist()) & set(
+        parent2.synapses.innovations.tolist())
+
+    child = Crossover(Policy(excess="both", disjoint="both"), 0)(parent1,
+                                                                parent2)
+    assert (child.synapses.innovations.tolist()
+            == parent1.synapses.innovations.tolist())
+    assert child.to_network().get_synapses() == parent1.get_synapses()
+
+
+if __name__ == "__main__":
+    test_identical_parents()
+    test_policy()
+    test_independent_splits()
+    test_forgotten_markings()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa la valutazione della popolazione"""
+from math import tanh
+from multiprocessing import get_context
+
+from ga_nets.evaluator import pack, PopulationEvaluator, unpack
+from ga_nets.index import SharedCounters
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.nets.rnn import Recurrent
+from ga_nets.neuron import NeuronType
+
+DATASET = [[1, 0], [0, 1], [.5, -.5]]
+
+
+def error(network, dataset):
+    """Fitness d'esempio: somma degli output"""
+    return sum(sum(row) for row in network.activate(dataset))
+
+
+def create_population(size):
+    """Crea una popolazione con reti feedforward e recurrent.
+
+    Args:
+      size: Numero di reti.
+
+    Returns:
+      Una lista con le istanze delle reti neurali.
+    """
+    population = []
+    for i in range(size):
+        network = (FeedForward if i % 2 else Recurrent)({})
+        neurons = [network.add_neuron(key=key,
+                                      neuron_type=nt,
+                                      bias=i / 10,
+                                      squash=tanh,
+                                      aggregation=sum)
+                   for key, nt in enumerate((NeuronType.INPUT,
+                                             NeuronType.INPUT,
+                                             NeuronType.OUTPUT,
+                                             NeuronType.HIDDEN))]
+        network.add_synapse(neurons[0], neurons[3], i / size)
+        network.add_synapse(neurons[1], neurons[3], -.5)
+        network.add_synapse(neurons[3], neurons[2], 1.5)
+        if isinstance(network, Recurrent):
+            network.add_gate(neurons[3], neurons[3], .3)
+
+        population.append(network)
+
+    return population
+
+
+def test_pack_unpack():
+    """La rete ricostruita deve restituire gli stessi output"""
+    for network in create_population(2):
+        assert (unpack(pack(network)).activate(DATASET)
+                == network.activate(DATASET))
+
+
+def test_pack_shared_clone():
+    """Le copie condivise non devono essere costruite per essere inviate"""
+    network = create_population(1)[0]
+    clone = network.clone(shared=True)
+
+    assert pack(clone) is network.snapshot()
+    # La copia non è stata costruita: condivide ancora il genoma
+    assert clone.snapshot() is network.snapshot()
+    assert unpack(pack(clone)).activate(DATASET) == network.activate(DATASET)
+
+
+def test_evaluate_in_order():
+    """I valori di fitness devono essere nell'ordine della popolazione e
+    uguali a quelli della valutazione seriale"""
+    population = create_population(9)
+    expected = [error(network, DATASET) for network in population]
+
+    with PopulationEvaluator(DATASET, error, processes=2) as evaluator:
+        assert evaluator.evaluate(population) == expected
+        assert evaluator.evaluate(population[::-1]) == expected[::-1]
+
+
+def test_evaluate_spawn():
+    """Il pool deve funzionare con i processi avviati da 'spawn' e con i
+    contatori condivisi"""
+    population = create_population(4)
+    expected = [error(network, DATASET) for network in population]
+
+    ctx = get_context("spawn")
+    counters = SharedCounters(ctx=ctx)
+    with PopulationEvaluator(DATASET, error, processes=2,
+                             counters=counters, ctx=ctx) as evaluator:
+        assert evaluator.evaluate(population) == expected
+
+
+if __name__ == "__main__":
+    test_pack_unpack()
+    test_pack_shared_clone()
+    test_evaluate_in_order()
+    test_evaluate_spawn()
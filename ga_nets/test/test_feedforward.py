@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa le Feedforward Neural Network"""
+from concurrent.futures import ThreadPoolExecutor
+from math import tanh
+
+import numpy as np
+import pytest
+
+from ga_nets.connection import AlreadyConn
+from ga_nets.neuron import NeuronType
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.network import AlreadyNeuron
+
+
+def identity(value):
+    """Funzione d'attivazione identità"""
+    return value
+
+
+def create_network(neurons, conns):
+    """Crea un feedforward network.
+
+    Args:
+      neurons: Una lista con le tuple contenenti il tipo di neurone, il bias,
+               la funzione d'attivazione e quella d'aggregazione.
+      conns: Una lista contenente le tuple con l'indice del neurone di
+             partenza, il neurone d'arrivo e il peso della sinapsi.
+
+    Returns:
+      L'istanza della rete neurale.
+    """
+    network = FeedForward({})
+    instances = [network.add_neuron(key=i,
+                                    neuron_type=nt,
+                                    bias=bias,
+                                    squash=squash,
+                                    aggregation=aggregation)
+                 for i, (nt, bias, squash, aggregation) in enumerate(neurons)]
+
+    for (neuron1, neuron2, weight) in conns:
+        network.add_synapse(instances[neuron1], instances[neuron2], weight)
+
+    return network
+
+
+def mixed_network():
+    """Rete con due hidden layers e funzioni d'aggregazione miste"""
+    return create_network(
+        [(NeuronType.INPUT, 0, identity, sum),
+         (NeuronType.INPUT, 0, identity, sum),
+         (NeuronType.INPUT, 0, identity, sum),
+         (NeuronType.OUTPUT, .1, tanh, sum),
+         (NeuronType.OUTPUT, -.2, identity, max),
+         (NeuronType.HIDDEN, .3, tanh, sum),
+         (NeuronType.HIDDEN, -.1, tanh, max),
+         (NeuronType.HIDDEN, .2, identity, sum),
+         (NeuronType.HIDDEN, 0, tanh, min)],
+        [(0, 5, .5), (1, 5, -.4), (2, 6, .9), (1, 6, .3),
+         (5, 7, 1.2), (6, 7, -.7), (0, 8, .2),
+         (7, 3, .8), (5, 3, -.3), (8, 4, .6), (7, 4, .1), (6, 4, -.5)])
+
+
+def check_rows(result, expected, margin):
+    """Verifica i risultati riga per riga.
+
+    Args:
+      result: Il risultato dato dalla rete neurale.
+      expected: Il valore atteso.
+      margin: Il margine d'errore permesso.
+    """
+    for row, exp_row in zip(result, expected):
+        for value, exp_value in zip(row, exp_row):
+            assert abs(value - exp_value) < margin, \
+                "The result is {}, but needs to be {}.".format(value,
+                                                               exp_value)
+
+
+def test_activate_rows_are_independent():
+    """Ogni riga delle features deve essere attivata in maniera
+    indipendente dalle precedenti"""
+    network = mixed_network()
+
+    first = network.activate([[1, -1, .5]])
+    second = network.activate([[0, 2, -1]])
+    both = network.activate([[1, -1, .5], [0, 2, -1]])
+
+    check_rows(both, first + second, 1e-12)
+
+
+def test_compiled_plan_matches_network():
+    """Il piano compilato deve restituire gli stessi output della rete"""
+    network = mixed_network()
+    features = [[1, -1, .5], [0, 2, -1], [.3, .3, .3], [-2, 0, 4]]
+
+    check_rows(network.compile().activate(features),
+               network.activate(features),
+               1e-9)
+
+
+def test_state_view():
+    """Lo stato dei neuroni deve restare consultabile e le modifiche ai
+    pesi devono essere viste dall'attivazione successiva"""
+    network = mixed_network()
+    result = network.activate([[1, -1, .5]])
+
+    assert network.neurons[3].state == (result[0][0],)
+    assert network.neurons[0].state == (1,)
+    with pytest.raises(AttributeError):
+        network.neurons[3].state.append(0)
+
+    network.synapses[0].weight = 0
+    assert network.activate([[1, -1, .5]]) != result
+
+    network.clear()
+    assert network.neurons[3].state == ()
+
+
+def test_compiled_plan_prunes_dead_neurons():
+    """Il piano non deve contenere i neuroni dai quali nessun output dipende
+    né quelli non raggiungibili dagli input"""
+    network = mixed_network()
+    dead = network.add_neuron(key=9, bias=0, squash=tanh, aggregation=sum)
+    unreachable = network.add_neuron(key=10, bias=1, squash=tanh,
+                                     aggregation=sum)
+    network.add_synapse(network.neurons[1], dead, .4)
+    network.add_synapse(unreachable, network.neurons[3], .4)
+
+    features = [[1, -1, .5], [0, 2, -1]]
+    plan = network.compile()
+
+    assert plan.report.dead == [9] and plan.report.unreachable == [10]
+    assert len(plan.report.synapses) == 2
+    assert 9 not in plan.keys
+    check_rows(plan.activate(features), network.activate(features), 1e-9)
+    assert len(network.compile(prune=False).keys) == len(plan.keys) + 1
+
+
+def test_compiled_plan_is_thread_safe():
+    """Lo stesso piano deve poter essere attivato da più thread"""
+    network = mixed_network()
+    plan = network.compile()
+    batches = [[[i / 10, -i / 20, i % 3]] * (i % 7 + 1) for i in range(64)]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(plan.activate, batches))
+
+    for batch, result in zip(batches, results):
+        check_rows(result, network.activate(batch), 1e-9)
+    assert not plan.stages[0][0].cols.flags.writeable
+
+
+def test_bulk_construction():
+    """I costruttori in blocco devono generare la stessa rete dei metodi
+    per singolo neurone e singola sinapsi"""
+    weights = np.arange(-6, 6).reshape(3, 4) / 10
+    traits = {"squash_fn": tanh, "aggregation_fn": sum}
+
+    network = FeedForward(traits)
+    inputs = network.add_neurons(3, NeuronType.INPUT, biases=0)
+    hiddens = network.add_layer(inputs, weights, sparse=True,
+                                biases=[.1, .2, .3, .4])
+    outputs = network.add_neurons(2, NeuronType.OUTPUT, biases=0)
+    network.connect(hiddens, outputs, np.ones((4, 2)))
+
+    expected = FeedForward(traits)
+    for i in range(3):
+        expected.add_neuron(key=i, neuron_type=NeuronType.INPUT, bias=0)
+    for j in range(4):
+        expected.add_neuron(bias=(j + 1) / 10)
+    for i in range(3):
+        for j in range(4):
+            if weights[i, j]:
+                expected.add_synapse(expected.neurons[i],
+                                     expected.neurons[3 + j], weights[i, j])
+    for k in range(7, 9):
+        expected.add_neuron(key=k, neuron_type=NeuronType.OUTPUT, bias=0)
+    for j in range(3, 7):
+        for k in range(7, 9):
+            expected.add_synapse(expected.neurons[j], expected.neurons[k], 1)
+
+    assert network.get_synapses() == expected.get_synapses()
+    assert network.layers == expected.layers
+    assert (network.activate([[1, -1, .5]])
+            == expected.activate([[1, -1, .5]]))
+
+    # Una sinapsi ripetuta non deve modificare la rete
+    with pytest.raises(AlreadyConn):
+        network.add_synapses([(0, 8, 1.), (3, 7, 1.)])
+    assert not network.neurons[0].is_projecting_to(network.neurons[8])
+
+    # Chiavi già presenti o ripetute e numero mancante
+    fingerprint = network.fingerprint
+    with pytest.raises(AlreadyNeuron):
+        network.add_neurons(keys=[9, 0], biases=0)
+    with pytest.raises(AlreadyNeuron):
+        network.add_neurons(keys=[9, 9], biases=0)
+    with pytest.raises(AlreadyNeuron):
+        network.add_neuron(key=3, bias=0)
+    with pytest.raises(ValueError):
+        network.add_neurons()
+    assert 9 not in network.neurons
+    assert network.fingerprint == fingerprint
+    assert network.neurons[0].type is NeuronType.INPUT
+
+
+def test_incremental_activation():
+    """La modalità incrementale deve restituire gli stessi output
+    ricalcolando solo i neuroni a valle degli input cambiati"""
+    network = mixed_network()
+    rows = [[1, -1, .5], [1, -1, .5], [1, .2, .5], [0, .2, .5],
+            [0, .3, -.5]]
+    expected = network.activate(rows)
+
+    network.clear()
+    with network.profile() as stats:
+        assert network.activate(rows[:2], incremental=True) == expected[:2]
+        for row, output in zip(rows[2:], expected[2:]):
+            assert network.activate([row], incremental=True) == [output]
+
+    # Riga intera, riga invariata, input 1 (5, 6, 7, 3, 4), input 0
+    # (5, 8, 7, 3, 4) e input 1 e 2 (5, 6, 7, 3, 4)
+    assert stats.neuron_evals == 6 + 0 + 5 + 5 + 5
+
+    # Dopo una modifica la prima riga viene ricalcolata per intero
+    network.neurons[8].bias = 1.
+    assert (network.activate([rows[-1]], incremental=True)
+            == network.activate([rows[-1]]))
+
+
+def test_clone_next_key():
+    """Le chiavi dei neuroni aggiunti a una copia non sovrascrivono quelle
+    esistenti"""
+    network = mixed_network()
+    for shared in (False, True):
+        clone = network.clone(shared=shared)
+        neuron = clone.add_neuron(neuron_type=NeuronType.HIDDEN, bias=0.,
+                                  squash=identity, aggregation=sum)
+
+        assert neuron.key == max(network.neurons) + 1
+        assert len(clone.neurons) == len(network.neurons) + 1
+        assert clone.neurons[0].type is NeuronType.INPUT
+
+
+if __name__ == "__main__":
+    test_activate_rows_are_independent()
+    test_compiled_plan_matches_network()
+    test_state_view()
+    test_compiled_plan_prunes_dead_neurons()
+    test_compiled_plan_is_thread_safe()
+    test_bulk_construction()
+    test_incremental_activation()
+    test_clone_next_key()
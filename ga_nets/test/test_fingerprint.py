@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa l'impronta incrementale delle reti"""
+from math import tanh
+
+import pytest
+
+from ga_nets.fingerprint import FN_CODES, from_network, get_fn_code
+from ga_nets.genome import Genome
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.neuron import NeuronType
+from ga_nets.test.test_feedforward import mixed_network
+from ga_nets.test.test_genome import create_network
+
+
+def check(network):
+    """L'impronta incrementale deve coincidere con quella ricalcolata da
+    zero e con quella del genoma"""
+    assert network.fingerprint == from_network(network).value
+    assert network.fingerprint == Genome.from_network(network).fingerprint
+
+
+def test_incremental():
+    """Ogni modifica deve aggiornare l'impronta"""
+    for network in (mixed_network(), create_network()):
+        check(network)
+        original = network.fingerprint
+
+        hiddens = network.get_neuron_list(NeuronType.HIDDEN)
+        synapse = network.synapses[0]
+        synapse.weight = 3.
+        hiddens[0].bias = -1.
+        hiddens[0].squash = "sigmoid"
+        check(network)
+
+        neuron = network.add_neuron(bias=.5, squash="relu",
+                                     aggregation="max")
+        network.add_synapse(neuron, hiddens[0], .1)
+        if hasattr(network, "gates"):
+            network.add_gate(neuron, hiddens[0], .2)
+        check(network)
+
+        network.sub_synapse(synapse)
+        synapse.weight = 0.
+        network.sub_neuron(neuron)
+        check(network)
+        assert network.fingerprint != original
+
+
+def test_topology_and_clones():
+    """Cloni identici hanno la stessa impronta, i pesi cambiano solo quella
+    completa"""
+    network = create_network()
+    for clone in (network.clone(), network.clone(True)):
+        assert clone.fingerprint == network.fingerprint
+
+        clone.synapses[0].weight += 1
+        check(clone)
+        assert clone.fingerprint[0] == network.fingerprint[0]
+        assert clone.fingerprint[1] != network.fingerprint[1]
+
+    genome = Genome.from_network(network)
+    genome.synapses.enabled[0] = False
+    assert genome.fingerprint == genome.to_network().fingerprint
+    assert genome.fingerprint[0] != network.fingerprint[0]
+
+
+def test_stable_value():
+    """L'impronta non deve dipendere dal processo o dall'interprete"""
+    network = FeedForward({})
+    neuron1 = network.add_neuron(key=0, neuron_type=NeuronType.INPUT,
+                                 bias=0., squash="identity",
+                                 aggregation="sum")
+    neuron2 = network.add_neuron(key=1, neuron_type=NeuronType.OUTPUT,
+                                 bias=.5, squash="tanh", aggregation="sum")
+    network.add_synapse(neuron1, neuron2, -1.25)
+
+    assert network.fingerprint == (179018934417697705, 1913446739403017652)
+    check(network)
+
+
+def test_unnamed_functions():
+    """Le funzioni senza un nome valido in altri processi (lambda e
+    funzioni locali) non possono entrare nell'impronta"""
+    with pytest.raises(ValueError):
+        get_fn_code(lambda value: value)
+
+    network = FeedForward({})
+    with pytest.raises(ValueError):
+        network.add_neuron(key=0, neuron_type=NeuronType.INPUT, bias=0.,
+                           squash=lambda value: value, aggregation="sum")
+
+    assert get_fn_code(tanh) == get_fn_code("tanh")
+    assert all(isinstance(name, str) for name in FN_CODES)
+
+
+if __name__ == "__main__":
+    test_incremental()
+    test_topology_and_clones()
+    test_stable_value()
+    test_unnamed_functions()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa il registro delle funzioni"""
+import math
+
+import numpy as np
+
+from ga_nets.functions import REGISTRY, FunctionType
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.neuron import NeuronType
+from ga_nets import storage
+
+VALUES = np.array([[-70, -1.5, 0, .3, 2, 80], [4, -3, .1, 0, -.2, 1]])
+
+
+def test_vector_matches_scalar():
+    """Le implementazioni vettoriali devono coincidere con quelle scalari"""
+    for function in REGISTRY:
+        if function.type is FunctionType.SQUASH:
+            expected = [[function.scalar(v) for v in row]
+                        for row in VALUES.tolist()]
+        else:
+            expected = [function.scalar(row) for row in VALUES.tolist()]
+
+        assert np.allclose(function.vector(VALUES), expected), function.name
+
+
+def test_names():
+    """I neuroni devono accettare i nomi delle funzioni registrate"""
+    network = FeedForward({"squash_fn": "sigmoid",
+                           "aggregation_fn": "mean",
+                           "bias_fn": lambda network: 0})
+    network.add_neuron(key=0, neuron_type=NeuronType.INPUT)
+    neuron = network.add_neuron(key=1, neuron_type=NeuronType.OUTPUT,
+                                squash="tanh")
+
+    assert neuron.squash is math.tanh
+    assert "s: tanh, a: mean" in str(neuron)
+
+    genome = storage.loads(storage.dumps(network))
+    assert genome.neurons[1].squash is math.tanh
+
+
+if __name__ == "__main__":
+    test_vector_matches_scalar()
+    test_names()
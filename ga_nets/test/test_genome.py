@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa la rappresentazione compatta del genoma"""
+from math import tanh
+
+from ga_nets.genome import Genome
+from ga_nets.nets.rnn import Recurrent
+from ga_nets.neuron import NeuronType
+
+SEQUENCE = [[1, 0], [0, 1], [.5, -.5]]
+
+
+def create_network():
+    """Crea una rete ricorrente con funzioni miste.
+
+    Returns:
+      L'istanza della rete neurale.
+    """
+    network = Recurrent({})
+    neurons = [network.add_neuron(key=key,
+                                  neuron_type=nt,
+                                  bias=key / 10,
+                                  squash=tanh,
+                                  aggregation=max if key == 3 else sum)
+               for key, nt in enumerate((NeuronType.INPUT,
+                                         NeuronType.INPUT,
+                                         NeuronType.OUTPUT,
+                                         NeuronType.HIDDEN,
+                                         NeuronType.HIDDEN))]
+
+    for from_key, to_key, weight in ((0, 3, .5), (1, 3, -.2), (1, 4, .7),
+                                     (3, 4, .1), (4, 2, 1.1), (3, 2, -.4)):
+        network.add_synapse(neurons[from_key], neurons[to_key], weight)
+    network.add_gate(neurons[4], neurons[3], .6)
+    network.add_gate(neurons[3], neurons[3], -.3)
+
+    return network
+
+
+def test_roundtrip():
+    """La rete ricostruita dal genoma deve essere identica all'originale"""
+    network = create_network()
+    genome = Genome.from_network(network)
+    rebuilt = genome.copy().to_network()
+
+    assert rebuilt.get_synapses() == network.get_synapses()
+    assert ([str(g) for g in rebuilt.gates]
+            == [str(g) for g in network.gates])
+    assert rebuilt.activate(SEQUENCE) == network.activate(SEQUENCE)
+
+
+def test_views_write_arrays():
+    """Le viste devono leggere e scrivere direttamente negli array"""
+    genome = Genome.from_network(create_network())
+
+    neuron = genome.neurons[3]
+    assert neuron.type is NeuronType.HIDDEN and neuron.aggregation is max
+
+    neuron.bias = 2.5
+    neuron.aggregation = sum
+    list(genome.synapses)[0].weight = -1
+
+    assert genome.biases[3] == 2.5
+    assert genome.functions[genome.aggregation[3]] is sum
+    assert genome.get_synapses()[0] == (0, 3, -1)
+
+
+def test_clone():
+    """La copia deve essere identica ma indipendente dall'originale"""
+    network = create_network()
+    clone = network.clone()
+
+    assert clone.get_synapses() == network.get_synapses()
+    assert clone.activate(SEQUENCE) == network.activate(SEQUENCE)
+
+    clone.synapses[0].weight = 5
+    clone.sub_gate(clone.gates[0])
+    assert network.synapses[0].weight == .5
+    assert len(network.gates) == 2
+
+
+def test_shared_clone():
+    """Le copie condivise devono utilizzare il genoma del genitore finché
+    non vengono modificate"""
+    network = create_network()
+    expected = network.activate(SEQUENCE)
+
+    first, second = network.clone(True), network.clone(True)
+    assert first.snapshot() is second.snapshot() is network.snapshot()
+
+    # Il genitore modificato non deve influenzare le copie
+    network.synapses[0].weight = 3
+    assert network.snapshot() is not first.snapshot()
+
+    second.neurons[3].bias = -1
+    assert first.activate(SEQUENCE) == expected
+    assert second.activate(SEQUENCE) != expected
+    assert second.snapshot().biases[3] == -1
+
+
+if __name__ == "__main__":
+    test_roundtrip()
+    test_views_write_arrays()
+    test_clone()
+    test_shared_clone()
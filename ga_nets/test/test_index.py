@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa l'assegnazione degli indici fra più processi"""
+from multiprocessing import get_context, Pool
+
+from ga_nets.index import Indexer, SharedCounters
+
+
+def take_ids(count):
+    """Genera degli indici di rete nel worker"""
+    return [Indexer.get_id("network") for _ in range(count)]
+
+
+def take_markings(pairs):
+    """Genera gli historical markings delle coppie nel worker"""
+    return [Indexer.get_innovation(*pair) for pair in pairs]
+
+
+def test_shared_ids():
+    """Gli indici generati da processi diversi non devono ripetersi"""
+    counters = SharedCounters(start=1000)
+    try:
+        with Pool(3, Indexer.share, (counters, 16)) as pool:
+            ids = [i for chunk in pool.map(take_ids, [40] * 6)
+                   for i in chunk]
+
+        assert len(set(ids)) == len(ids) == 240
+        assert min(ids) >= 1000
+
+        Indexer.share(counters, 16)
+        assert Indexer.get_id("network") not in ids
+        assert (Indexer.get_innovation(1, 2)
+                == Indexer.get_innovation(1, 2)
+                != Indexer.get_innovation(2, 1)
+                != Indexer.get_innovation(1, 2, "gate"))
+    finally:
+        Indexer.share(None)
+
+
+def test_shared_markings():
+    """La stessa connessione deve ricevere lo stesso marking in tutti i
+    processi, anche se creata in ordini diversi"""
+    pairs = [(i, j) for i in range(4) for j in range(4, 8)]
+    counters = SharedCounters()
+    try:
+        with Pool(3, Indexer.share, (counters, 16)) as pool:
+            markings = pool.map(take_markings,
+                                [pairs, pairs[::-1], pairs[5:] + pairs[:5]])
+
+        by_pair = [dict(zip(chunk, values))
+                   for chunk, values in zip([pairs, pairs[::-1],
+                                             pairs[5:] + pairs[:5]],
+                                            markings)]
+        assert by_pair[0] == by_pair[1] == by_pair[2]
+        assert len(set(by_pair[0].values())) == len(pairs)
+
+        Indexer.share(counters, 16)
+        assert Indexer.get_innovation(0, 4) == by_pair[0][(0, 4)]
+        # I nuovi indici non scendono sotto il minimo richiesto
+        assert Indexer.get_marking(("split", 0), "neuron", floor=50) == 50
+        assert Indexer.get_marking(("split", 1), "neuron", floor=10) == 51
+
+        Indexer.reset_innovations()
+        assert Indexer.get_innovation(0, 4) != by_pair[0][(0, 4)]
+    finally:
+        Indexer.share(None)
+        Indexer.reset_innovations()
+
+
+def test_spawn_markings():
+    """I contatori devono poter essere inviati ai worker avviati con
+    'spawn' e i loro markings dimenticati dopo 'reset_innovations()'"""
+    pairs = [(i, j) for i in range(3) for j in range(3, 6)]
+    ctx = get_context("spawn")
+    counters = SharedCounters(ctx=ctx)
+    try:
+        with ctx.Pool(2, Indexer.share, (counters, 16)) as pool:
+            first = pool.map(take_markings, [pairs, pairs[::-1]])
+            assert first[0] == first[1][::-1]
+
+            Indexer.share(counters, 16)
+            assert Indexer.get_innovations(pairs) == first[0]
+
+            Indexer.reset_innovations()
+            second = pool.map(take_markings, [pairs[::-1], pairs])
+            assert second[1] == second[0][::-1]
+            assert not set(second[1]) & set(first[0])
+            assert Indexer.get_innovations(pairs) == second[1]
+    finally:
+        Indexer.share(None)
+        Indexer.reset_innovations()
+
+
+def test_batch_markings():
+    """I markings richiesti in blocco devono coincidere con quelli
+    richiesti singolarmente"""
+    pairs = [(0, 4), (1, 4), (0, 4), (2, 5)]
+    for counters in (None, SharedCounters(start=10)):
+        Indexer.share(counters)
+        Indexer.reset_innovations()
+        try:
+            batch = Indexer.get_innovations(pairs, "gate")
+            assert batch == [Indexer.get_innovation(*pair, kind="gate")
+                             for pair in pairs]
+            assert batch[0] == batch[2] and len(set(batch)) == 3
+            assert (Indexer.get_innovations(pairs)[0]
+                    not in Indexer.get_innovations(pairs, "gate"))
+            assert Indexer.get_markings([("split", 0)], "neuron",
+                                        floor=80) == [80]
+        finally:
+            Indexer.share(None)
+            Indexer.reset_innovations()
+
+
+def test_local_markings():
+    """Senza contatori condivisi i markings restano univoci nel processo"""
+    Indexer.reset_innovations()
+    first = Indexer.get_marking(("split", 0), "neuron", floor=100)
+    assert first >= 100
+    assert Indexer.get_marking(("split", 0), "neuron") == first
+    assert Indexer.get_marking(("split", 1), "neuron") == first + 1
+
+
+if __name__ == "__main__":
+    test_shared_ids()
+    test_shared_markings()
+    test_spawn_markings()
+    test_batch_markings()
+    test_local_markings()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa le mutazioni dei genomi"""
+import numpy as np
+
+from ga_nets.genome import ConnTable, Genome
+from ga_nets.index import Indexer
+from ga_nets.mutation import (add_connection, add_node, Mutator, perturb,
+                              Reachability)
+from ga_nets.test.test_feedforward import mixed_network
+
+
+def test_perturb_population():
+    """La perturbazione deve modificare tutti gli array insieme"""
+    arrays = [np.zeros(3), np.zeros(0), np.zeros(5)]
+    changed = perturb(arrays, 1., .1, rng=0)
+
+    assert changed == 8
+    assert all(array.all() for array in arrays if array.size)
+
+    genomes = [Genome.from_network(mixed_network()) for _ in range(4)]
+    counts = Mutator(seed=1, node_rate=1., conn_rate=1.).mutate(genomes)
+    assert counts["node"] == 4
+    for genome in genomes:
+        network = genome.to_network()
+        assert len(network.activate([[1, 2, 3]])[0]) == 2
+
+
+def test_structural_feedforward():
+    """Le sinapsi aggiunte ai feedforward non devono creare cicli"""
+    genome = Genome.from_network(mixed_network())
+    reachability = Reachability(genome)
+    assert reachability.creates_cycle(7, 5)
+    assert not reachability.creates_cycle(5, 8)
+
+    rng = np.random.default_rng(3)
+    for _ in range(30):
+        add_connection(genome, rng, reachability=reachability)
+        add_node(genome, rng, reachability=reachability)
+
+    network = genome.to_network()
+    assert None not in network.depths.values()
+    assert network.compile().activate([[1, -1, .5]]).shape == (1, 2)
+
+
+def test_toggle_back_feedforward():
+    """Le sinapsi disattivate contano nell'indice, così la loro
+    riattivazione non può chiudere un ciclo"""
+    genome = Genome.from_network(mixed_network())
+    table = genome.synapses
+    # Disattiva la sinapsi 5 -> 7
+    index = int(np.flatnonzero((table.from_keys == 5)
+                               & (table.to_keys == 7))[0])
+    table.enabled[index] = False
+
+    reachability = Reachability(genome)
+    assert reachability.creates_cycle(7, 5)
+
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        add_connection(genome, rng, reachability=reachability)
+        add_node(genome, rng, reachability=reachability)
+
+    # Riattiva tutte le sinapsi, come potrebbe fare 'toggle()'
+    table.enabled[:] = True
+    network = genome.to_network()
+    assert None not in network.depths.values()
+    assert network.compile().activate([[1, -1, .5]]).shape == (1, 2)
+
+
+def test_touch_only_mutated():
+    """Solo i genomi effettivamente modificati cambiano revisione"""
+    genomes = [Genome.from_network(mixed_network()) for _ in range(3)]
+    genomes.append(Genome(genomes[0].network_class, [], ((), (), (), (), ()),
+                          ConnTable()))
+
+    mutator = Mutator(seed=0, weight_rate=0., weight_replace=0.,
+                      bias_rate=0., bias_replace=0., toggle_rate=0.,
+                      conn_rate=0., node_rate=0.)
+    mutator.mutate(genomes)
+    assert [g.revision for g in genomes] == [0, 0, 0, 0]
+    # Ogni chiamata è una nuova generazione: i markings vengono dimenticati
+    assert not Indexer.innovations
+
+    mutator.bias_rate = 1.
+    counts = mutator.mutate(genomes)
+    assert counts["bias"] == 3 * len(genomes[0])
+    assert [g.revision for g in genomes] == [1, 1, 1, 0]
+
+
+if __name__ == "__main__":
+    test_perturb_population()
+    test_structural_feedforward()
+    test_toggle_back_feedforward()
+    test_touch_only_mutated()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa il profiling delle attivazioni"""
+from ga_nets.profiler import PHASES, Stats
+from ga_nets.test.test_feedforward import mixed_network
+from ga_nets.test.test_genome import SEQUENCE, create_network
+
+
+def test_profile_ffw():
+    """Il profiling deve contare fasi e valutazioni solo quando è attivo"""
+    network = mixed_network()
+    network.activate([[1, -1, .5]])
+    assert network.stats is None
+
+    with network.profile() as stats:
+        network.activate([[1, -1, .5], [0, 2, -1]])
+
+    assert network.stats is None
+    assert stats.activations == 1 and stats.rows == 2
+    assert stats.neuron_evals == 2 * 6
+    assert stats.synapse_evals == 2 * 12
+    assert stats.calls["neurons"] == 2
+    assert stats.layer_widths == {3: 2, 1: 1, 2: 1}
+
+
+def test_profile_population():
+    """Le statistiche di più reti devono poter essere sommate"""
+    networks = [create_network() for _ in range(3)]
+    for network in networks:
+        network.profiling = True
+        network.activate(SEQUENCE)
+
+    total = Stats.merge(network.stats for network in networks)
+    assert total.activations == 3
+    assert total.rows == 3 * len(SEQUENCE)
+    # Due gates valutati a ogni passo tranne il primo
+    assert total.gate_evals == 3 * 2 * (len(SEQUENCE) - 1)
+    assert set(total.to_dict()["times"]) == set(PHASES)
+
+
+if __name__ == "__main__":
+    test_profile_ffw()
+    test_profile_population()
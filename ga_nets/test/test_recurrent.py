@@ -9,6 +9,7 @@
 #
 #    This isn't a free software, if you steal it... then, good for you.
 """Testa le Recurrent Neural Network"""
+from ga_nets.connection import AlreadyConn, is_connected
 from ga_nets.neuron import NeuronType
 from ga_nets.nets.rnn import Recurrent
 from ml_stats.activation import identity
@@ -115,6 +116,138 @@ def test_no_conn_rnn():
     check_result(result[1][0], 0, 0)
 
 
+def check_compiled(aggregations):
+    """Verifica che il piano compilato restituisca, per ogni sequenza del
+    batch, gli stessi output della rete.
+
+    Args:
+      aggregations: Dizionario indice -> funzione d'aggregazione per i
+                    neuroni che non utilizzano 'sum'.
+    """
+    network = Recurrent({})
+    neurons = create_topology(network, (NeuronType.INPUT,
+                                        NeuronType.INPUT,
+                                        NeuronType.OUTPUT,
+                                        NeuronType.HIDDEN,
+                                        NeuronType.HIDDEN,
+                                        NeuronType.HIDDEN))
+    for i, aggregation in aggregations.items():
+        neurons[i].aggregation = aggregation
+
+    connect_synapses(
+        network,
+        neurons,
+        [(0, 3, .1), (0, 4, .2), (1, 3, .3), (1, 4, .4), (1, 5, -.3),
+         (3, 5, .7), (3, 2, .5), (4, 2, .6), (5, 2, -.2), (2, 4, .9)])
+
+    connect_gates(network, neurons, [(3, 4, .1), (4, 3, .2), (5, 2, .3),
+                                     (3, 3, .3), (4, 4, .4), (2, 5, -.5)])
+
+    sequences = [[[1, 1], [1, 1], [0, 1]],
+                 [[.5, -1], [2, 0], [-1, -1]],
+                 [[0, 0], [1, 0], [0, .3]]]
+    result = network.compile().activate(sequences)
+
+    for sequence, outputs in zip(sequences, result):
+        expected = network.activate(sequence)
+        for step, output in enumerate(outputs):
+            check_result(output[0], expected[step][0], 1e-9)
+
+
+def test_compiled_batch_rnn():
+    """Il piano compilato deve restituire, per ogni sequenza del batch, gli
+    stessi output della rete"""
+    check_compiled({5: max})
+
+
+def test_compiled_fused_rnn():
+    """I kernel raggruppati per aggregazione devono restituire gli stessi
+    output dell'attivazione neurone per neurone"""
+    check_compiled({2: "mean", 3: "product", 4: "mean", 5: "min"})
+    check_compiled({2: "maxabs", 3: "max", 4: "min", 5: "product"})
+
+
+def test_compiled_prune_rnn():
+    """I neuroni letti solo tramite gates non devono essere rimossi"""
+    network = Recurrent({})
+    neurons = create_topology(network, (NeuronType.INPUT,
+                                        NeuronType.OUTPUT,
+                                        NeuronType.HIDDEN,
+                                        NeuronType.HIDDEN))
+    connect_synapses(network, neurons, [(0, 1, .5), (0, 2, .3), (0, 3, .2)])
+    connect_gates(network, neurons, [(1, 2, .7)])
+
+    plan = network.compile()
+    assert plan.report.dead == [3]
+
+    sequence = [[1], [.5], [-1]]
+    for output, expected in zip(plan.activate(sequence),
+                                network.activate(sequence)):
+        check_result(output[0], expected[0], 1e-9)
+
+
+def test_sub_neuron_rnn():
+    """La rimozione di un neurone deve eliminare sinapsi e gates anche dai
+    neuroni ai quali era connesso"""
+    network = Recurrent({})
+    neurons = create_topology(network, (NeuronType.INPUT,
+                                        NeuronType.OUTPUT,
+                                        NeuronType.HIDDEN,
+                                        NeuronType.HIDDEN))
+
+    connect_synapses(network, neurons, [(0, 2, .1), (2, 3, .2), (3, 1, .3)])
+    connect_gates(network, neurons, [(2, 3, .1), (3, 2, .2), (2, 2, .3)])
+
+    try:
+        network.add_gate(neurons[2], neurons[3], .5)
+        assert False, "The gate is duplicated."
+    except AlreadyConn:
+        pass
+
+    network.sub_neuron(neurons[2])
+
+    assert len(network.synapses) == 1
+    assert len(network.gates) == 0
+    assert not is_connected(network.synapses, neurons[0], neurons[2])
+    assert not neurons[0].is_projecting_to(neurons[2])
+    assert not list(neurons[3].gates[0]) and not list(neurons[3].gates[1])
+    assert network.layers == [[0], [1]]
+
+
+def test_session_rnn():
+    """La sessione deve restituire, passo dopo passo, gli stessi output di
+    'activate()' e ripartire da zero dopo il 'reset()'"""
+    network = Recurrent({})
+    neurons = create_topology(network, (NeuronType.INPUT,
+                                        NeuronType.INPUT,
+                                        NeuronType.OUTPUT,
+                                        NeuronType.HIDDEN,
+                                        NeuronType.HIDDEN))
+
+    connect_synapses(
+        network,
+        neurons,
+        [(0, 3, .1), (0, 4, .2), (1, 3, .3), (1, 4, .4),
+         (3, 2, .5), (4, 2, .6)])
+
+    connect_gates(network, neurons, [(3, 4, .1), (4, 3, .2),
+                                     (3, 3, .3), (4, 4, .4)])
+
+    sequence = [[1, 1], [1, 1], [0, -1], [.5, 2]]
+    expected = network.activate(sequence)
+
+    session = network.session()
+    for _ in range(2):
+        for features, output in zip(sequence, expected):
+            check_result(session.step(features)[0], output[0], 1e-9)
+        session.reset()
+
+
 if __name__ == "__main__":
     test_fully_connected_rnn()
     test_no_conn_rnn()
+    test_compiled_batch_rnn()
+    test_compiled_fused_rnn()
+    test_compiled_prune_rnn()
+    test_sub_neuron_rnn()
+    test_session_rnn()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa la distanza di compatibilità e la speciazione"""
+from ga_nets.genome import Genome
+from ga_nets.mutation import add_node
+from ga_nets.speciation import Distance, Genes, GenesBatch, Speciation
+from ga_nets.test.test_feedforward import mixed_network
+from ga_nets.test.test_genome import create_network
+
+
+def test_distance():
+    """La distanza deve contare excess, disjoint e differenza dei pesi"""
+    genome = Genome.from_network(mixed_network())
+    other = genome.copy()
+    distance = Distance(excess=1., disjoint=2., weight=1.)
+    assert distance(Genes(genome), Genes(other)) == 0
+
+    # La sinapsi divisa resta (disattivata): 2 excess verso il neurone
+    # nuovo, più la differenza di un peso
+    add_node(other, 0)
+    other.synapses.weights[0] += .5
+    size = len(other.synapses)
+    expected = 2 / size + .5 / (size - 2)
+    assert abs(distance(Genes(genome), Genes(other)) - expected) < 1e-9
+    assert abs(distance(Genes(other), Genes(genome)) - expected) < 1e-9
+
+    # Una sinapsi con un marking assente nell'altro genoma (e più vecchio
+    # del suo ultimo) è disjoint
+    other.synapses.innovations[1] = -1
+    expected += 2 * 2 / size - .5 / (size - 2) + .5 / (size - 3)
+    assert abs(distance(Genes(genome), Genes(other)) - expected) < 1e-9
+
+    batch = GenesBatch([Genes(other), Genes(genome)])
+    assert list(distance.batch(Genes(genome), batch)) == [
+        distance(Genes(genome), Genes(other)), 0]
+
+
+def test_speciate():
+    """Le reti simili devono finire nella stessa specie e la cache deve
+    seguire le modifiche"""
+    ffw = Genome.from_network(mixed_network())
+    rnn = create_network()
+    population = [ffw.copy() for _ in range(3)] + [rnn, rnn.clone()]
+
+    speciation = Speciation(threshold=1.)
+    species = speciation.speciate(population)
+    assert sorted(len(s.members) for s in species.values()) == [2, 3]
+    assert speciation.speciate(population).keys() == species.keys()
+
+    genes = speciation.get_genes(population[0])
+    assert speciation.get_genes(population[0]) is genes
+    add_node(population[0], 0)
+    assert speciation.get_genes(population[0]) is not genes
+
+
+def test_speciate_after_view_edit():
+    """Le modifiche tramite le viste del genoma devono invalidare la cache
+    della speciazione"""
+    population = [Genome.from_network(mixed_network()) for _ in range(2)]
+    speciation = Speciation(threshold=1.)
+    assert len(speciation.speciate(population)) == 1
+
+    # Pesi molto diversi: la distanza supera la soglia
+    for conn in population[1].synapses:
+        conn.weight += 10
+    assert len(speciation.speciate(population)) == 2
+
+    genes = speciation.get_genes(population[1])
+    population[1].neurons[3].bias = 1.
+    assert speciation.get_genes(population[1]) is not genes
+    genes = speciation.get_genes(population[1])
+    list(population[1].synapses)[0].enabled = False
+    assert speciation.get_genes(population[1]) is not genes
+
+
+if __name__ == "__main__":
+    test_distance()
+    test_speciate()
+    test_speciate_after_view_edit()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa il salvataggio delle reti neurali e delle popolazioni"""
+from ga_nets import storage
+from ga_nets.index import Indexer
+from ga_nets.test.test_genome import SEQUENCE, create_network
+
+
+def test_roundtrip():
+    """La rete letta dal record deve essere identica all'originale"""
+    network = create_network()
+    data = storage.dumps(network)
+    # I markings devono essere letti dal record, non riassegnati
+    Indexer.reset_innovations()
+    rebuilt = storage.loads(data).to_network()
+
+    assert rebuilt.get_synapses() == network.get_synapses()
+    assert ([str(g) for g in rebuilt.gates]
+            == [str(g) for g in network.gates])
+    assert ([c.innovation for c in rebuilt.synapses]
+            == [c.innovation for c in network.synapses])
+    assert ([c.innovation for c in rebuilt.gates]
+            == [c.innovation for c in network.gates])
+    assert rebuilt.activate(SEQUENCE) == network.activate(SEQUENCE)
+
+
+def test_population(tmp_path):
+    """Ogni genoma della popolazione deve poter essere letto singolarmente"""
+    networks = [create_network() for _ in range(3)]
+    for i, network in enumerate(networks):
+        network.synapses[0].weight = i
+
+    path = str(tmp_path / "population.bin")
+    storage.save_population(networks, path)
+
+    with storage.PopulationFile(path) as population:
+        assert len(population) == 3
+        assert population[-1].get_synapses() == networks[2].get_synapses()
+        assert [g.synapses.weights[0] for g in population] == [0, 1, 2]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Testa la costruzione dei layers"""
+import random
+
+from ga_nets.bench.layers import legacy_layers, random_conns
+from ga_nets.nets.ffw import FeedForward
+from ga_nets.neuron import NeuronType
+import ga_nets.topology as Topology
+
+
+def test_same_layers_as_legacy():
+    """I layers devono essere identici a quelli di 'ga_nets.layer', anche
+    con neuroni vuoti o che non alimentano nessun output"""
+    for seed in range(30):
+        for num_conns in (5, 20, 60):
+            topology = random_conns(3, 12, 2, num_conns, seed)
+            assert Topology.get_layers(*topology) == legacy_layers(*topology)
+
+
+def test_cycle_is_ignored():
+    """Gli hidden in un ciclo di sinapsi, e i loro successori, non devono
+    essere inseriti nei layers"""
+    conns = [(0, 2, 1), (0, 3, 1), (3, 4, 1), (4, 3, 1), (4, 5, 1),
+             (2, 1, 1), (5, 1, 1)]
+    layers = Topology.get_layers([0], [2, 3, 4, 5], [1], conns)
+
+    assert layers == [[0], [2], [1]]
+    assert Topology.get_depths([0], [2, 3, 4, 5], conns) == {
+        0: 0, 2: 1, 3: None, 4: None, 5: None}
+
+
+def test_incremental_layers():
+    """Le profondità mantenute dal network a ogni modifica devono essere
+    uguali a quelle ricalcolate da zero"""
+    rnd = random.Random(0)
+    traits = {"bias_fn": lambda _: 0,
+              "squash_fn": abs,
+              "aggregation_fn": sum,
+              "weight_fn": lambda _: 1}
+
+    network = FeedForward(traits)
+    for neuron_type in (NeuronType.INPUT, NeuronType.INPUT,
+                        NeuronType.OUTPUT):
+        network.add_neuron(neuron_type=neuron_type)
+
+    for _ in range(300):
+        neurons = list(network.neurons.values())
+        action = rnd.random()
+        if action < .2:
+            network.add_neuron()
+        elif action < .7:
+            from_neuron, to_neuron = rnd.choice(neurons), rnd.choice(neurons)
+            if not from_neuron.is_projecting_to(to_neuron):
+                network.add_synapse(from_neuron, to_neuron)
+        elif action < .9 and network.synapses:
+            network.sub_synapse(rnd.choice(network.synapses))
+        elif network.num_hiddens:
+            network.sub_neuron(
+                rnd.choice(network.get_neuron_list(NeuronType.HIDDEN)))
+
+        depths = dict(network.depths)
+        network.reset_depths()
+        assert depths == network.depths
+        assert ([sorted(layer) for layer in network.layers]
+                == [sorted(layer) for layer in network.get_layers()])
+
+
+if __name__ == "__main__":
+    test_same_layers_as_legacy()
+    test_cycle_is_ignored()
+    test_incremental_layers()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+#
+# @Author(s):
+#    - Tomas Bartoli <tomasbartoli1992@gmail.com>
+# @Date: 17/10/2026 (dd/mm/yyyy)
+# @since: 1.0.0
+#
+#    Copyright (C) 2020  Tomas Bartoli
+#
+#    This isn't a free software, if you steal it... then, good for you.
+"""Costruzione dei layer di neuroni in tempo lineare.
+
+Sostituisce 'ga_nets.layer' producendo gli stessi layers, ma utilizzando
+degli indici d'adiacenza al posto di scansionare la lista delle connessioni
+per ogni neurone: il costo è O(V+E).
+
+La profondità di un neurone hidden è 1 + la profondità massima dei neuroni
+che lo alimentano (gli input hanno profondità 0). I neuroni hidden che non
+sono alimentati, direttamente o tramite altri hidden, da nessun input sono
+'vuoti' e vengono ignorati; quelli che dipendono da un ciclo di sinapsi non
+hanno una profondità ('None') e bloccano a loro volta i successori. Le
+sinapsi provenienti dagli output non vengono mai considerate.
+"""
+
+
+def get_adjacency(conns):
+    """Indici d'adiacenza delle connessioni.
+
+    Args:
+      conns: Lista con le tuple contenente come primo indice il neurone
+             d'uscita, il secondo indice quello di entrata e il terzo il
+             peso, che però non ha nessuna utilità. Es: '[(0, 3, peso1),
+                                                          (1, 3, peso2),
+                                                          (3, 2, peso3)]'.
+
+    Returns:
+      Una tupla con due dizionari: il primo associa a ogni neurone la lista
+      dei neuroni che lo alimentano, il secondo quella dei neuroni alimentati,
+      entrambi nell'ordine delle connessioni.
+    """
+    sources = {}
+    targets = {}
+    for conn in conns:
+        sources.setdefault(conn[1], []).append(conn[0])
+        targets.setdefault(conn[0], []).append(conn[1])
+
+    return sources, targets
+
+
+def level(region, sources, fixed):
+    """Calcola la profondità dei neuroni hidden di una regione della rete.
+
+    La profondità dei neuroni fuori dalla regione è considerata fissa: in
+    questo modo è possibile ricalcolare solo la parte a valle di una
+    modifica.
+
+    Args:
+      region: Lista con le chiavi dei neuroni hidden da calcolare.
+      sources: Funzione che data una chiave restituisce la lista con le chiavi
+               dei neuroni che lo alimentano.
+      fixed: Dizionario con lo stato dei neuroni fuori dalla regione: la
+             profondità (0 per gli input) o None se bloccati. I neuroni vuoti
+             e gli output non devono essere presenti.
+
+    Returns:
+      Un dizionario con la profondità, o None, di ogni neurone della regione
+      che non è vuoto.
+    """
+    inside = set(region)
+    children = {key: [] for key in region}
+
+    # Un neurone resta nella rete finché è alimentato da almeno un input o
+    # da un hidden non vuoto.
+    support = {}
+    for key in region:
+        count = 0
+        for src in sources(key):
+            if src in inside:
+                children[src].append(key)
+                count += 1
+            elif src in fixed:
+                count += 1
+        support[key] = count
+
+    void = set()
+    queue = [key for key in region if not support[key]]
+    while queue:
+        key = queue.pop()
+        void.add(key)
+        for child in children[key]:
+            support[child] -= 1
+            if not support[child]:
+                queue.append(child)
+
+    # Livellamento alla Kahn dei neuroni rimasti
+    pending = {}
+    base = {}
+    for key in region:
+        if key in void:
+            continue
+
+        count = 0
+        depth = 0
+        for src in sources(key):
+            if src in inside:
+                count += src not in void
+            elif src in fixed:
+                if fixed[src] is None:
+                    depth = None
+                    break
+                depth = max(depth, fixed[src])
+
+        if depth is not None:
+            pending[key] = count
+            base[key] = depth
+
+    depths = {key: None for key in region if key not in void}
+    queue = [key for key, count in pending.items() if not count]
+    while queue:
+        key = queue.pop()
+        depths[key] = base[key] + 1
+        for child in children[key]:
+            if child not in pending:
+                continue
+            base[child] = max(base[child], depths[key])
+            pending[child] -= 1
+            if not pending[child]:
+                queue.append(child)
+
+    return depths
+
+
+def get_depths(inputs, hiddens, conns):
+    """Profondità di tutti i neuroni della rete.
+
+    Args:
+      inputs: Lista con le chiavi dei neuroni di inputs.
+      hiddens: Lista con le chiavi dei neuroni di hiddens.
+      conns: Lista con le tuple delle connessioni (vedi 'get_adjacency()').
+
+    Returns:
+      Un dizionario con la profondità degli input e degli hidden non vuoti
+      (None se bloccati da un ciclo).
+    """
+    sources, _ = get_adjacency(conns)
+
+    depths = {key: 0 for key in inputs}
+    depths.update(level(hiddens, lambda key: sources.get(key, ()), depths))
+
+    return depths
+
+
+def get_layers(inputs, hiddens, outputs, conns):
+    """Restituisce i layers corretti con l'ordine d'attivazione dei neuroni.
+
+    Args:
+      inputs: Lista con le chiavi dei neuroni di inputs.
+      hiddens: Lista con le chiavi dei neuroni di hiddens.
+      outputs: Lista con le chiavi dei neuroni di outputs.
+      conns: Lista con le tuple delle connessioni (vedi 'get_adjacency()').
+
+    Returns:
+      Una lista tridimensionale, dove il primo indice contiene i neuroni di
+      input, l'ultimo quelli di output e quelli in mezzo sono gli hidden layer
+      ordinati, identica a quella di 'ga_nets.layer.get_layers()'.
+    """
+    _, targets = get_adjacency(conns)
+    depths = get_depths(inputs, hiddens, conns)
+
+    # L'ordine all'interno di un layer segue quello dei neuroni del layer
+    # precedente e, per ognuno, quello delle connessioni.
+    layers = [inputs[:]]
+    placed = set()
+    while True:
+        layer = []
+        for gene in layers[-1]:
+            for target in targets.get(gene, ()):
+                if depths.get(target) == len(layers) and target not in placed:
+                    placed.add(target)
+                    layer.append(target)
+
+        if not layer:
+            layers.append(outputs[:])
+            return layers
+
+        layers.append(layer)
@@ -20,4 +20,5 @@ setup(name="Genetic Algorithm Networks",
       author_email="tomas.bartoli@transcorp.org",
       license="MIT",
       packages=setuptools.find_packages(),
+      install_requires=["numpy"],
       zip_safe=False)